@@ -0,0 +1,335 @@
+import datetime
+import os
+import shutil
+import threading
+import time
+from collections.abc import Generator
+from pathlib import Path
+from typing import Self
+
+import numpy as np
+import psutil
+import pydicom
+import pytest
+import pyvista as pv
+from jaxtyping import Bool, Float, Int16, Integer
+
+# ----------------------------- Stage tracking ------------------------------ #
+
+
+class PeakRSS:
+    """Peak resident set size of this process, sampled in a daemon thread.
+
+    Unlike `tracemalloc`, the RSS includes VTK, Warp and JAX allocations.
+    """
+
+    interval: float
+    peak: int
+    _process: psutil.Process
+    _stopped: threading.Event
+    _thread: threading.Thread
+
+    def __init__(self, interval: float = 0.01) -> None:
+        self.interval = interval
+        self._process = psutil.Process()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self.peak = self.rss()
+
+    def __enter__(self) -> Self:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_args: object) -> None:
+        self._stopped.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.rss())
+
+    def rss(self) -> int:
+        return self._process.memory_info().rss
+
+    def _sample(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.peak = max(self.peak, self.rss())
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: pytest.Item) -> Generator[None]:
+    """Record wall time and peak memory of every benchmark.
+
+    Only the test call is measured, fixtures are excluded. Peak memory is the
+    growth of the process RSS over the call, so it also counts VTK and Warp
+    buffers but not memory that was already resident. Sampling is disabled
+    under CodSpeed so it does not distort the measurements.
+    """
+    sampling: bool = not (
+        item.config.getoption("codspeed", default=False) or "CODSPEED_ENV" in os.environ
+    )
+    sampler: PeakRSS | None = PeakRSS() if sampling else None
+    start_rss: int = 0 if sampler is None else sampler.peak
+    start: float = time.perf_counter()
+    try:
+        if sampler is None:
+            return (yield)
+        with sampler:
+            return (yield)
+    finally:
+        item.user_properties.append(("time", time.perf_counter() - start))
+        if sampler is not None:
+            item.user_properties.append(("peak_memory", sampler.peak - start_rss))
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter) -> None:
+    rows: list[tuple[str, float, float | None]] = []
+    for report in terminalreporter.stats.get("passed", []):
+        if report.when != "call" or not report.nodeid.startswith("benches/"):
+            continue
+        properties: dict[str, float] = dict(report.user_properties)
+        if "time" not in properties:
+            continue
+        rows.append((report.nodeid, properties["time"], properties.get("peak_memory")))
+    if not rows:
+        return
+    terminalreporter.section("stages")
+    width: int = max(len(nodeid) for nodeid, _, _ in rows)
+    for nodeid, elapsed, peak in sorted(rows):
+        memory: str = "" if peak is None else f"{peak / 2**20:10.1f} MiB"
+        terminalreporter.write_line(f"{nodeid:<{width}} {elapsed:9.3f} s {memory}")
+
+
+# --------------------------- Synthetic CT volume --------------------------- #
+
+SPACING: tuple[float, float, float] = (2.0, 2.0, 2.5)  # (x, y, z) millimeters
+ACQUISITION_DATETIME: datetime.datetime = datetime.datetime(
+    2020, 1, 1, 8, 30, tzinfo=datetime.UTC
+)
+
+
+def ellipsoid(
+    points: Float[np.ndarray, "*N 3"],
+    center: tuple[float, float, float],
+    radii: tuple[float, float, float],
+) -> Float[np.ndarray, "*N"]:
+    """Implicit ellipsoid: negative inside, zero on the surface."""
+    return np.sum(((points - center) / radii) ** 2, axis=-1) - 1.0
+
+
+SKIN: tuple[tuple[float, float, float], tuple[float, float, float]] = (
+    (0.0, 0.0, 0.0),
+    (80.0, 100.0, 120.0),
+)
+CRANIUM: tuple[tuple[float, float, float], tuple[float, float, float]] = (
+    (0.0, 0.0, 40.0),
+    (60.0, 75.0, 55.0),
+)
+MANDIBLE: tuple[tuple[float, float, float], tuple[float, float, float]] = (
+    (0.0, 30.0, -50.0),
+    (45.0, 50.0, 15.0),
+)
+
+
+def head_volume(
+    shape: tuple[int, int, int] = (112, 112, 96),
+) -> Int16[np.ndarray, "z y x"]:
+    """A head-like CT volume in Hounsfield units, indexed as `[z, y, x]`."""
+    nz, ny, nx = shape
+    z, y, x = np.meshgrid(
+        (np.arange(nz) - (nz - 1) / 2) * SPACING[2],
+        (np.arange(ny) - (ny - 1) / 2) * SPACING[1],
+        (np.arange(nx) - (nx - 1) / 2) * SPACING[0],
+        indexing="ij",
+    )
+    points: Float[np.ndarray, "z y x 3"] = np.stack([x, y, z], axis=-1)
+    volume: Int16[np.ndarray, "z y x"] = np.full(shape, -1000, np.int16)
+    volume[ellipsoid(points, *SKIN) < 0] = 40
+    for center, radii in (CRANIUM, MANDIBLE):
+        value: Float[np.ndarray, "z y x"] = ellipsoid(points, center, radii)
+        volume[(value < 0) & (value > -0.3)] = 1200
+    rng: np.random.Generator = np.random.default_rng(0)
+    volume += rng.integers(-20, 20, shape, dtype=np.int16)
+    return volume
+
+
+def ct_slice(
+    pixels: Int16[np.ndarray, "y x"],
+    index: int,
+    *,
+    series_uid: str,
+    patient_id: str,
+    acquisition_datetime: datetime.datetime,
+) -> pydicom.Dataset:
+    from pydicom.dataset import Dataset, FileMetaDataset
+    from pydicom.uid import CTImageStorage, ExplicitVRLittleEndian, generate_uid
+
+    meta = FileMetaDataset()
+    meta.MediaStorageSOPClassUID = CTImageStorage
+    meta.MediaStorageSOPInstanceUID = generate_uid()
+    meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    instance = Dataset()
+    instance.file_meta = meta
+    instance.SOPClassUID = CTImageStorage
+    instance.SOPInstanceUID = meta.MediaStorageSOPInstanceUID
+    instance.SeriesInstanceUID = series_uid
+    instance.PatientID = patient_id
+    instance.PatientName = f"{patient_id}^Synthetic"
+    instance.PatientSex = "O"
+    instance.PatientAge = "030Y"
+    instance.PatientBirthDate = "19900101"
+    instance.AcquisitionDateTime = acquisition_datetime.strftime("%Y%m%d%H%M%S")
+    instance.Rows, instance.Columns = pixels.shape
+    instance.PixelSpacing = [SPACING[1], SPACING[0]]
+    instance.SliceThickness = SPACING[2]
+    instance.ImagePositionPatient = [0.0, 0.0, index * SPACING[2]]
+    instance.ImageOrientationPatient = [1.0, 0.0, 0.0, 0.0, 1.0, 0.0]
+    instance.InstanceNumber = index + 1
+    instance.RescaleIntercept = -1024
+    instance.RescaleSlope = 1
+    instance.BitsAllocated = 16
+    instance.BitsStored = 16
+    instance.HighBit = 15
+    instance.PixelRepresentation = 0
+    instance.SamplesPerPixel = 1
+    instance.PhotometricInterpretation = "MONOCHROME2"
+    instance.PixelData = (pixels + 1024).astype(np.uint16).tobytes()
+    return instance
+
+
+def write_dicom_series(
+    folder: Path,
+    volume: Int16[np.ndarray, "z y x"],
+    *,
+    patient_id: str = "SYNTHETIC",
+    acquisition_datetime: datetime.datetime = ACQUISITION_DATETIME,
+) -> Path:
+    """Write a CT series with a `DIRFILE`, laid out like our raw exports."""
+    from pydicom.dataset import Dataset, FileMetaDataset
+    from pydicom.uid import ExplicitVRLittleEndian, generate_uid
+
+    folder.mkdir(parents=True, exist_ok=True)
+    series_uid: str = generate_uid()
+    records: list[pydicom.Dataset] = []
+    for i, pixels in enumerate(volume):
+        instance: pydicom.Dataset = ct_slice(
+            pixels,
+            i,
+            series_uid=series_uid,
+            patient_id=patient_id,
+            acquisition_datetime=acquisition_datetime,
+        )
+        filename: str = f"IM{i:05d}"
+        instance.save_as(folder / filename, enforce_file_format=True)
+        record = Dataset()
+        record.DirectoryRecordType = "IMAGE"
+        record.ReferencedFileID = ["DATA", filename]
+        record.ReferencedSOPInstanceUIDInFile = instance.SOPInstanceUID
+        records.append(record)
+    meta = FileMetaDataset()
+    meta.MediaStorageSOPClassUID = "1.2.840.10008.1.3.10"  # Media Storage Directory
+    meta.MediaStorageSOPInstanceUID = generate_uid()
+    meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    dirfile = Dataset()
+    dirfile.file_meta = meta
+    dirfile.DirectoryRecordSequence = records
+    dirfile.save_as(folder / "DIRFILE", enforce_file_format=True)
+    return folder
+
+
+@pytest.fixture(scope="session")
+def ct_volume() -> Int16[np.ndarray, "z y x"]:
+    return head_volume()
+
+
+@pytest.fixture(scope="session")
+def dicom_series(
+    tmp_path_factory: pytest.TempPathFactory, ct_volume: Int16[np.ndarray, "z y x"]
+) -> Path:
+    return write_dicom_series(tmp_path_factory.mktemp("dicom") / "series", ct_volume)
+
+
+@pytest.fixture(scope="session")
+def dicom_archive(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Exports of two series, one of them exported twice."""
+    root: Path = tmp_path_factory.mktemp("archive")
+    volume: Int16[np.ndarray, "z y x"] = head_volume((24, 112, 96))
+    write_dicom_series(root / "a", volume, patient_id="A")
+    shutil.copytree(root / "a", root / "b")
+    write_dicom_series(root / "c", volume, patient_id="C")
+    return root
+
+
+# -------------------------- Analytic head meshes --------------------------- #
+
+
+def ellipsoid_surface(
+    center: tuple[float, float, float],
+    radii: tuple[float, float, float],
+    resolution: int = 64,
+) -> pv.PolyData:
+    surface: pv.PolyData = pv.Sphere(
+        radius=1.0, theta_resolution=resolution, phi_resolution=resolution
+    )
+    surface.points = surface.points * radii + center
+    return surface
+
+
+@pytest.fixture(scope="session")
+def skin() -> pv.PolyData:
+    return ellipsoid_surface(*SKIN)
+
+
+@pytest.fixture(scope="session")
+def cranium() -> pv.PolyData:
+    return ellipsoid_surface(*CRANIUM)
+
+
+@pytest.fixture(scope="session")
+def mandible() -> pv.PolyData:
+    return ellipsoid_surface(*MANDIBLE)
+
+
+def head_tetmesh(spacing: float) -> pv.UnstructuredGrid:
+    """Soft tissue between the skin and the bones, tetrahedralized on a grid.
+
+    The boundary of the mesh is split into `IsSkin`, `IsCranium` and
+    `IsMandible` surfaces, which stand in for the registered surfaces.
+    """
+    radii: Float[np.ndarray, " 3"] = np.asarray(SKIN[1])
+    dimensions: Float[np.ndarray, " 3"] = np.ceil(2 * radii / spacing) + 1
+    grid = pv.ImageData(
+        dimensions=dimensions.astype(int).tolist(),
+        spacing=(spacing, spacing, spacing),
+        origin=(-(dimensions - 1) * spacing / 2).tolist(),
+    )
+    tetmesh: pv.UnstructuredGrid = grid.to_tetrahedra()  # pyright: ignore[reportAssignmentType]
+    centers: Float[np.ndarray, "C 3"] = tetmesh.cell_centers().points
+    inside: Bool[np.ndarray, " C"] = (
+        (ellipsoid(centers, *SKIN) < 0)
+        & (ellipsoid(centers, *CRANIUM) > 0)
+        & (ellipsoid(centers, *MANDIBLE) > 0)
+    )
+    tetmesh = tetmesh.extract_cells(inside)  # pyright: ignore[reportAssignmentType]
+    tetmesh.clear_data()
+    tetmesh.point_data["_PointId"] = np.arange(tetmesh.n_points)
+    surface: pv.PolyData = tetmesh.extract_surface()  # pyright: ignore[reportAssignmentType]
+    distance: dict[str, Float[np.ndarray, " S"]] = {
+        "IsSkin": np.abs(ellipsoid(surface.points, *SKIN)),
+        "IsCranium": np.abs(ellipsoid(surface.points, *CRANIUM)),
+        "IsMandible": np.abs(ellipsoid(surface.points, *MANDIBLE)),
+    }
+    nearest: Integer[np.ndarray, " S"] = np.argmin(list(distance.values()), axis=0)
+    point_id: Integer[np.ndarray, " S"] = surface.point_data["_PointId"]
+    for i, name in enumerate(distance):
+        mask: Bool[np.ndarray, " P"] = np.zeros((tetmesh.n_points,), bool)
+        mask[point_id[nearest == i]] = True
+        tetmesh.point_data[name] = mask
+    return tetmesh
+
+
+@pytest.fixture(scope="session")
+def tetmesh() -> pv.UnstructuredGrid:
+    return head_tetmesh(spacing=8.0)
+
+
+@pytest.fixture(scope="session")
+def tetmesh_coarse() -> pv.UnstructuredGrid:
+    return head_tetmesh(spacing=16.0)
@@ -0,0 +1,24 @@
+from pathlib import Path
+
+import pytest
+
+from liblaf.plastic_surgery import DicomReader, find_series, unique_series
+
+
+@pytest.mark.benchmark
+def test_metadata(dicom_series: Path) -> None:
+    reader = DicomReader(dicom_series)
+    assert reader.patient_id == "SYNTHETIC"
+    assert reader.acquisition_datetime.year == 2020
+
+
+@pytest.mark.benchmark
+def test_image_data(dicom_series: Path) -> None:
+    reader = DicomReader(dicom_series)
+    assert reader.image_data.dimensions == (96, 112, 112)
+
+
+@pytest.mark.benchmark
+def test_unique_series(dicom_archive: Path) -> None:
+    readers: list[DicomReader] = list(unique_series(find_series(dicom_archive)))
+    assert [reader.folder.name for reader in readers] == ["a", "c"]
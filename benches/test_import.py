@@ -0,0 +1,78 @@
+import importlib
+import json
+import os
+import subprocess
+import sys
+from types import ModuleType
+
+import pytest
+
+HEAVY_MODULES: tuple[str, ...] = ("jax", "pyvista", "vtkmodules", "warp")
+
+
+def run_python(code: str) -> list[str]:
+    env: dict[str, str] = os.environ.copy()
+    # ref: <https://github.com/scientific-python/lazy-loader#early-failure>
+    env.pop("EAGER_IMPORT", None)
+    process: subprocess.CompletedProcess[str] = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{code}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))",
+        ],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    return json.loads(process.stdout.splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import liblaf.plastic_surgery",
+        "from liblaf.plastic_surgery import MetaDataset",
+        "from liblaf.plastic_surgery import MetaTable",
+        "from liblaf.plastic_surgery import DicomReader",
+        "from liblaf.plastic_surgery import SlabReader",
+        "from liblaf.plastic_surgery import io, metrics, profiling, shape, sim",
+    ],
+)
+def test_import_is_light(code: str) -> None:
+    modules: list[str] = run_python(code)
+    heavy: list[str] = [
+        module for module in modules if module.split(".")[0] in HEAVY_MODULES
+    ]
+    assert heavy == []
+
+
+@pytest.mark.benchmark
+def test_import_metadata() -> None:
+    """Cold import of the package and validation of an empty dataset.
+
+    The import runs in-process, because CodSpeed only instruments the test
+    process. Modules of the package are evicted first and restored afterwards,
+    so other tests keep their module objects.
+    """
+    package: str = "liblaf.plastic_surgery"
+    saved: dict[str, ModuleType] = {
+        name: module
+        for name, module in sys.modules.items()
+        if name == package or name.startswith(f"{package}.")
+    }
+    for name in saved:
+        del sys.modules[name]
+    try:
+        module: ModuleType = importlib.import_module(package)
+        module.MetaDataset.model_validate({"patients": {}})
+    finally:
+        for name in [
+            name
+            for name in sys.modules
+            if name == package or name.startswith(f"{package}.")
+        ]:
+            del sys.modules[name]
+        sys.modules.update(saved)
+        if package in saved:
+            sys.modules["liblaf"].plastic_surgery = saved[package]
@@ -0,0 +1,63 @@
+import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from liblaf.plastic_surgery import (
+    MetaAcquisition,
+    MetaDataset,
+    MetaPatient,
+    MetaTable,
+)
+
+N_PATIENTS: int = 2000
+
+
+@pytest.fixture(scope="module")
+def dataset() -> MetaDataset:
+    rng: np.random.Generator = np.random.default_rng(0)
+    start = datetime.datetime(2010, 1, 1, tzinfo=datetime.UTC)
+    patients: dict[str, MetaPatient] = {}
+    for i in range(N_PATIENTS):
+        days: np.ndarray = rng.integers(0, 5000, size=rng.integers(1, 6))
+        patients[f"{i:06d}"] = MetaPatient(
+            id=f"{i:06d}",
+            name=f"patient {i}",
+            acquisitions=[
+                MetaAcquisition(datetime=start + datetime.timedelta(days=int(day)))
+                for day in days
+            ],
+        )
+    return MetaDataset(patients=patients)
+
+
+@pytest.fixture(scope="module")
+def table_path(tmp_path_factory: pytest.TempPathFactory, dataset: MetaDataset) -> Path:
+    path: Path = tmp_path_factory.mktemp("meta") / "dataset.npz"
+    MetaTable.from_dataset(dataset).save(path)
+    return path
+
+
+@pytest.mark.benchmark
+def test_from_dataset(dataset: MetaDataset) -> None:
+    table: MetaTable = MetaTable.from_dataset(dataset)
+    assert table.n_patients == N_PATIENTS
+
+
+@pytest.mark.benchmark
+def test_load(table_path: Path) -> None:
+    table: MetaTable = MetaTable.load(table_path)
+    assert table.n_patients == N_PATIENTS
+
+
+@pytest.mark.benchmark
+def test_queries(table_path: Path) -> None:
+    table: MetaTable = MetaTable.load(table_path)
+    for patient_id in table.patient_id.tolist():
+        assert table.first(patient_id) < len(table)
+        assert table.last(patient_id) < len(table)
+    between: np.ndarray = table.between(
+        datetime.date(2012, 1, 1), datetime.date(2013, 1, 1)
+    )
+    assert between.size < len(table)
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+import pyvista as pv
+
+from liblaf import melon
+from liblaf.plastic_surgery import io, metrics
+
+
+@pytest.fixture(scope="module")
+def prediction(
+    tmp_path_factory: pytest.TempPathFactory, tetmesh: pv.UnstructuredGrid
+) -> Path:
+    """A `20-prediction.vtu` with extra fields that evaluation does not read."""
+    tetmesh = tetmesh.copy()
+    rng: np.random.Generator = np.random.default_rng(0)
+    tetmesh.point_data["Displacement"] = rng.normal(size=(tetmesh.n_points, 3))
+    for name in ("DirichletValue", "Force", "Velocity"):
+        tetmesh.point_data[name] = rng.normal(size=(tetmesh.n_points, 3))
+    tetmesh.cell_data["Prestrain"] = rng.normal(size=(tetmesh.n_cells, 3, 3))
+    path: Path = tmp_path_factory.mktemp("prediction") / "20-prediction.vtu"
+    melon.save(path, tetmesh)
+    return path
+
+
+@pytest.mark.benchmark
+def test_surface_evaluation(skin: pv.PolyData) -> None:
+    prediction: pv.PolyData = skin.copy()
+    prediction.points = prediction.points * 1.01
+    evaluation = metrics.SurfaceEvaluation(
+        prediction,
+        skin,
+        regions={"front": prediction.points[:, 1] > 0},
+    )
+    summary: dict[str, float] = evaluation.summary()
+    assert 0.0 < summary["hausdorff"] < 2.0
+    assert np.isfinite(summary["front_mean"])
+
+
+@pytest.mark.benchmark
+def test_lazy_mesh(prediction: Path) -> None:
+    mesh = io.LazyMesh(prediction)
+    displacement: np.ndarray = mesh.point_data["Displacement"]
+    assert displacement.shape == (mesh.n_points, 3)
+
+
+@pytest.mark.benchmark
+def test_load_prediction(prediction: Path) -> None:
+    skin: pv.PolyData = metrics.load_prediction(prediction)
+    assert skin.n_cells > 0
+    assert "Prestrain" not in skin.cell_data
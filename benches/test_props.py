@@ -0,0 +1,37 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+import pyvista as pv
+from jaxtyping import Float
+
+from liblaf.plastic_surgery import io, sim
+
+
+@pytest.fixture(scope="module")
+def osteotomy_tetmesh(tetmesh: pv.UnstructuredGrid) -> pv.UnstructuredGrid:
+    tetmesh = tetmesh.copy()
+    tetmesh.point_data["Osteotomy"] = tetmesh.point_data["IsMandible"]
+    return tetmesh
+
+
+@pytest.mark.benchmark
+def test_gen_props(
+    osteotomy_tetmesh: pv.UnstructuredGrid, mandible: pv.PolyData
+) -> None:
+    post_mandible: pv.PolyData = mandible.translate((0.0, 5.0, 0.0), inplace=False)
+    props: sim.OsteotomyProps = sim.osteotomy_props(osteotomy_tetmesh, post_mandible)
+    distance: Float[np.ndarray, " P"] = props.tetmesh.point_data["SkinToOsteotomy"]
+    prestrain: Float[np.ndarray, " P"] = props.tetmesh.point_data["Prestrain"]
+    assert np.any(np.isfinite(distance))
+    assert np.all(prestrain <= 0.0)
+    assert np.any(prestrain < 0.0)
+
+
+@pytest.mark.benchmark
+def test_artifact(tmp_path: Path, tetmesh: pv.UnstructuredGrid) -> None:
+    artifact: io.Artifact = io.save_artifact(tmp_path / "12.artifact", tetmesh)
+    output: io.Artifact = artifact.link(tmp_path / "13.artifact")
+    output.add("point_data", "Prestrain", np.zeros((tetmesh.n_points,)))
+    mesh: pv.UnstructuredGrid = output.to_pyvista()  # pyright: ignore[reportAssignmentType]
+    assert mesh.n_cells == tetmesh.n_cells
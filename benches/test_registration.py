@@ -0,0 +1,72 @@
+import shutil
+
+import numpy as np
+import pytest
+import pyvista as pv
+import trimesh as tm
+from jaxtyping import Bool, Float
+
+from liblaf import melon
+from liblaf.plastic_surgery import OsteotomyDetector
+
+
+@pytest.mark.benchmark
+def test_icp(cranium: pv.PolyData) -> None:
+    matrix: Float[np.ndarray, "4 4"] = tm.transformations.rotation_matrix(
+        np.deg2rad(5.0), [0.0, 0.0, 1.0]
+    )
+    matrix[:3, 3] = [2.0, -1.0, 3.0]
+    moved: pv.PolyData = cranium.transform(matrix, inplace=False)  # pyright: ignore[reportAssignmentType]
+    cost: float
+    _, _, cost = tm.registration.icp(
+        melon.as_trimesh(moved).sample(10000),
+        melon.as_trimesh(cranium).sample(10000),
+        max_iterations=100,
+        reflection=False,
+        translation=True,
+        scale=False,
+    )
+    assert cost < 5.0
+
+
+@pytest.mark.benchmark
+def test_nearest_point_on_surface(cranium: pv.PolyData, mandible: pv.PolyData) -> None:
+    nearest: melon.NearestPointOnSurfaceResult = melon.nearest_point_on_surface(
+        mandible,
+        cranium.cell_centers(),
+        distance_threshold=0.1,
+        normal_threshold=None,
+    )
+    assert nearest.distance.shape == (cranium.n_cells,)
+
+
+@pytest.mark.benchmark
+def test_osteotomy_mask(mandible: pv.PolyData) -> None:
+    post: pv.PolyData = mandible.copy()
+    moved: Bool[np.ndarray, " P"] = post.points[:, 1] > 60.0
+    post.points[moved] += [0.0, 5.0, 0.0]
+    matrix: Float[np.ndarray, "4 4"] = tm.transformations.rotation_matrix(
+        np.deg2rad(5.0), [0.0, 0.0, 1.0]
+    )
+    matrix[:3, 3] = [2.0, -1.0, 3.0]
+    post.transform(matrix, inplace=True)
+    detector = OsteotomyDetector(mandible, post, n_samples=2000)
+    mask: Bool[np.ndarray, " C"] = detector.mask(1.5)
+    for threshold in np.linspace(0.5, 3.0, 16):
+        detector.mask(threshold)
+    assert mask.any()
+    assert np.all(mandible.cell_centers().points[mask, 1] > 50.0)
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(shutil.which("WrapCmd.sh") is None, reason="requires Wrap")
+def test_fast_wrapping(skin: pv.PolyData) -> None:
+    template: pv.PolyData = pv.Sphere(radius=100.0)
+    landmarks: Float[np.ndarray, "6 3"] = np.concatenate([np.eye(3), -np.eye(3)])
+    result: pv.PolyData = melon.tri.fast_wrapping(
+        template,
+        skin,
+        source_landmarks=100.0 * landmarks,
+        target_landmarks=landmarks * [80.0, 100.0, 120.0],
+    )
+    assert result.n_points == template.n_points
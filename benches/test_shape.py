@@ -0,0 +1,53 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+import pyvista as pv
+from jaxtyping import Float
+
+from liblaf.plastic_surgery import shape
+
+N_SHAPES: int = 64
+
+
+@pytest.fixture(scope="module")
+def shapes(skin: pv.PolyData) -> Float[np.ndarray, "shapes vertices 3"]:
+    """Random affine deformations of the skin, standing in for a registered cohort."""
+    rng: np.random.Generator = np.random.default_rng(0)
+    transforms: Float[np.ndarray, "shapes 3 3"] = np.eye(3) + 0.05 * rng.normal(
+        size=(N_SHAPES, 3, 3)
+    )
+    return np.einsum("sij,vj->svi", transforms, skin.points)
+
+
+@pytest.fixture(scope="module")
+def stack(
+    tmp_path_factory: pytest.TempPathFactory,
+    shapes: Float[np.ndarray, "shapes vertices 3"],
+) -> shape.ShapeStack:
+    stack: shape.ShapeStack = shape.ShapeStack.create(
+        tmp_path_factory.mktemp("shape") / "skin.stack", shapes.shape[1]
+    )
+    for i, points in enumerate(shapes):
+        stack.add(f"{i:04d}", points)
+    return stack
+
+
+@pytest.mark.benchmark
+def test_stack_add(
+    tmp_path: Path, shapes: Float[np.ndarray, "shapes vertices 3"]
+) -> None:
+    stack: shape.ShapeStack = shape.ShapeStack.create(
+        tmp_path / "skin.stack", shapes.shape[1]
+    )
+    for i, points in enumerate(shapes):
+        stack.add(f"{i:04d}", points)
+    assert len(stack) == N_SHAPES
+
+
+@pytest.mark.benchmark
+def test_shape_pca(stack: shape.ShapeStack) -> None:
+    modes: shape.ShapeModes = shape.shape_pca(stack, 9)
+    # a linear map of fixed points spans at most 9 directions
+    assert modes.explained_variance.shape == (9,)
+    np.testing.assert_allclose(modes.reconstruct(modes.scores), stack.points, atol=1e-3)
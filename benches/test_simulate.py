@@ -0,0 +1,276 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+import pyvista as pv
+from jaxtyping import Bool, Float, Integer
+from liblaf.peach.optim import ScipyOptimizer
+
+from liblaf.plastic_surgery import sim
+
+if TYPE_CHECKING:
+    from liblaf.apple import Model
+
+
+@pytest.fixture
+def model(tetmesh_coarse: pv.UnstructuredGrid) -> "Model":
+    import warp as wp
+    from liblaf.apple import ARAP, ModelBuilder
+    from liblaf.apple.constants import DIRICHLET_MASK, DIRICHLET_VALUE, MU
+
+    wp.init()
+    tetmesh: pv.UnstructuredGrid = tetmesh_coarse.copy()
+    fixed: np.ndarray = (
+        tetmesh.point_data["IsCranium"] | tetmesh.point_data["IsMandible"]
+    )
+    tetmesh.point_data[DIRICHLET_MASK] = np.repeat(fixed[:, np.newaxis], 3, axis=-1)
+    value: Float[np.ndarray, "P 3"] = np.zeros((tetmesh.n_points, 3))
+    value[tetmesh.point_data["IsMandible"]] = [0.0, 5.0, 0.0]
+    tetmesh.point_data[DIRICHLET_VALUE] = value
+    tetmesh.cell_data[MU] = np.ones((tetmesh.n_cells,))
+    builder = ModelBuilder()
+    tetmesh = builder.assign_global_ids(tetmesh)
+    builder.add_dirichlet(tetmesh)
+    builder.add_energy(ARAP.from_pyvista(tetmesh))
+    model: Model = builder.finalize()
+    try:
+        model.fun(model.to_free(model.u_full))
+    except (wp.codegen.WarpCodegenError, wp.codegen.WarpCodegenTypeError) as err:
+        # the installed Warp cannot compile the `liblaf.apple` kernels
+        pytest.skip(f"liblaf.apple kernels do not compile: {err}")
+    return model
+
+
+@pytest.mark.benchmark
+def test_restrict(
+    tetmesh: pv.UnstructuredGrid, tetmesh_coarse: pv.UnstructuredGrid
+) -> None:
+    coarse: pv.UnstructuredGrid = sim.restrict(
+        tetmesh, tetmesh_coarse, data=["IsSkin"], fill=False
+    )
+    assert np.any(coarse.point_data["IsSkin"])
+
+
+@pytest.mark.benchmark
+def test_prolongate(
+    tetmesh: pv.UnstructuredGrid, tetmesh_coarse: pv.UnstructuredGrid
+) -> None:
+    coarse: pv.UnstructuredGrid = tetmesh_coarse.copy()
+    coarse.point_data["Displacement"] = 1e-2 * coarse.points
+    fine: pv.UnstructuredGrid = sim.prolongate(coarse, tetmesh, data="Displacement")
+    assert fine.point_data["Displacement"].shape == (tetmesh.n_points, 3)
+
+
+@pytest.mark.benchmark
+def test_energy(model: "Model") -> None:
+    u = model.to_free(model.u_full)
+    model.fun(u)
+    model.grad(u)
+    model.hess_prod(u, u)
+
+
+class SpringModel:
+    """Mass-spring model on the tet edges, with the interface of `Model`.
+
+    It is written in NumPy, so the solvers can be benchmarked where the
+    `liblaf.apple` kernels are unavailable.
+    """
+
+    edges: Integer[np.ndarray, "E 2"]
+    free: Bool[np.ndarray, " full"]
+    length: Float[np.ndarray, " E"]
+    rest: Float[np.ndarray, "E 2 3"]
+    stiffness: float
+    u_full: Float[np.ndarray, "P 3"]
+
+    def __init__(self, tetmesh: pv.UnstructuredGrid, stiffness: float = 2e1) -> None:
+        edges: pv.PolyData = tetmesh.extract_all_edges(use_all_points=True)  # pyright: ignore[reportAssignmentType]
+        self.edges = edges.lines.reshape(-1, 3)[:, 1:]
+        self.rest = tetmesh.points[self.edges]
+        self.length = np.linalg.norm(self.rest[:, 1] - self.rest[:, 0], axis=-1)
+        self.stiffness = stiffness
+        fixed: Bool[np.ndarray, " P"] = (
+            tetmesh.point_data["IsCranium"] | tetmesh.point_data["IsMandible"]
+        )
+        self.free = np.repeat(~fixed[:, np.newaxis], 3, axis=-1).ravel()
+        self.u_full = np.zeros((tetmesh.n_points, 3))
+        self.u_full[tetmesh.point_data["IsMandible"]] = [0.0, 5.0, 0.0]
+
+    @property
+    def n_free(self) -> int:
+        return int(np.count_nonzero(self.free))
+
+    def to_free(self, u_full: Float[np.ndarray, "P 3"]) -> Float[np.ndarray, " free"]:
+        return np.asarray(u_full).ravel()[self.free]
+
+    def to_full(self, u: Float[np.ndarray, " free"]) -> Float[np.ndarray, "P 3"]:
+        full: Float[np.ndarray, " full"] = self.u_full.ravel().copy()
+        full[self.free] = np.asarray(u)
+        return full.reshape(-1, 3)
+
+    def update(self, u: Float[np.ndarray, " free"]) -> None:
+        self.u_full = self.to_full(u)
+
+    def fun(self, u: Float[np.ndarray, " free"]) -> float:
+        _, length = self._edges(self.to_full(u))
+        return 0.5 * self.stiffness * float(np.sum((length - self.length) ** 2))
+
+    def grad(self, u: Float[np.ndarray, " free"]) -> Float[np.ndarray, " free"]:
+        delta, length = self._edges(self.to_full(u))
+        force: Float[np.ndarray, "E 3"] = (
+            self.stiffness * (length - self.length) / length
+        )[:, np.newaxis] * delta
+        return self._scatter(force)
+
+    def hess_prod(
+        self, u: Float[np.ndarray, " free"], p: Float[np.ndarray, " free"]
+    ) -> Float[np.ndarray, " free"]:
+        delta, length = self._edges(self.to_full(u))
+        direction: Float[np.ndarray, "E 3"] = delta / length[:, np.newaxis]
+        p_full: Float[np.ndarray, " full"] = np.zeros(self.free.shape)
+        p_full[self.free] = np.asarray(p)
+        dp: Float[np.ndarray, "E 3"] = np.diff(
+            p_full.reshape(-1, 3)[self.edges], axis=1
+        )[:, 0]
+        along: Float[np.ndarray, "E 3"] = (
+            np.sum(direction * dp, axis=-1)[:, np.newaxis] * direction
+        )
+        ratio: Float[np.ndarray, " E"] = np.clip(1.0 - self.length / length, 0.0, None)
+        return self._scatter(
+            self.stiffness * (along + ratio[:, np.newaxis] * (dp - along))
+        )
+
+    def hess_diag(self, u: Float[np.ndarray, " free"]) -> Float[np.ndarray, " free"]:  # noqa: ARG002
+        diag: Float[np.ndarray, "P 3"] = np.zeros_like(self.u_full)
+        np.add.at(diag, self.edges.ravel(), self.stiffness)
+        return diag.ravel()[self.free]
+
+    def hess_quad(
+        self, u: Float[np.ndarray, " free"], p: Float[np.ndarray, " free"]
+    ) -> float:
+        return float(np.dot(p, self.hess_prod(u, p)))
+
+    def value_and_grad(
+        self, u: Float[np.ndarray, " free"]
+    ) -> tuple[float, Float[np.ndarray, " free"]]:
+        return self.fun(u), self.grad(u)
+
+    def grad_and_hess_diag(
+        self, u: Float[np.ndarray, " free"]
+    ) -> tuple[Float[np.ndarray, " free"], Float[np.ndarray, " free"]]:
+        return self.grad(u), self.hess_diag(u)
+
+    def _edges(
+        self, u_full: Float[np.ndarray, "P 3"]
+    ) -> tuple[Float[np.ndarray, "E 3"], Float[np.ndarray, " E"]]:
+        points: Float[np.ndarray, "E 2 3"] = self.rest + u_full[self.edges]
+        delta: Float[np.ndarray, "E 3"] = points[:, 1] - points[:, 0]
+        return delta, np.linalg.norm(delta, axis=-1)
+
+    def _scatter(self, force: Float[np.ndarray, "E 3"]) -> Float[np.ndarray, " free"]:
+        output: Float[np.ndarray, "P 3"] = np.zeros_like(self.u_full)
+        np.add.at(output, self.edges[:, 1], force)
+        np.add.at(output, self.edges[:, 0], -force)
+        return output.ravel()[self.free]
+
+
+@pytest.fixture(scope="module")
+def springs_basis(
+    tetmesh_coarse: pv.UnstructuredGrid,
+) -> tuple[SpringModel, Float[np.ndarray, "free modes"]]:
+    springs = SpringModel(tetmesh_coarse)
+    return springs, sim.linear_modes(springs, 16, max_iter=50)  # pyright: ignore[reportArgumentType]
+
+
+@pytest.mark.benchmark
+def test_reduced_solve(
+    springs_basis: tuple[SpringModel, Float[np.ndarray, "free modes"]],
+) -> None:
+    springs, basis = springs_basis
+    springs.update(np.zeros((springs.n_free,)))
+    reduced = sim.ReducedModel(springs, basis)  # pyright: ignore[reportArgumentType]
+    q: Float[np.ndarray, " modes"] = reduced.solve()
+    assert np.linalg.norm(reduced.grad(q)) < 1e-3 * np.linalg.norm(
+        reduced.grad(np.zeros_like(q))
+    )
+
+
+@pytest.fixture(scope="module")
+def springs_cubature(
+    springs_basis: tuple[SpringModel, Float[np.ndarray, "free modes"]],
+) -> tuple[list[sim.Cubature], Float[np.ndarray, " modes"]]:
+    """Cubature fitted to a full-mesh reduced solve, and its solution."""
+    springs, basis = springs_basis
+    springs.update(np.zeros((springs.n_free,)))
+    reduced = sim.ReducedModel(springs, basis)  # pyright: ignore[reportArgumentType]
+    samples: list[Float[np.ndarray, " modes"]] = []
+    q: Float[np.ndarray, " modes"] = reduced.solve(callback=samples.append)
+    energy = sim.EdgeSprings(
+        cells=springs.edges,
+        points=springs.rest,
+        length=springs.length,
+        stiffness=np.full(springs.length.shape, springs.stiffness),
+    )
+    return sim.fit_cubature(reduced, [energy], samples), q
+
+
+@pytest.mark.benchmark
+def test_reduced_cubature_solve(
+    springs_basis: tuple[SpringModel, Float[np.ndarray, "free modes"]],
+    springs_cubature: tuple[list[sim.Cubature], Float[np.ndarray, " modes"]],
+) -> None:
+    springs, basis = springs_basis
+    cubature, expected = springs_cubature
+    springs.update(np.zeros((springs.n_free,)))
+    reduced = sim.ReducedModel(springs, basis, cubature=cubature)  # pyright: ignore[reportArgumentType]
+    q: Float[np.ndarray, " modes"] = reduced.solve()
+    assert sum(term.elements.size for term in cubature) < springs.edges.shape[0] / 10
+    assert np.linalg.norm(q - expected) < 1e-2 * np.linalg.norm(expected)
+
+
+def forward(springs: SpringModel) -> list[float]:
+    """Solve with `Forward` and return the energy after every iteration."""
+    from liblaf.apple import Forward
+
+    history: list[float] = []
+    solver = Forward(springs, optimizer=ScipyOptimizer(method="trust-constr"))  # pyright: ignore[reportArgumentType]
+    solver.step(
+        callback=lambda state, _stats: history.append(float(state.result["fun"]))
+    )
+    return history
+
+
+@pytest.mark.benchmark
+def test_forward_solve(tetmesh: pv.UnstructuredGrid) -> None:
+    springs = SpringModel(tetmesh)
+    initial: float = springs.fun(springs.to_free(springs.u_full))
+    forward(springs)
+    assert springs.fun(springs.to_free(springs.u_full)) < initial
+
+
+@pytest.mark.benchmark
+def test_multires_solve(
+    tetmesh: pv.UnstructuredGrid, tetmesh_coarse: pv.UnstructuredGrid
+) -> None:
+    coarse_springs = SpringModel(tetmesh_coarse)
+    forward(coarse_springs)
+    coarse: pv.UnstructuredGrid = tetmesh_coarse.copy()
+    coarse.point_data["Displacement"] = coarse_springs.u_full
+    fine: pv.UnstructuredGrid = sim.prolongate(coarse, tetmesh, data="Displacement")
+    springs = SpringModel(tetmesh)
+    cold: float = springs.fun(springs.to_free(springs.u_full))
+    # the interpolated displacement is the initial guess of the free points only
+    springs.update(springs.to_free(fine.point_data["Displacement"]))
+    assert springs.fun(springs.to_free(springs.u_full)) < cold
+    warm: list[float] = forward(springs)
+
+    # the `cold_start_baseline` of 20-simulate: the same solve from zero
+    baseline: list[float] = forward(SpringModel(tetmesh))
+    # both stop on `xtol`, after many steps that no longer change the energy,
+    # so compare the iterations needed to get close to the minimum
+    target: float = (1.0 + 1e-4) * min(warm[-1], baseline[-1])
+    assert iterations_to(warm, target) < iterations_to(baseline, target)
+
+
+def iterations_to(history: list[float], target: float) -> int:
+    return next(i for i, value in enumerate(history, 1) if value <= target)
@@ -0,0 +1,56 @@
+from pathlib import Path
+
+import pytest
+import pyvista as pv
+
+from liblaf.plastic_surgery import (
+    DicomReader,
+    SlabReader,
+    contour_slabs,
+    metrics,
+    smooth_slabs,
+)
+
+ISOSURFACES: list[float] = [-200.0, 200.0]
+
+
+def extract_surfaces(dicom_series: Path) -> list[pv.PolyData]:
+    image_data: pv.ImageData = DicomReader(dicom_series).image_data
+    image_data = image_data.gaussian_smooth()  # pyright: ignore[reportAssignmentType]
+    return [image_data.contour([value]) for value in ISOSURFACES]  # pyright: ignore[reportReturnType]
+
+
+@pytest.fixture(scope="module")
+def whole_volume(dicom_series: Path) -> list[pv.PolyData]:
+    surfaces: list[pv.PolyData] = extract_surfaces(dicom_series)
+    # compile the nearest-point kernels outside of the measured call
+    metrics.surface_distance(surfaces[0], surfaces[0])
+    return surfaces
+
+
+@pytest.mark.benchmark
+def test_extract_surface(dicom_series: Path) -> None:
+    skin: pv.PolyData
+    skull: pv.PolyData
+    skin, skull = extract_surfaces(dicom_series)
+    assert skin.n_cells > 0
+    assert skull.n_cells > 0
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("size", [16, 64])
+def test_extract_surface_slabs(
+    dicom_series: Path, whole_volume: list[pv.PolyData], size: int
+) -> None:
+    reader = SlabReader(dicom_series)
+    surfaces: list[pv.PolyData] = contour_slabs(
+        reader, smooth_slabs(reader, size=size), ISOSURFACES
+    )
+    skin: pv.PolyData = surfaces[0]
+    assert skin.n_open_edges == 0
+    # SciPy and VTK Gaussian kernels differ slightly, far below the voxel size
+    tolerance: float = 0.1 * min(reader.spacing)
+    for surface, expected in zip(surfaces, whole_volume, strict=True):
+        assert surface.n_cells > 0
+        evaluation = metrics.SurfaceEvaluation(surface, expected)
+        assert evaluation.hausdorff < tolerance
@@ -0,0 +1,18 @@
+import shutil
+
+import pytest
+import pyvista as pv
+
+from liblaf import melon
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(shutil.which("fTetWild") is None, reason="requires fTetWild")
+def test_tetwild(
+    skin: pv.PolyData, cranium: pv.PolyData, mandible: pv.PolyData
+) -> None:
+    skull: pv.PolyData = pv.merge([cranium, mandible])
+    skull.flip_faces(inplace=True)
+    surface: pv.PolyData = pv.merge([skull, skin])
+    mesh: pv.UnstructuredGrid = melon.tetwild(surface, lr=0.05 * 2.0, epsr=1e-3 * 2.0)
+    assert mesh.n_cells > 0
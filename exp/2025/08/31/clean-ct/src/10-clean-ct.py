@@ -12,6 +12,9 @@ from liblaf.plastic_surgery import (
     MetaAcquisition,
     MetaDataset,
     MetaPatient,
+    MetaTable,
+    find_series,
+    unique_series,
 )
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -39,9 +42,7 @@ def filter_by_volume(readers: list[DicomReader]) -> Generator[DicomReader]:
 
 
 def main(cfg: Config) -> None:
-    readers: list[DicomReader] = [
-        DicomReader(dirfile) for dirfile in cfg.data_dir.rglob("DIRFILE")
-    ]
+    readers: list[DicomReader] = list(unique_series(find_series(cfg.data_dir)))
     readers = list(filter_by_volume(readers))
     patients: defaultdict[str, list[DicomReader]] = defaultdict(list)
     for r in readers:
@@ -84,6 +85,7 @@ def main(cfg: Config) -> None:
             target_dir.parent.mkdir(parents=True, exist_ok=True)
             shutil.copytree(r.folder, target_dir, dirs_exist_ok=True)
     grapes.save(cfg.output_dir / "dataset.json", meta, order="sorted")
+    MetaTable.from_dataset(meta).save(cfg.output_dir / "dataset.npz")
 
 
 if __name__ == "__main__":
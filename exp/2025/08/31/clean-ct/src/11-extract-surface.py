@@ -1,24 +1,36 @@
 import concurrent
 import concurrent.futures
 import logging
+import shutil
 from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
 
 import pyvista as pv
 
 from liblaf import cherries, grapes, melon
-from liblaf.plastic_surgery import DicomReader, MetaDataset
+from liblaf.plastic_surgery import (
+    SLAB_SIZE,
+    DicomReader,
+    MetaDataset,
+    SlabReader,
+    contour_slabs,
+    profiling,
+    smooth_slabs,
+)
 
 logger: logging.Logger = logging.getLogger(__name__)
 
 
 class Config(cherries.BaseConfig):
     data_dir: Path = Path("~/datasets/CT").expanduser()
+    slab_size: int = SLAB_SIZE
 
     output_dir: Path = cherries.output("11-surface")
 
 
-def process_acquisition(acquisition_dir: Path, output_dir: Path) -> None:
+def process_acquisition(
+    acquisition_dir: Path, output_dir: Path, slab_size: int = SLAB_SIZE
+) -> None:
     reader = DicomReader(acquisition_dir)
     logger.info(
         "%s (%s): %s",
@@ -26,20 +38,26 @@ def process_acquisition(acquisition_dir: Path, output_dir: Path) -> None:
         reader.patient_name,
         reader.acquisition_datetime.isoformat(),
     )
-    image_data: pv.ImageData = reader.image_data
-    image_data = image_data.gaussian_smooth()  # pyright: ignore[reportAssignmentType]
-    skin: pv.PolyData = image_data.contour([-200.0])  # pyright: ignore[reportAssignmentType]
-    skin.extract_largest(inplace=True)
-    melon.save(output_dir / "skin.ply", skin)
-    skull: pv.PolyData = image_data.contour([200.0])  # pyright: ignore[reportAssignmentType]
-    skull.extract_largest(inplace=True)
-    melon.save(output_dir / "skull.ply", skull)
+    slabs = SlabReader(reader)
+    skin: pv.PolyData
+    skull: pv.PolyData
+    skin, skull = contour_slabs(
+        slabs, smooth_slabs(slabs, size=slab_size), [-200.0, 200.0]
+    )
+    with profiling.step("largest"):
+        skin.extract_largest(inplace=True)
+        skull.extract_largest(inplace=True)
+    with profiling.step("save"):
+        melon.save(output_dir / "skin.ply", skin)
+        melon.save(output_dir / "skull.ply", skull)
 
 
+@profiling.profiled
 def main(cfg: Config) -> None:
     meta: MetaDataset = grapes.load(cfg.data_dir / "dataset.json", type=MetaDataset)
     cfg.output_dir.mkdir(parents=True, exist_ok=True)
     grapes.save(cfg.output_dir / "dataset.json", meta, order="sorted")
+    shutil.copyfile(cfg.data_dir / "dataset.npz", cfg.output_dir / "dataset.npz")
     with ProcessPoolExecutor() as executor:
         futures: list[Future[None]] = []
         for patient_id, meta_patient in meta.patients.items():
@@ -51,7 +69,9 @@ def main(cfg: Config) -> None:
                     cfg.output_dir / patient_id / meta_acq.datetime.strftime("%Y-%m-%d")
                 )
                 futures.append(
-                    executor.submit(process_acquisition, input_dir, output_dir)
+                    executor.submit(
+                        process_acquisition, input_dir, output_dir, cfg.slab_size
+                    )
                 )
         concurrent.futures.wait(futures)
 
@@ -5,8 +5,8 @@ import numpy as np
 import trimesh as tm
 from jaxtyping import Float
 
-from liblaf import cherries, grapes, melon
-from liblaf.plastic_surgery import MetaDataset
+from liblaf import cherries, melon
+from liblaf.plastic_surgery import MetaTable
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -16,19 +16,15 @@ class Config(cherries.BaseConfig):
 
 
 def main(cfg: Config) -> None:
-    meta: MetaDataset = grapes.load(cfg.surface_dir / "dataset.json", type=MetaDataset)
+    table: MetaTable = MetaTable.load(cfg.surface_dir / "dataset.npz")
+    paths: np.ndarray = table.path
     distances: list[tuple[str, float]] = []
-    for patient_id, meta_patient in meta.patients.items():
-        patient_dir: Path = cfg.surface_dir / patient_id
+    for patient_id in table.patient_id.tolist():
         pre_skin: tm.Trimesh = melon.load_trimesh(
-            patient_dir
-            / meta_patient.acquisitions[0].datetime.strftime("%Y-%m-%d")
-            / "skin.ply"
+            cfg.surface_dir / paths[table.first(patient_id)] / "skin.ply"
         )
         post_skin: tm.Trimesh = melon.load_trimesh(
-            patient_dir
-            / meta_patient.acquisitions[-1].datetime.strftime("%Y-%m-%d")
-            / "skin.ply"
+            cfg.surface_dir / paths[table.last(patient_id)] / "skin.ply"
         )
         transformed: Float[np.ndarray, "n 3"]
         cost: float
@@ -8,7 +8,7 @@ import trimesh as tm
 from jaxtyping import Float
 
 from liblaf import cherries, grapes, melon
-from liblaf.plastic_surgery import MetaDataset
+from liblaf.plastic_surgery import MetaDataset, profiling
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -32,14 +32,15 @@ def icp(
     target_tm: tm.Trimesh = melon.as_trimesh(target)
     matrix: Float[np.ndarray, "4 4"]
     cost: float
-    matrix, _, cost = tm.registration.icp(
-        source_tm.sample(10000),
-        target_tm.sample(10000),
-        max_iterations=100,
-        reflection=False,
-        translation=True,
-        scale=False,
-    )
+    with profiling.step("icp"):
+        matrix, _, cost = tm.registration.icp(
+            source_tm.sample(10000),
+            target_tm.sample(10000),
+            max_iterations=100,
+            reflection=False,
+            translation=True,
+            scale=False,
+        )
     return matrix, cost
 
 
@@ -67,47 +68,50 @@ def register_acquisition(
     )
     if mandible_landmarks.size == 0:
         return None
-    skin: pv.PolyData = melon.load_polydata(skin_file)
-    skull: pv.PolyData = melon.load_polydata(folder / "skull.ply")
-    skin = melon.tri.fast_wrapping(
-        template_skin,
-        skin,
-        source_landmarks=template_skin_landmarks,
-        target_landmarks=skin_landmarks,
-        free_polygons_floating=melon.tri.select_groups(
+    with profiling.step("load"):
+        skin: pv.PolyData = melon.load_polydata(skin_file)
+        skull: pv.PolyData = melon.load_polydata(folder / "skull.ply")
+    with profiling.step("wrapping"):
+        skin = melon.tri.fast_wrapping(
             template_skin,
-            [
-                "Caruncle",
-                "EarSocket",
-                "EyeSocketBottom",
-                "EyeSocketTop",
-                "LipInnerBottom",
-                "LipInnerTop",
-                "MouthSocketBottom",
-                "MouthSocketTop",
-                "NeckBack",
-                "NeckFront",
-                "Nostril",
-            ],
-        ),
-    )
-    cranium: pv.PolyData = melon.tri.fast_wrapping(
-        template_cranium,
-        skull,
-        source_landmarks=template_cranium_landmarks,
-        target_landmarks=cranium_landmarks,
-        free_polygons_floating=template_cranium.cell_data["Floating"],
-    )
-    mandible: pv.PolyData = melon.tri.fast_wrapping(
-        template_mandible,
-        skull,
-        source_landmarks=template_mandible_landmarks,
-        target_landmarks=mandible_landmarks,
-        free_polygons_floating=template_mandible.cell_data["Floating"],
-    )
+            skin,
+            source_landmarks=template_skin_landmarks,
+            target_landmarks=skin_landmarks,
+            free_polygons_floating=melon.tri.select_groups(
+                template_skin,
+                [
+                    "Caruncle",
+                    "EarSocket",
+                    "EyeSocketBottom",
+                    "EyeSocketTop",
+                    "LipInnerBottom",
+                    "LipInnerTop",
+                    "MouthSocketBottom",
+                    "MouthSocketTop",
+                    "NeckBack",
+                    "NeckFront",
+                    "Nostril",
+                ],
+            ),
+        )
+        cranium: pv.PolyData = melon.tri.fast_wrapping(
+            template_cranium,
+            skull,
+            source_landmarks=template_cranium_landmarks,
+            target_landmarks=cranium_landmarks,
+            free_polygons_floating=template_cranium.cell_data["Floating"],
+        )
+        mandible: pv.PolyData = melon.tri.fast_wrapping(
+            template_mandible,
+            skull,
+            source_landmarks=template_mandible_landmarks,
+            target_landmarks=mandible_landmarks,
+            free_polygons_floating=template_mandible.cell_data["Floating"],
+        )
     return skin, cranium, mandible
 
 
+@profiling.profiled
 def main(cfg: Config) -> None:
     meta: MetaDataset = grapes.load(cfg.inputs_dir / "dataset.json", type=MetaDataset)
     template_skin: pv.PolyData = melon.load_polydata(cfg.template_skin)
@@ -171,12 +175,13 @@ def main(cfg: Config) -> None:
         post_mandible.transform(post_to_pre, inplace=True)
 
         output_patient_dir: Path = cfg.outputs_dir / patient_id
-        melon.save(output_patient_dir / "pre-skin.vtp", pre_skin)
-        melon.save(output_patient_dir / "pre-cranium.vtp", pre_cranium)
-        melon.save(output_patient_dir / "pre-mandible.vtp", pre_mandible)
-        melon.save(output_patient_dir / "post-skin.vtp", post_skin)
-        melon.save(output_patient_dir / "post-cranium.vtp", post_cranium)
-        melon.save(output_patient_dir / "post-mandible.vtp", post_mandible)
+        with profiling.step("save"):
+            melon.save(output_patient_dir / "pre-skin.vtp", pre_skin)
+            melon.save(output_patient_dir / "pre-cranium.vtp", pre_cranium)
+            melon.save(output_patient_dir / "pre-mandible.vtp", pre_mandible)
+            melon.save(output_patient_dir / "post-skin.vtp", post_skin)
+            melon.save(output_patient_dir / "post-cranium.vtp", post_cranium)
+            melon.save(output_patient_dir / "post-mandible.vtp", post_mandible)
 
 
 if __name__ == "__main__":
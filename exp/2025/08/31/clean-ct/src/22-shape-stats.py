@@ -0,0 +1,85 @@
+import hashlib
+import logging
+from pathlib import Path
+
+import pyvista as pv
+
+from liblaf import cherries, grapes, melon
+from liblaf.plastic_surgery import MetaDataset, shape
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class Config(cherries.BaseConfig):
+    inputs_dir: Path = cherries.input("21-registration")
+
+    outputs_dir: Path = cherries.output("22-shape-stats")
+    stacks_dir: Path = cherries.temp("22-shape-stats")
+
+    n_modes: int = 10
+
+
+def input_fingerprint(paths: dict[str, Path]) -> str:
+    """Hash of the sorted case ids and the modification times of their meshes."""
+    digest = hashlib.sha256()
+    for patient_id in sorted(paths):
+        digest.update(f"{patient_id}:{paths[patient_id].stat().st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def main(cfg: Config) -> None:
+    meta: MetaDataset = grapes.load(cfg.inputs_dir / "dataset.json", type=MetaDataset)
+    for name in (
+        "pre-skin",
+        "pre-cranium",
+        "pre-mandible",
+        "post-skin",
+        "post-cranium",
+        "post-mandible",
+    ):
+        paths: dict[str, Path] = {
+            patient_id: path
+            for patient_id in meta.patients
+            if (path := cfg.inputs_dir / patient_id / f"{name}.vtp").exists()
+        }
+        fingerprint: str = input_fingerprint(paths)
+        stack_dir: Path = cfg.stacks_dir / f"{name}.stack"
+        stack: shape.ShapeStack | None = (
+            shape.ShapeStack(stack_dir) if stack_dir.exists() else None
+        )
+        if stack is not None and stack.fingerprint != fingerprint:
+            logger.info("%s: registered meshes changed, restacking", name)
+            stack = None
+        template: pv.PolyData | None = None
+        for patient_id, path in paths.items():
+            if template is None:
+                template = melon.load_polydata(path)
+            if stack is None:
+                stack = shape.ShapeStack.create(
+                    stack_dir, template.n_points, fingerprint=fingerprint
+                )
+            if patient_id in stack.ids:
+                continue
+            stack.add(patient_id, melon.load_polydata(path).points)
+        if stack is None or template is None:
+            logger.warning("%s: no registered meshes", name)
+            continue
+        modes: shape.ShapeModes = shape.shape_pca(stack, cfg.n_modes)
+        logger.info(
+            "%s: %d shapes, explained variance: %s",
+            name,
+            stack.n_shapes,
+            modes.explained_variance,
+        )
+        mean: pv.PolyData = template.copy()
+        mean.clear_data()
+        mean.points = modes.mean
+        mean.point_data["Variance"] = stack.vertex_variance
+        for i, component in enumerate(modes.components):
+            mean.point_data[f"Mode{i}"] = component
+        mean.field_data["ExplainedVariance"] = modes.explained_variance
+        melon.save(cfg.outputs_dir / f"{name}.vtp", mean)
+
+
+if __name__ == "__main__":
+    cherries.main(main)
@@ -15,6 +15,11 @@ class Config(cherries.BaseConfig):
     lr: float = 0.05 * 0.5
     epsr: float = 1e-3 * 0.5
 
+    # second, coarser mesh for the multires warm start of 20-simulate
+    coarse: bool = False
+    coarse_lr: float = 0.05 * 2.0
+    coarse_epsr: float = 1e-3 * 2.0
+
 
 def main(cfg: Config) -> None:
     skin: pv.PolyData = melon.load_polydata(cfg.skin)
@@ -24,10 +29,14 @@ def main(cfg: Config) -> None:
     skull: pv.PolyData = pv.merge([cranium, mandible])
     skull.flip_faces(inplace=True)
 
-    mesh: pv.UnstructuredGrid = melon.tetwild(
-        pv.merge([skull, skin]), lr=cfg.lr, epsr=cfg.epsr
-    )
+    surface: pv.PolyData = pv.merge([skull, skin])
+    mesh: pv.UnstructuredGrid = melon.tetwild(surface, lr=cfg.lr, epsr=cfg.epsr)
     melon.save(cfg.output, mesh)
+    if cfg.coarse:
+        coarse: pv.UnstructuredGrid = melon.tetwild(
+            surface, lr=cfg.coarse_lr, epsr=cfg.coarse_epsr
+        )
+        melon.save(cherries.output("10-tetmesh-coarse.vtu"), coarse)
 
 
 if __name__ == "__main__":
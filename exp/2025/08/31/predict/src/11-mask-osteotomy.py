@@ -1,12 +1,10 @@
 import logging
 from pathlib import Path
 
-import numpy as np
 import pyvista as pv
-import trimesh as tm
-from jaxtyping import Float
 
 from liblaf import cherries, melon
+from liblaf.plastic_surgery import OsteotomyDetector
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -18,35 +16,24 @@ class Config(cherries.BaseConfig):
     osteotomy_distance_threshold: float = 1.5  # millimeters
     output: Path = cherries.output("11-pre-mandible.vtp")
 
+    # alignment and distances, reused while only the threshold changes
+    cache: Path = cherries.temp("11-osteotomy.npz")
+
 
 def main(cfg: Config) -> None:
     pre_mandible: pv.PolyData = melon.load_polydata(cfg.pre_mandible)
     post_mandible: pv.PolyData = melon.load_polydata(cfg.post_mandible)
 
-    matrix: Float[np.ndarray, "4 4"]
-    cost: float
-    matrix, _, cost = tm.registration.icp(
-        post_mandible.points,
-        pre_mandible.points,
-        reflection=False,
-        translation=True,
-        scale=False,
-    )
-    logger.info("ICP cost: %g", cost)
-    post_mandible.transform(matrix, inplace=True)
-    melon.save(cherries.temp("11-post-mandible-aligned.vtp"), post_mandible)
-
-    nearest: melon.NearestPointOnSurfaceResult = melon.nearest_point_on_surface(
-        post_mandible,
-        pre_mandible.cell_centers(),
-        distance_threshold=1.0,
-        normal_threshold=None,
-    )
+    detector = OsteotomyDetector(pre_mandible, post_mandible)
+    if not detector.load(cfg.cache):
+        detector.save(cfg.cache)
+    logger.info("ICP cost: %g", detector.alignment[1])
+    melon.save(cherries.temp("11-post-mandible-aligned.vtp"), detector.aligned)
 
-    pre_mandible.cell_data["Osteotomy"] = (
-        nearest.distance > cfg.osteotomy_distance_threshold
-    ) & ~pre_mandible.cell_data["Floating"]
-    pre_mandible.cell_data["Distance"] = nearest.distance
+    pre_mandible.cell_data["Osteotomy"] = detector.mask(
+        cfg.osteotomy_distance_threshold
+    )
+    pre_mandible.cell_data["Distance"] = detector.distance
     melon.save(cfg.output, pre_mandible)
 
 
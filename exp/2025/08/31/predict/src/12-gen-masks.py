@@ -4,6 +4,7 @@ import numpy as np
 import pyvista as pv
 
 from liblaf import cherries, melon
+from liblaf.plastic_surgery import io
 
 
 class Config(cherries.BaseConfig):
@@ -12,7 +13,7 @@ class Config(cherries.BaseConfig):
     mandible: Path = cherries.input("11-pre-mandible.vtp")
     tetmesh: Path = cherries.input("10-tetmesh.vtu")
 
-    output: Path = cherries.output("12-tetmesh.vtu")
+    output: Path = cherries.output("12-tetmesh.artifact")
 
 
 def main(cfg: Config) -> None:
@@ -54,7 +55,7 @@ def main(cfg: Config) -> None:
         surface, tetmesh, data=data_names, fill=False, point_id="_PointId"
     )
 
-    melon.save(cfg.output, tetmesh)
+    io.save_artifact(cfg.output, tetmesh)
 
 
 if __name__ == "__main__":
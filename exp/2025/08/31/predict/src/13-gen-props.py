@@ -1,18 +1,18 @@
 from pathlib import Path
 
-import numpy as np
 import pyvista as pv
 from liblaf.apple.constants import DIRICHLET_MASK, DIRICHLET_VALUE, PRESTRAIN
 
 from liblaf import cherries, melon
+from liblaf.plastic_surgery import io, profiling, sim
 
 
 class Config(cherries.BaseConfig):
     pre_mandible: Path = cherries.input("00-pre-mandible.vtp")
     post_mandible: Path = cherries.input("00-post-mandible.vtp")
-    tetmesh: Path = cherries.input("12-tetmesh.vtu")
+    tetmesh: Path = cherries.input("12-tetmesh.artifact")
 
-    output: Path = cherries.output("13-tetmesh.vtu")
+    output: Path = cherries.output("13-tetmesh.artifact")
 
     osteotomy_to_post_threshold: float = 20.0  # millimeters
     skin_to_osteotomy_threshold: float = 20.0  # millimeters
@@ -22,75 +22,38 @@ class Config(cherries.BaseConfig):
     a2: float = 1e-3
 
 
+@profiling.profiled
 def main(cfg: Config) -> None:
     pre_mandible: pv.PolyData = melon.load_polydata(cfg.pre_mandible)
     post_mandible: pv.PolyData = melon.load_polydata(cfg.post_mandible)
-    tetmesh: pv.UnstructuredGrid = melon.load_unstructured_grid(cfg.tetmesh)
+    artifact = io.Artifact(cfg.tetmesh)
+    tetmesh: pv.UnstructuredGrid = artifact.to_pyvista()  # pyright: ignore[reportAssignmentType]
 
-    tetmesh.point_data["_PointId"] = np.arange(tetmesh.n_points)
-    surface: pv.PolyData = tetmesh.extract_surface()  # pyright: ignore[reportAssignmentType]
-    skin: pv.PolyData = melon.tri.extract_points(surface, surface.point_data["IsSkin"])
-    osteotomy: pv.PolyData = melon.tri.extract_points(
-        surface, surface.point_data["Osteotomy"]
-    )
-
-    surface.point_data[DIRICHLET_MASK] = (
-        surface.point_data["IsCranium"] | surface.point_data["IsMandible"]
-    ) & ~surface.point_data["Osteotomy"]
-    surface.point_data[DIRICHLET_VALUE] = np.zeros((surface.n_points, 3))
-
-    tetmesh = melon.transfer_tri_point_to_tet(
-        surface,
+    props: sim.OsteotomyProps = sim.osteotomy_props(
         tetmesh,
-        data=[DIRICHLET_MASK, DIRICHLET_VALUE],
-        fill={DIRICHLET_MASK: False, DIRICHLET_VALUE: 0.0},
-        point_id="_PointId",
+        post_mandible,
+        osteotomy_to_post_threshold=cfg.osteotomy_to_post_threshold,
+        skin_to_osteotomy_threshold=cfg.skin_to_osteotomy_threshold,
+        a0=cfg.a0,
+        a1=cfg.a1,
+        a2=cfg.a2,
     )
-
-    osteotomy_to_post: melon.NearestPointOnSurfaceResult = (
-        melon.nearest_point_on_surface(
-            post_mandible,
-            osteotomy,
-            distance_threshold=cfg.osteotomy_to_post_threshold / post_mandible.length,
-            normal_threshold=None,
-        )
-    )
-    osteotomy.point_data["PreToPostMandible"] = osteotomy_to_post.distance
-    melon.save(cherries.temp("13-osteotomy.vtp"), osteotomy)
+    melon.save(cherries.temp("13-osteotomy.vtp"), props.osteotomy)
     melon.save(cherries.temp("13-pre-mandible.vtp"), pre_mandible)
     melon.save(cherries.temp("13-post-mandible.vtp"), post_mandible)
-    osteotomy = osteotomy.point_data_to_cell_data(pass_point_data=True)  # pyright: ignore[reportAssignmentType]
-
-    skin_to_osteotomy: melon.NearestPointOnSurfaceResult = (
-        melon.nearest_point_on_surface(
-            osteotomy,
-            skin,
-            distance_threshold=cfg.skin_to_osteotomy_threshold / osteotomy.length,
-            normal_threshold=None,
-        )
-    )
-    skin.point_data["SkinToOsteotomy"] = skin_to_osteotomy.distance
-    skin.point_data["PreToPostMandible"] = np.where(
-        skin_to_osteotomy.missing,
-        0.0,
-        osteotomy.cell_data["PreToPostMandible"][skin_to_osteotomy.triangle_id],
-    )
-
-    skin.point_data[PRESTRAIN] = (
-        -cfg.a0
-        * np.exp(-cfg.a1 * skin.point_data["SkinToOsteotomy"])
-        * (1.0 - np.exp(-cfg.a2 * skin.point_data["PreToPostMandible"]))
-    )
-    melon.save(cherries.temp("13-skin.vtp"), skin)
-
-    tetmesh = melon.transfer_tri_point_to_tet(
-        skin,
-        tetmesh,
-        data=["PreToPostMandible", "SkinToOsteotomy", PRESTRAIN],
-        fill={"PreToPostMandible": 0.0, "SkinToOsteotomy": np.inf, PRESTRAIN: 0.0},
-        point_id="_PointId",
-    )
-    melon.save(cfg.output, tetmesh)
+    melon.save(cherries.temp("13-skin.vtp"), props.skin)
+    tetmesh = props.tetmesh
+
+    # only append the new fields, the mesh and the masks are shared with 12
+    output: io.Artifact = artifact.link(cfg.output)
+    for name in [
+        DIRICHLET_MASK,
+        DIRICHLET_VALUE,
+        "PreToPostMandible",
+        "SkinToOsteotomy",
+        PRESTRAIN,
+    ]:
+        output.add("point_data", name, tetmesh.point_data[name])
 
 
 if __name__ == "__main__":
@@ -1,23 +1,56 @@
+import hashlib
+import logging
 from pathlib import Path
 
+import jax.numpy as jnp
 import numpy as np
 import pyvista as pv
 from liblaf.apple import ARAP, Forward, MassSpringPrestrain, Model, ModelBuilder
-from liblaf.apple.constants import MU, POINT_ID, STIFFNESS
+from liblaf.apple.constants import (
+    DIRICHLET_MASK,
+    DIRICHLET_VALUE,
+    MU,
+    POINT_ID,
+    PRESTRAIN,
+    STIFFNESS,
+)
 from liblaf.peach.optim import ScipyOptimizer
 
 from liblaf import cherries, melon
+from liblaf.plastic_surgery import io, profiling, sim
+
+logger: logging.Logger = logging.getLogger(__name__)
 
 
 class Config(cherries.BaseConfig):
-    tetmesh: Path = cherries.input("13-tetmesh.vtu")
+    tetmesh: Path = cherries.input("13-tetmesh.artifact")
+    # only read with `multires`, defaults to `10-tetmesh-coarse.vtu`
+    coarse: Path | None = None
 
     output: Path = cherries.output("20-prediction.vtu")
 
+    basis: Path = cherries.temp("20-basis.npz")
+    cubature: Path = cherries.temp("20-cubature.npz")
+    output_reduced: Path = cherries.output("20-prediction-reduced.vtu")
 
-def main(cfg: Config) -> None:
-    tetmesh: pv.UnstructuredGrid = melon.load_unstructured_grid(cfg.tetmesh)
-    tetmesh.cell_data[MU] = np.full((tetmesh.n_cells,), 1e0)
+    multires: bool = False
+    # with `multires`, also solve from a zero initial guess to compare
+    cold_start_baseline: bool = False
+    reduced: bool = False
+    refine: bool = True
+    n_modes: int = 32
+    # earlier predictions on the same mesh, added to the basis as POD modes
+    snapshots: tuple[Path, ...] = ()
+
+
+MU_VALUE: float = 1e0
+STIFFNESS_VALUE: float = 2e1
+
+
+def build_model(
+    tetmesh: pv.UnstructuredGrid, name: str = "surface-edges"
+) -> tuple[Model, pv.UnstructuredGrid]:
+    tetmesh.cell_data[MU] = np.full((tetmesh.n_cells,), MU_VALUE)
 
     builder = ModelBuilder()
     tetmesh = builder.assign_global_ids(tetmesh)
@@ -26,28 +59,222 @@ def main(cfg: Config) -> None:
     tetmesh_energy: ARAP = ARAP.from_pyvista(tetmesh)
     builder.add_energy(tetmesh_energy)
 
-    surface: pv.PolyData = tetmesh.extract_surface()  # pyright: ignore[reportAssignmentType]
-    edges: pv.PolyData = surface.extract_all_edges()  # pyright: ignore[reportAssignmentType]
-    edges = edges.point_data_to_cell_data(pass_point_data=True)  # pyright: ignore[reportAssignmentType]
-    edges.cell_data[STIFFNESS] = np.full((edges.n_cells,), 2e1)
-    melon.save(cherries.temp("20-surface-edges.vtp"), edges)
+    edges: pv.PolyData = surface_edges(tetmesh)
+    melon.save(cherries.temp(f"20-{name}.vtp"), edges)
 
     surface_energy: MassSpringPrestrain = MassSpringPrestrain.from_pyvista(edges)
     ic(surface_energy, short_arrays=False)
-    # ic(jnp.count_nonzero(surface_energy.prestrain))
     builder.add_energy(surface_energy)
 
     model: Model = builder.finalize()
-    ic(model)
     ic(surface_energy.fun(model.u_full))
+    return model, tetmesh
+
+
+def surface_edges(tetmesh: pv.UnstructuredGrid) -> pv.PolyData:
+    surface: pv.PolyData = tetmesh.extract_surface()  # pyright: ignore[reportAssignmentType]
+    edges: pv.PolyData = surface.extract_all_edges()  # pyright: ignore[reportAssignmentType]
+    edges = edges.point_data_to_cell_data(pass_point_data=True)  # pyright: ignore[reportAssignmentType]
+    edges.cell_data[STIFFNESS] = np.full((edges.n_cells,), STIFFNESS_VALUE)
+    return edges
+
+
+def solve_coarse(
+    tetmesh: pv.UnstructuredGrid, coarse: pv.UnstructuredGrid
+) -> pv.UnstructuredGrid:
+    coarse = sim.restrict(
+        tetmesh,
+        coarse,
+        data=[DIRICHLET_MASK, DIRICHLET_VALUE, PRESTRAIN],
+        fill={DIRICHLET_MASK: False, DIRICHLET_VALUE: 0.0, PRESTRAIN: 0.0},
+    )
+    model: Model
+    with profiling.step("build"):
+        model, coarse = build_model(coarse, "coarse-surface-edges")
     forward = Forward(
-        model, optimizer=ScipyOptimizer(method="trust-constr", options={"verbose": 3})
+        model, optimizer=ScipyOptimizer(method="trust-constr", options={"verbose": 1})
     )
+    with profiling.step("solve"):
+        solution: ScipyOptimizer.Solution = forward.step()
+    logger.info(
+        "coarse solve: %d points, %d iterations, %g s",
+        coarse.n_points,
+        solution.state.result["nit"],
+        solution.stats.time,
+    )
+    coarse.point_data["Displacement"] = model.u_full[coarse.point_data[POINT_ID]]  # pyright: ignore[reportArgumentType]
+    return coarse
+
 
+def solve_cold_start(tetmesh: pv.UnstructuredGrid) -> None:
+    """Fine solve from a zero initial guess, as the baseline for the warm start."""
+    model: Model
+    model, tetmesh = build_model(tetmesh)
+    forward = Forward(
+        model, optimizer=ScipyOptimizer(method="trust-constr", options={"verbose": 1})
+    )
     solution: ScipyOptimizer.Solution = forward.step()
+    logger.info(
+        "fine solve (cold start): %d iterations, %g s",
+        solution.state.result["nit"],
+        solution.stats.time,
+    )
+
+
+def basis_fingerprint(cfg: Config, tetmesh: pv.UnstructuredGrid) -> str:
+    """Hash of everything the basis depends on: mesh, fields, material and modes."""
+    digest = hashlib.sha256(f"{cfg.n_modes}:{MU_VALUE}:{STIFFNESS_VALUE}".encode())
+    digest.update(np.ascontiguousarray(tetmesh.points).tobytes())
+    digest.update(np.ascontiguousarray(tetmesh.cells).tobytes())
+    for data in (tetmesh.point_data, tetmesh.cell_data):
+        for name in sorted(data.keys()):
+            digest.update(name.encode())
+            digest.update(np.ascontiguousarray(data[name]).tobytes())
+    for path in cfg.snapshots:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def load_snapshots(
+    cfg: Config, model: Model, tetmesh: pv.UnstructuredGrid
+) -> list[np.ndarray]:
+    snapshots: list[np.ndarray] = []
+    for path in cfg.snapshots:
+        prediction: pv.UnstructuredGrid = melon.load_unstructured_grid(path)
+        u_full: np.ndarray = np.zeros((model.n_points, 3))
+        u_full[tetmesh.point_data[POINT_ID]] = prediction.point_data["Displacement"]
+        snapshots.append(u_full)
+    return snapshots
+
+
+def load_basis(cfg: Config, model: Model, tetmesh: pv.UnstructuredGrid) -> np.ndarray:
+    fingerprint: str = basis_fingerprint(cfg, tetmesh)
+    if cfg.basis.exists():
+        with np.load(cfg.basis) as data:
+            if str(data["fingerprint"]) == fingerprint:
+                return data["basis"]
+        logger.info("basis cache is stale, recomputing")
+    basis: np.ndarray = sim.linear_modes(model, cfg.n_modes)
+    if cfg.snapshots:
+        basis = sim.orthonormalize(
+            basis, sim.snapshot_modes(model, load_snapshots(cfg, model, tetmesh))
+        )
+    cfg.basis.parent.mkdir(parents=True, exist_ok=True)
+    with cfg.basis.open("wb") as fp:
+        np.savez(fp, fingerprint=fingerprint, basis=basis)
+    return basis
+
+
+def load_cubature(
+    cfg: Config, tetmesh: pv.UnstructuredGrid, energies: list[sim.ElementEnergy]
+) -> list[sim.Cubature] | None:
+    if not cfg.cubature.exists():
+        return None
+    with np.load(cfg.cubature) as data:
+        if str(data["fingerprint"]) == basis_fingerprint(cfg, tetmesh):
+            return [
+                sim.Cubature(energy, data[f"elements_{i}"], data[f"weights_{i}"])
+                for i, energy in enumerate(energies)
+            ]
+    logger.info("cubature cache is stale, refitting")
+    return None
+
+
+def save_cubature(
+    cfg: Config, tetmesh: pv.UnstructuredGrid, cubature: list[sim.Cubature]
+) -> None:
+    arrays: dict[str, np.ndarray] = {}
+    for i, term in enumerate(cubature):
+        arrays[f"elements_{i}"] = term.elements
+        arrays[f"weights_{i}"] = term.weights
+    cfg.cubature.parent.mkdir(parents=True, exist_ok=True)
+    with cfg.cubature.open("wb") as fp:
+        np.savez(fp, fingerprint=basis_fingerprint(cfg, tetmesh), **arrays)
+
+
+def solve_reduced(
+    cfg: Config, model: Model, tetmesh: pv.UnstructuredGrid
+) -> pv.UnstructuredGrid:
+    """Solve in the basis, over the cubature elements once they are fitted.
+
+    The first run with a given basis solves on the full mesh and fits the
+    cubature to its iterates; later runs only evaluate the cubature elements.
+    """
+    basis: np.ndarray = load_basis(cfg, model, tetmesh)
+    energies: list[sim.ElementEnergy] = [
+        sim.TetArap.from_pyvista(tetmesh),
+        sim.EdgeSprings.from_pyvista(surface_edges(tetmesh)),
+    ]
+    cubature: list[sim.Cubature] | None = load_cubature(cfg, tetmesh, energies)
+    if cubature is None:
+        reduced = sim.ReducedModel(model, basis)
+        samples: list[np.ndarray] = []
+        with profiling.step("solve"):
+            reduced.solve(callback=samples.append)
+        with profiling.step("cubature"):
+            save_cubature(cfg, tetmesh, sim.fit_cubature(reduced, energies, samples))
+    else:
+        reduced = sim.ReducedModel(model, basis, cubature=cubature)
+        with profiling.step("solve"):
+            reduced.solve()
+    tetmesh.point_data["Displacement"] = model.u_full[tetmesh.point_data[POINT_ID]]  # pyright: ignore[reportArgumentType]
+    melon.save(cfg.output_reduced, tetmesh)
+    return tetmesh
+
+
+@profiling.profiled
+def main(cfg: Config) -> None:
+    if cfg.reduced and cfg.multires:
+        msg: str = "`reduced` and `multires` both provide the initial guess of the fine solve, set only one"
+        raise ValueError(msg)
+    with profiling.step("load"):
+        tetmesh: pv.UnstructuredGrid = io.load_artifact(cfg.tetmesh)  # pyright: ignore[reportAssignmentType]
+    model: Model
+    with profiling.step("build"):
+        model, tetmesh = build_model(tetmesh)
+    ic(model)
+
+    if cfg.reduced:
+        with profiling.step("reduced"):
+            tetmesh = solve_reduced(cfg, model, tetmesh)
+        if not cfg.refine:
+            return
+    elif cfg.multires:
+        if cfg.cold_start_baseline:
+            solve_cold_start(tetmesh.copy())
+        with profiling.step("coarse"):
+            coarse: pv.UnstructuredGrid = solve_coarse(
+                tetmesh,
+                melon.load_unstructured_grid(
+                    cfg.coarse or cherries.input("10-tetmesh-coarse.vtu")
+                ),
+            )
+        melon.save(cherries.temp("20-coarse.vtu"), coarse)
+        with profiling.step("transfer"):
+            tetmesh = sim.prolongate(coarse, tetmesh, data="Displacement")
+        u_full = jnp.zeros_like(model.u_full)
+        u_full = u_full.at[tetmesh.point_data[POINT_ID]].set(
+            tetmesh.point_data["Displacement"]
+        )
+        model.update(model.dirichlet.set_dirichlet(u_full))
+
+    forward = Forward(
+        model,
+        optimizer=ScipyOptimizer(method="trust-constr", options={"verbose": 3}),
+    )
+
+    with profiling.step("solve"):
+        solution: ScipyOptimizer.Solution = forward.step()
     ic(solution)
+    logger.info(
+        "fine solve (%s start): %d iterations, %g s",
+        "warm" if cfg.reduced or cfg.multires else "cold",
+        solution.state.result["nit"],
+        solution.stats.time,
+    )
     tetmesh.point_data["Displacement"] = model.u_full[tetmesh.point_data[POINT_ID]]  # pyright: ignore[reportArgumentType]
-    melon.save(cfg.output, tetmesh)
+    with profiling.step("save"):
+        melon.save(cfg.output, tetmesh)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,10 @@
 from pathlib import Path
 
+import polars as pl
 import pyvista as pv
 
 from liblaf import cherries, melon
+from liblaf.plastic_surgery import metrics
 
 
 class Config(cherries.BaseConfig):
@@ -10,20 +12,29 @@ class Config(cherries.BaseConfig):
     truth: Path = cherries.input("00-post-skin.vtp")
 
     output: Path = cherries.output("21-evaluation.vtp")
+    output_skin: Path = cherries.output("21-evaluation-skin.vtp")
+    output_table: Path = cherries.output("21-evaluation.csv")
 
 
 def main(cfg: Config) -> None:
-    tetmesh: pv.UnstructuredGrid = melon.load_unstructured_grid(cfg.predict)
-    surface: pv.PolyData = tetmesh.extract_surface()  # pyright: ignore[reportAssignmentType]
-    surface.warp_by_vector("Displacement", inplace=True)
+    surface: pv.PolyData = metrics.load_prediction_surface(cfg.predict)
     truth: pv.PolyData = melon.load_polydata(cfg.truth)
 
-    nearest: melon.NearestPointOnSurfaceResult = melon.nearest_point_on_surface(
-        truth, surface, distance_threshold=1.0, normal_threshold=None
+    # whole boundary surface, as before the skin-only metrics
+    surface.point_data["Error"] = metrics.surface_distance(truth, surface)
+    melon.save(cfg.output, surface)
+
+    skin: pv.PolyData = melon.tri.extract_points(surface, surface.point_data["IsSkin"])
+    evaluation = metrics.SurfaceEvaluation(
+        skin, truth, regions=metrics.prediction_regions(skin)
     )
-    surface.point_data["Error"] = nearest.distance
+    skin.point_data["Error"] = evaluation.prediction_to_truth
+    summary: dict[str, float] = evaluation.summary()
+    summary.update(metrics.summarize(surface.point_data["Error"], "surface"))
+    ic(summary)
 
-    melon.save(cfg.output, surface)
+    melon.save(cfg.output_skin, skin)
+    metrics.save_table(cfg.output_table, pl.DataFrame([summary]))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,32 @@
+import logging
+from pathlib import Path
+
+import polars as pl
+
+from liblaf import cherries
+from liblaf.plastic_surgery import metrics
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class Config(cherries.BaseConfig):
+    cohort_dir: Path = Path("~/datasets/predict").expanduser()
+
+    output: Path = cherries.output("22-evaluation.parquet")
+
+
+def main(cfg: Config) -> None:
+    cases: dict[str, tuple[Path, Path]] = {}
+    for prediction in sorted(cfg.cohort_dir.glob("*/20-prediction.vtu")):
+        truth: Path = prediction.with_name("00-post-skin.vtp")
+        if not truth.exists():
+            logger.warning("%s: missing ground truth", prediction.parent.name)
+            continue
+        cases[prediction.parent.name] = (prediction, truth)
+    table: pl.DataFrame = metrics.evaluate_cohort(cases)
+    logger.info("%s", table.describe())
+    metrics.save_table(cfg.output, table)
+
+
+if __name__ == "__main__":
+    cherries.main(main)
@@ -1,12 +1,31 @@
+from . import io, metrics, profiling, shape, sim
+from ._discover import find_series, unique_series
 from ._meta import MetaAcquisition, MetaDataset, MetaPatient
+from ._meta_table import MetaTable
+from ._osteotomy import OsteotomyDetector
 from ._reader import DicomReader
+from ._slab import SLAB_SIZE, Slab, SlabReader, contour_slabs, smooth_slabs
 from ._version import __version__, __version_tuple__
 
 __all__ = [
+    "SLAB_SIZE",
     "DicomReader",
     "MetaAcquisition",
     "MetaDataset",
     "MetaPatient",
+    "MetaTable",
+    "OsteotomyDetector",
+    "Slab",
+    "SlabReader",
     "__version__",
     "__version_tuple__",
+    "contour_slabs",
+    "find_series",
+    "io",
+    "metrics",
+    "profiling",
+    "shape",
+    "sim",
+    "smooth_slabs",
+    "unique_series",
 ]
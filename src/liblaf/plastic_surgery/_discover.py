@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Generator, Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ._reader import DicomReader
+
+if TYPE_CHECKING:
+    from _typeshed import StrPath
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def find_series(root: StrPath) -> list[DicomReader]:
+    """Find all DICOM series (folders with a `DIRFILE`) below `root`.
+
+    Folders are returned in sorted order, so `unique_series()` keeps the same
+    copy of a duplicated series on every run.
+    """
+    return [DicomReader(dirfile) for dirfile in sorted(Path(root).rglob("DIRFILE"))]
+
+
+def unique_series(readers: Iterable[DicomReader]) -> Generator[DicomReader]:
+    """Drop series that are exact copies of an earlier one.
+
+    Series are first compared by their UIDs, which only requires `DIRFILE`.
+    Only when the UIDs collide, a sample of the raw pixel data is hashed to
+    confirm the duplicate. Patient IDs and names are deliberately ignored, since
+    they vary across exports.
+    """
+    kept: dict[str, list[DicomReader]] = {}
+    for reader in readers:
+        candidates: list[DicomReader] = kept.setdefault(reader.uid_fingerprint, [])
+        original: DicomReader | None = next(
+            (
+                candidate
+                for candidate in candidates
+                if candidate.pixel_fingerprint == reader.pixel_fingerprint
+            ),
+            None,
+        )
+        if original is not None:
+            logger.warning(
+                "%s (%s): duplicate of %s (%s): %s",
+                reader.patient_id,
+                reader.patient_name,
+                original.patient_id,
+                original.patient_name,
+                reader.folder,
+            )
+            continue
+        candidates.append(reader)
+        yield reader
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from jaxtyping import Integer, Shaped
+
+from ._meta import MetaAcquisition, MetaDataset, MetaPatient
+
+if TYPE_CHECKING:
+    from _typeshed import StrPath
+
+NAIVE: int = np.iinfo(np.int64).min
+
+
+class MetaTable:
+    """Columnar, indexed view of a `MetaDataset`.
+
+    Patients and acquisitions are stored as flat arrays in the order of the
+    source `MetaDataset`, so the conversion is lossless. Sorted indexes make
+    lookups by patient id and by acquisition date logarithmic instead of linear.
+    Datetimes are compared by their wall-clock time, the UTC offset (if any) is
+    kept in a separate column.
+    """
+
+    patient_id: Shaped[np.ndarray, " P"]
+    patient_name: Shaped[np.ndarray, " P"]
+    patient_index: Integer[np.ndarray, " A"]
+    datetime: Shaped[np.ndarray, " A"]
+    utcoffset: Integer[np.ndarray, " A"]
+
+    def __init__(
+        self,
+        *,
+        patient_id: Shaped[np.ndarray, " P"],
+        patient_name: Shaped[np.ndarray, " P"],
+        patient_index: Integer[np.ndarray, " A"],
+        datetime: Shaped[np.ndarray, " A"],
+        utcoffset: Integer[np.ndarray, " A"],
+    ) -> None:
+        self.patient_id = np.asarray(patient_id, dtype=np.str_)
+        self.patient_name = np.asarray(patient_name, dtype=np.str_)
+        self.patient_index = np.asarray(patient_index, dtype=np.int64)
+        self.datetime = np.asarray(datetime, dtype="datetime64[us]")
+        self.utcoffset = np.asarray(utcoffset, dtype=np.int64)
+        # patients sorted by id
+        self._patient_order: Integer[np.ndarray, " P"] = np.argsort(
+            self.patient_id, kind="stable"
+        )
+        # acquisitions grouped by patient, then sorted by date
+        self._acquisition_order: Integer[np.ndarray, " A"] = np.lexsort(
+            (self.datetime, self.patient_index)
+        )
+        self._patient_offset: Integer[np.ndarray, " P+1"] = np.searchsorted(
+            self.patient_index[self._acquisition_order],
+            np.arange(self.n_patients + 1),
+        )
+        # acquisitions sorted by date
+        self._datetime_order: Integer[np.ndarray, " A"] = np.argsort(
+            self.datetime, kind="stable"
+        )
+
+    def __len__(self) -> int:
+        return self.datetime.size
+
+    @property
+    def n_patients(self) -> int:
+        return self.patient_id.size
+
+    @property
+    def acquisition_patient_id(self) -> Shaped[np.ndarray, " A"]:
+        return self.patient_id[self.patient_index]
+
+    @property
+    def path(self) -> Shaped[np.ndarray, " A"]:
+        """Acquisition folders relative to the dataset root: `<patient>/<date>`."""
+        return np.char.add(
+            np.char.add(self.acquisition_patient_id, "/"),
+            np.datetime_as_string(self.datetime, unit="D"),
+        )
+
+    # -------------------------------- Queries ------------------------------- #
+
+    def patient(self, patient_id: str) -> int:
+        i: int = int(
+            np.searchsorted(self.patient_id, patient_id, sorter=self._patient_order)
+        )
+        if i >= self.n_patients or self.patient_id[self._patient_order[i]] != (
+            patient_id
+        ):
+            msg: str = f"unknown patient '{patient_id}'"
+            raise KeyError(msg)
+        return int(self._patient_order[i])
+
+    def acquisitions(self, patient_id: str) -> Integer[np.ndarray, " N"]:
+        """Acquisitions of a patient in chronological order."""
+        p: int = self.patient(patient_id)
+        return self._acquisition_order[
+            self._patient_offset[p] : self._patient_offset[p + 1]
+        ]
+
+    def first(self, patient_id: str) -> int:
+        return int(self._nonempty_acquisitions(patient_id)[0])
+
+    def last(self, patient_id: str) -> int:
+        return int(self._nonempty_acquisitions(patient_id)[-1])
+
+    def between(
+        self,
+        start: datetime.datetime | datetime.date | None = None,
+        stop: datetime.datetime | datetime.date | None = None,
+    ) -> Integer[np.ndarray, " N"]:
+        """Acquisitions with `start <= datetime < stop`, in chronological order."""
+        sorted_datetime: Shaped[np.ndarray, " A"] = self.datetime[self._datetime_order]
+        lo: int = 0
+        hi: int = len(self)
+        if start is not None:
+            lo = int(np.searchsorted(sorted_datetime, _as_datetime64(start), "left"))
+        if stop is not None:
+            hi = int(np.searchsorted(sorted_datetime, _as_datetime64(stop), "left"))
+        return self._datetime_order[lo:hi]
+
+    def _nonempty_acquisitions(self, patient_id: str) -> Integer[np.ndarray, " N"]:
+        acquisitions: Integer[np.ndarray, " N"] = self.acquisitions(patient_id)
+        if acquisitions.size == 0:
+            msg: str = f"patient '{patient_id}' has no acquisitions"
+            raise KeyError(msg)
+        return acquisitions
+
+    # ------------------------------ Conversion ------------------------------ #
+
+    @classmethod
+    def from_dataset(cls, dataset: MetaDataset) -> MetaTable:
+        patient_id: list[str] = []
+        patient_name: list[str] = []
+        patient_index: list[int] = []
+        datetimes: list[np.datetime64] = []
+        utcoffset: list[int] = []
+        for key, patient in dataset.patients.items():
+            if patient.id != key:
+                msg: str = f"patient key '{key}' does not match id '{patient.id}'"
+                raise ValueError(msg)
+            patient_index.extend([len(patient_id)] * len(patient.acquisitions))
+            patient_id.append(patient.id)
+            patient_name.append(patient.name)
+            for acquisition in patient.acquisitions:
+                offset: datetime.timedelta | None = acquisition.datetime.utcoffset()
+                datetimes.append(_as_datetime64(acquisition.datetime))
+                utcoffset.append(
+                    NAIVE if offset is None else int(offset.total_seconds())
+                )
+        return cls(
+            patient_id=np.asarray(patient_id, dtype=np.str_),
+            patient_name=np.asarray(patient_name, dtype=np.str_),
+            patient_index=np.asarray(patient_index, dtype=np.int64),
+            datetime=np.asarray(datetimes, dtype="datetime64[us]"),
+            utcoffset=np.asarray(utcoffset, dtype=np.int64),
+        )
+
+    def to_dataset(self) -> MetaDataset:
+        patients: list[MetaPatient] = [
+            MetaPatient(id=str(patient_id), name=str(patient_name))
+            for patient_id, patient_name in zip(
+                self.patient_id, self.patient_name, strict=True
+            )
+        ]
+        for p, dt, offset in zip(
+            self.patient_index.tolist(),
+            self.datetime.astype(datetime.datetime).tolist(),
+            self.utcoffset.tolist(),
+            strict=True,
+        ):
+            if offset != NAIVE:
+                dt = dt.replace(  # noqa: PLW2901
+                    tzinfo=datetime.timezone(datetime.timedelta(seconds=offset))
+                )
+            patients[p].acquisitions.append(MetaAcquisition(datetime=dt))
+        return MetaDataset(patients={patient.id: patient for patient in patients})
+
+    @classmethod
+    def load(cls, path: StrPath) -> MetaTable:
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                patient_id=data["patient_id"],
+                patient_name=data["patient_name"],
+                patient_index=data["patient_index"],
+                datetime=data["datetime"],
+                utcoffset=data["utcoffset"],
+            )
+
+    def save(self, path: StrPath) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as fp:
+            np.savez(
+                fp,
+                patient_id=self.patient_id,
+                patient_name=self.patient_name,
+                patient_index=self.patient_index,
+                datetime=self.datetime,
+                utcoffset=self.utcoffset,
+            )
+
+
+def _as_datetime64(value: datetime.datetime | datetime.date) -> np.datetime64:
+    if isinstance(value, datetime.datetime):
+        value = value.replace(tzinfo=None)
+    return np.datetime64(value, "us")
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pyvista as pv
+import trimesh as tm
+from jaxtyping import Bool, Float, Integer
+
+from liblaf import melon
+
+if TYPE_CHECKING:
+    from _typeshed import StrPath
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class OsteotomyDetector:
+    """Cells of the pre-operative mandible that moved during the osteotomy.
+
+    The post-operative mandible is aligned to the pre-operative one by ICP on
+    `n_samples` vertices of each, then the distance from every pre-operative
+    cell center to the aligned surface is computed once. Thresholding is
+    cheap, so `mask()` can be called with any number of thresholds. `load()`
+    and `save()` keep the alignment and the distances across runs.
+    """
+
+    pre_mandible: pv.PolyData
+    post_mandible: pv.PolyData
+    n_samples: int
+    seed: int
+
+    def __init__(
+        self,
+        pre_mandible: pv.PolyData,
+        post_mandible: pv.PolyData,
+        *,
+        n_samples: int = 10000,
+        seed: int = 0,
+    ) -> None:
+        self.pre_mandible = pre_mandible
+        self.post_mandible = post_mandible
+        self.n_samples = n_samples
+        self.seed = seed
+
+    @functools.cached_property
+    def fingerprint(self) -> str:
+        """Hash of both meshes and the sampling parameters."""
+        digest = hashlib.sha256(f"{self.n_samples}:{self.seed}".encode())
+        for mesh in (self.pre_mandible, self.post_mandible):
+            digest.update(b"\0")
+            digest.update(np.ascontiguousarray(mesh.points).tobytes())
+            digest.update(np.ascontiguousarray(mesh.faces).tobytes())
+        return digest.hexdigest()
+
+    @functools.cached_property
+    def alignment(self) -> tuple[Float[np.ndarray, "4 4"], float]:
+        """Rigid transform from the post- to the pre-operative mandible, and its ICP cost."""
+        rng: np.random.Generator = np.random.default_rng(self.seed)
+        matrix: Float[np.ndarray, "4 4"]
+        cost: float
+        matrix, _, cost = tm.registration.icp(
+            _subsample(self.post_mandible.points, self.n_samples, rng),
+            _subsample(self.pre_mandible.points, self.n_samples, rng),
+            reflection=False,
+            translation=True,
+            scale=False,
+        )
+        logger.info("ICP cost: %g", cost)
+        return matrix, cost
+
+    @functools.cached_property
+    def aligned(self) -> pv.PolyData:
+        return self.post_mandible.transform(self.alignment[0], inplace=False)  # pyright: ignore[reportReturnType]
+
+    @functools.cached_property
+    def distance(self) -> Float[np.ndarray, " cells"]:
+        """Distance from every pre-operative cell center to the aligned surface."""
+        nearest: melon.NearestPointOnSurfaceResult = melon.nearest_point_on_surface(
+            self.aligned,
+            self.pre_mandible.cell_centers(),
+            distance_threshold=np.inf,
+            normal_threshold=None,
+        )
+        return nearest.distance
+
+    def mask(self, threshold: float) -> Bool[np.ndarray, " cells"]:
+        """Cells farther than `threshold` from the aligned surface, except `Floating` ones."""
+        mask: Bool[np.ndarray, " cells"] = self.distance > threshold
+        if "Floating" in self.pre_mandible.cell_data:
+            mask &= ~np.asarray(self.pre_mandible.cell_data["Floating"], dtype=bool)
+        return mask
+
+    def load(self, path: StrPath) -> bool:
+        """Restore the alignment and distances saved for the same inputs.
+
+        Returns:
+            Whether the cache at `path` matched and was restored.
+        """
+        path = Path(path)
+        if not path.exists():
+            return False
+        with np.load(path) as data:
+            if str(data["fingerprint"]) != self.fingerprint:
+                return False
+            self.alignment = (data["matrix"], float(data["cost"]))
+            self.distance = data["distance"]
+        return True
+
+    def save(self, path: StrPath) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        matrix: Float[np.ndarray, "4 4"]
+        cost: float
+        matrix, cost = self.alignment
+        with path.open("wb") as fp:
+            np.savez(
+                fp,
+                fingerprint=self.fingerprint,
+                matrix=matrix,
+                cost=cost,
+                distance=self.distance,
+            )
+
+
+def _subsample(
+    points: Float[np.ndarray, "N 3"], n_samples: int, rng: np.random.Generator
+) -> Float[np.ndarray, "S 3"]:
+    if points.shape[0] <= n_samples:
+        return points
+    index: Integer[np.ndarray, " S"] = rng.choice(
+        points.shape[0], n_samples, replace=False
+    )
+    return points[index]
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import functools
+import hashlib
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pydicom
 import pydicom.valuerep
-import pyvista as pv
 
 if TYPE_CHECKING:
+    import pyvista as pv
     from _typeshed import StrPath
 
+PIXEL_SAMPLES: int = 3
+
 
 class DicomReader:
     folder: Path
@@ -33,10 +36,79 @@ class DicomReader:
             / self.dirfile["DirectoryRecordSequence"][0]["ReferencedFileID"][-1]
         )
 
+    @functools.cached_property
+    def records(self) -> list[pydicom.Dataset]:
+        return [
+            record
+            for record in self.dirfile["DirectoryRecordSequence"]
+            if "ReferencedFileID" in record
+        ]
+
     @functools.cached_property
     def image_data(self) -> pv.ImageData:
+        import pyvista as pv
+
         return pv.read(self.folder, force_ext=".dcm")  # pyright: ignore[reportReturnType]
 
+    # ----------------------------- Fingerprints ----------------------------- #
+
+    @functools.cached_property
+    def series_instance_uid(self) -> str:
+        return self.first_record["SeriesInstanceUID"].value
+
+    @functools.cached_property
+    def sop_instance_uids(self) -> list[str]:
+        return [self._sop_instance_uid(record) for record in self.records]
+
+    @functools.cached_property
+    def uid_fingerprint(self) -> str:
+        """Hash of the series UID and all SOP instance UIDs, read from `DIRFILE`."""
+        digest = hashlib.sha256(self.series_instance_uid.encode())
+        for uid in sorted(self.sop_instance_uids):
+            digest.update(b"\0")
+            digest.update(uid.encode())
+        return digest.hexdigest()
+
+    @functools.cached_property
+    def pixel_fingerprint(self) -> str:
+        """Hash of the raw pixel data of a few instances, without decoding them.
+
+        Instances are sampled by SOP instance UID, so the same series exported
+        under different file names yields the same fingerprint.
+        """
+        records: list[pydicom.Dataset] = [
+            record
+            for _, record in sorted(
+                zip(self.sop_instance_uids, self.records, strict=True),
+                key=lambda item: item[0],
+            )
+        ]
+        n: int = len(records)
+        if n == 0:
+            msg: str = f"series has no image records: {self.folder}"
+            raise ValueError(msg)
+        samples: list[int] = sorted(
+            {i * (n - 1) // max(PIXEL_SAMPLES - 1, 1) for i in range(PIXEL_SAMPLES)}
+        )
+        digest = hashlib.sha256()
+        for i in samples:
+            instance: pydicom.FileDataset = pydicom.dcmread(
+                self.record_path(records[i])
+            )
+            digest.update(instance["PixelData"].value)
+        return digest.hexdigest()
+
+    def record_path(self, record: pydicom.Dataset) -> Path:
+        return self.folder / record["ReferencedFileID"][-1]
+
+    def _sop_instance_uid(self, record: pydicom.Dataset) -> str:
+        if "ReferencedSOPInstanceUIDInFile" in record:
+            return record["ReferencedSOPInstanceUIDInFile"].value
+        instance: pydicom.FileDataset = pydicom.dcmread(
+            self.record_path(record), stop_before_pixels=True
+        )
+        return instance["SOPInstanceUID"].value
+
     # ------------------------------- Metadata ------------------------------- #
 
     @functools.cached_property
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import functools
+from collections.abc import Generator, Iterable, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+import pydicom
+import scipy.ndimage
+from jaxtyping import Float, Int16
+
+from . import profiling
+from ._reader import DicomReader
+
+if TYPE_CHECKING:
+    import pyvista as pv
+    from _typeshed import StrPath
+
+SCALARS: str = "DICOMImage"
+SLAB_SIZE: int = 32
+
+
+class Slab(NamedTuple):
+    """Slices `start : start + len(data)` of a volume, indexed as `[z, y, x]`."""
+
+    start: int
+    data: np.ndarray
+
+    @property
+    def stop(self) -> int:
+        return self.start + self.data.shape[0]
+
+
+class SlabReader:
+    """Read a DICOM series a few slices at a time.
+
+    Slices are decoded on demand and stored as rescaled Hounsfield units in
+    `int16`. The layout matches `DicomReader.image_data`: slices are ordered
+    along the negative slice normal, rows are flipped and the origin is zero,
+    so surfaces extracted from slabs line up with surfaces extracted from the
+    whole volume.
+    """
+
+    reader: DicomReader
+
+    def __init__(self, path: StrPath | DicomReader) -> None:
+        if isinstance(path, DicomReader):
+            self.reader = path
+        else:
+            self.reader = DicomReader(path)
+
+    @functools.cached_property
+    def headers(self) -> list[pydicom.Dataset]:
+        headers: list[pydicom.Dataset] = [
+            pydicom.dcmread(self.reader.record_path(record), stop_before_pixels=True)
+            for record in self.reader.records
+        ]
+        position: Float[np.ndarray, " Z"] = np.asarray(
+            [self._position(header) for header in headers]
+        )
+        return [headers[i] for i in np.argsort(-position, kind="stable")]
+
+    @functools.cached_property
+    def paths(self) -> list[Path]:
+        return [Path(header.filename) for header in self.headers]  # pyright: ignore[reportArgumentType]
+
+    @property
+    def dimensions(self) -> tuple[int, int, int]:
+        first: pydicom.Dataset = self.headers[0]
+        return (int(first.Columns), int(first.Rows), len(self.headers))
+
+    @functools.cached_property
+    def spacing(self) -> tuple[float, float, float]:
+        first: pydicom.Dataset = self.headers[0]
+        row_spacing, col_spacing = (float(s) for s in first.PixelSpacing)
+        if len(self.headers) < 2:
+            slice_spacing: float = float(first.get("SliceThickness", 1.0))
+        else:
+            slice_spacing = abs(
+                self._position(self.headers[0]) - self._position(self.headers[-1])
+            ) / (len(self.headers) - 1)
+        return (col_spacing, row_spacing, slice_spacing)
+
+    @property
+    def origin(self) -> tuple[float, float, float]:
+        return (0.0, 0.0, 0.0)
+
+    def __len__(self) -> int:
+        return len(self.headers)
+
+    def read(self, start: int, stop: int) -> Int16[np.ndarray, "z y x"]:
+        start = max(start, 0)
+        stop = min(stop, len(self))
+        nx, ny, _ = self.dimensions
+        data: Int16[np.ndarray, "z y x"] = np.empty((stop - start, ny, nx), np.int16)
+        with profiling.step("load"):
+            for i in range(start, stop):
+                instance: pydicom.FileDataset = pydicom.dcmread(self.paths[i])
+                pixels: np.ndarray = instance.pixel_array.astype(np.float32)
+                pixels *= float(instance.get("RescaleSlope", 1.0))
+                pixels += float(instance.get("RescaleIntercept", 0.0))
+                np.rint(pixels, out=pixels)
+                np.clip(
+                    pixels, np.iinfo(np.int16).min, np.iinfo(np.int16).max, out=pixels
+                )
+                data[i - start] = pixels[::-1]
+        return data
+
+    def slabs(self, size: int = SLAB_SIZE, halo: int = 0) -> Generator[Slab]:
+        """Yield slabs of `size` slices, extended by up to `halo` on either side."""
+        for start in range(0, len(self), size):
+            first: int = max(start - halo, 0)
+            yield Slab(first, self.read(first, start + size + halo))
+
+    def to_pyvista(self, slab: Slab) -> pv.ImageData:
+        import pyvista as pv
+
+        nx, ny, _ = self.dimensions
+        spacing: tuple[float, float, float] = self.spacing
+        image = pv.ImageData(
+            dimensions=(nx, ny, slab.data.shape[0]),
+            spacing=spacing,
+            origin=(
+                self.origin[0],
+                self.origin[1],
+                self.origin[2] + slab.start * spacing[2],
+            ),
+        )
+        image.point_data[SCALARS] = slab.data.ravel()
+        return image
+
+    def _position(self, header: pydicom.Dataset) -> float:
+        orientation: Float[np.ndarray, " 6"] = np.asarray(
+            header.get("ImageOrientationPatient", [1.0, 0.0, 0.0, 0.0, 1.0, 0.0]),
+            dtype=float,
+        )
+        normal: Float[np.ndarray, " 3"] = np.cross(orientation[:3], orientation[3:])
+        return float(np.dot(np.asarray(header.ImagePositionPatient, float), normal))
+
+
+def smooth_slabs(
+    reader: SlabReader,
+    *,
+    size: int = SLAB_SIZE,
+    std_dev: float = 2.0,
+    radius_factor: float = 1.5,
+) -> Generator[Slab]:
+    """Gaussian smoothing of the volume, one slab at a time.
+
+    Each slab is read with a halo of `radius` slices, so the result does not
+    depend on `size`. Smoothed values are `float32`.
+    """
+    radius: int = int(radius_factor * std_dev + 0.5)
+    for start, slab in zip(
+        range(0, len(reader), size), reader.slabs(size, radius), strict=True
+    ):
+        with profiling.step("smooth"):
+            smoothed: Float[np.ndarray, "z y x"] = scipy.ndimage.gaussian_filter(
+                slab.data.astype(np.float32),
+                std_dev,
+                mode="nearest",
+                truncate=radius_factor,
+            )
+        yield Slab(start, smoothed[start - slab.start :][:size])
+
+
+def contour_slabs(
+    reader: SlabReader, slabs: Iterable[Slab], isosurfaces: Sequence[float]
+) -> list[pv.PolyData]:
+    """Marching cubes over consecutive slabs, stitched into one surface per value.
+
+    Consecutive slabs are contoured with one shared slice, so the pieces meet
+    exactly and are merged into a single surface.
+    """
+    import pyvista as pv
+
+    pieces: list[list[pv.PolyData]] = [[] for _ in isosurfaces]
+    previous: Slab | None = None
+    for slab in slabs:
+        current: Slab = slab
+        if previous is not None:
+            current = Slab(
+                previous.stop - 1, np.concatenate([previous.data[-1:], slab.data])
+            )
+        previous = slab
+        if current.data.shape[0] < 2:
+            continue
+        with profiling.step("contour"):
+            image: pv.ImageData = reader.to_pyvista(current)
+            for i, value in enumerate(isosurfaces):
+                piece: pv.PolyData = image.contour([value], scalars=SCALARS)  # pyright: ignore[reportAssignmentType]
+                if piece.n_points > 0:
+                    pieces[i].append(piece)
+    tolerance: float = 1e-6 * min(reader.spacing)
+    surfaces: list[pv.PolyData] = []
+    with profiling.step("merge"):
+        for values in pieces:
+            if not values:
+                surfaces.append(pv.PolyData())
+                continue
+            surface: pv.PolyData = pv.merge(values, merge_points=False)  # pyright: ignore[reportAssignmentType]
+            surfaces.append(surface.clean(tolerance=tolerance, absolute=True))
+    return surfaces
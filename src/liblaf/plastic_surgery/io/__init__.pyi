@@ -0,0 +1,11 @@
+from ._artifact import Artifact, ArtifactArrays, load_artifact, save_artifact
+from ._lazy import LazyArrays, LazyMesh
+
+__all__ = [
+    "Artifact",
+    "ArtifactArrays",
+    "LazyArrays",
+    "LazyMesh",
+    "load_artifact",
+    "save_artifact",
+]
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import functools
+import json
+import os
+import shutil
+import urllib.parse
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+import pyvista as pv
+
+if TYPE_CHECKING:
+    from _typeshed import StrPath
+
+type Association = Literal["point_data", "cell_data", "field_data"]
+
+HEADER: str = "header.json"
+VERSION: int = 1
+ASSOCIATIONS: tuple[Association, ...] = ("point_data", "cell_data", "field_data")
+ACTIVE: tuple[str, ...] = ("scalars", "vectors", "normals", "texture_coordinates")
+STRUCTURE: dict[str, tuple[str, ...]] = {
+    "PolyData": ("points", "verts", "lines", "faces", "strips"),
+    "UnstructuredGrid": ("points", "cells", "celltypes"),
+}
+
+
+class ArtifactArrays(Mapping[str, np.ndarray]):
+    """Read-only view of one association of an artifact.
+
+    Arrays are memory-mapped on first access, so only the pages that are actually
+    touched are read from disk.
+    """
+
+    artifact: Artifact
+    association: Association
+
+    def __init__(self, artifact: Artifact, association: Association) -> None:
+        self.artifact = artifact
+        self.association = association
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.artifact.load_array(self.association, name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.artifact.header[self.association])
+
+    def __len__(self) -> int:
+        return len(self.artifact.header[self.association])
+
+
+class Artifact:
+    """A mesh stored as a directory of raw `.npy` arrays plus a JSON header.
+
+    ```
+    10-tetmesh.artifact/
+    ├── header.json
+    ├── points.npy
+    ├── cells.npy
+    ├── celltypes.npy
+    ├── point_data/<name>.npy
+    └── cell_data/<name>.npy
+    ```
+
+    Fields can be appended with `add()` without touching the existing arrays.
+    """
+
+    path: Path
+
+    def __init__(self, path: StrPath) -> None:
+        self.path = Path(path)
+
+    @functools.cached_property
+    def header(self) -> dict[str, Any]:
+        return json.loads((self.path / HEADER).read_text())
+
+    @property
+    def kind(self) -> str:
+        return self.header["type"]
+
+    @property
+    def n_points(self) -> int:
+        return self.header["n_points"]
+
+    @property
+    def n_cells(self) -> int:
+        return self.header["n_cells"]
+
+    @property
+    def points(self) -> np.ndarray:
+        return self.load_array(None, "points")
+
+    @property
+    def point_data(self) -> ArtifactArrays:
+        return ArtifactArrays(self, "point_data")
+
+    @property
+    def cell_data(self) -> ArtifactArrays:
+        return ArtifactArrays(self, "cell_data")
+
+    @property
+    def field_data(self) -> ArtifactArrays:
+        return ArtifactArrays(self, "field_data")
+
+    def load_array(self, association: Association | None, name: str) -> np.ndarray:
+        if association is None:
+            filename: str = self.header["structure"][name]
+        else:
+            filename = self.header[association][name]
+        return np.load(self.path / filename, mmap_mode="r")
+
+    def add(self, association: Association, name: str, value: Any, /) -> None:
+        """Append (or replace) a single field and update the header in place."""
+        value = np.asarray(value)
+        expected: int | None = {
+            "point_data": self.n_points,
+            "cell_data": self.n_cells,
+        }.get(association)
+        if expected is not None and value.shape[:1] != (expected,):
+            msg: str = f"{association} '{name}' has shape {value.shape}, expected ({expected}, ...)"
+            raise ValueError(msg)
+        filename: str = f"{association}/{_quote(name)}.npy"
+        _save_array(self.path / filename, value)
+        header: dict[str, Any] = self.header
+        header[association][name] = filename
+        _write_header(self.path, header)
+
+    def link(self, path: StrPath) -> Artifact:
+        """Create a copy at `path` that shares array files with this artifact.
+
+        Array files are hard-linked when possible, so the copy is cheap and
+        appending to it does not affect the original.
+        """
+        path = Path(path)
+        if path.exists():
+            shutil.rmtree(path)
+        shutil.copytree(self.path, path, copy_function=_link_or_copy)
+        return Artifact(path)
+
+    def to_pyvista(
+        self,
+        point_data: Iterable[str] | None = None,
+        cell_data: Iterable[str] | None = None,
+        field_data: Iterable[str] | None = None,
+    ) -> pv.PolyData | pv.UnstructuredGrid:
+        """Convert to PyVista, optionally keeping only the named fields."""
+        structure: dict[str, np.ndarray] = {
+            name: np.asarray(self.load_array(None, name))
+            for name in self.header["structure"]
+        }
+        mesh: pv.PolyData | pv.UnstructuredGrid
+        match self.kind:
+            case "PolyData":
+                mesh = pv.PolyData(
+                    structure["points"],
+                    verts=structure["verts"],
+                    lines=structure["lines"],
+                    faces=structure["faces"],
+                    strips=structure["strips"],
+                )
+            case "UnstructuredGrid":
+                mesh = pv.UnstructuredGrid(
+                    structure["cells"], structure["celltypes"], structure["points"]
+                )
+            case kind:
+                msg: str = f"unknown artifact kind: {kind}"
+                raise ValueError(msg)
+        for name in self.point_data if point_data is None else point_data:
+            mesh.point_data[name] = np.asarray(self.point_data[name])
+        for name in self.cell_data if cell_data is None else cell_data:
+            mesh.cell_data[name] = np.asarray(self.cell_data[name])
+        for name in self.field_data if field_data is None else field_data:
+            mesh.field_data[name] = np.asarray(self.field_data[name])
+        for association, active in self.header.get("active", {}).items():
+            attributes: pv.DataSetAttributes = getattr(mesh, association)
+            for attribute, name in active.items():
+                if name in attributes:
+                    setattr(attributes, f"active_{attribute}_name", name)
+        return mesh
+
+
+def save_artifact(path: StrPath, mesh: pv.PolyData | pv.UnstructuredGrid) -> Artifact:
+    path = Path(path)
+    kind: str = type(mesh).__name__
+    if kind not in STRUCTURE:
+        msg: str = f"unknown artifact kind: {kind}"
+        raise ValueError(msg)
+    if path.exists():
+        shutil.rmtree(path)
+    path.mkdir(parents=True)
+    header: dict[str, Any] = {
+        "version": VERSION,
+        "type": kind,
+        "n_points": mesh.n_points,
+        "n_cells": mesh.n_cells,
+        "structure": {},
+        **{association: {} for association in ASSOCIATIONS},
+        "active": {
+            association: {
+                attribute: name
+                for attribute in ACTIVE
+                if (
+                    name := getattr(
+                        getattr(mesh, association), f"active_{attribute}_name"
+                    )
+                )
+            }
+            for association in ("point_data", "cell_data")
+        },
+    }
+    for name in STRUCTURE[kind]:
+        filename: str = f"{name}.npy"
+        _save_array(path / filename, getattr(mesh, name))
+        header["structure"][name] = filename
+    for association in ASSOCIATIONS:
+        arrays: Mapping[str, np.ndarray] = getattr(mesh, association)
+        for name, value in arrays.items():
+            filename = f"{association}/{_quote(name)}.npy"
+            _save_array(path / filename, value)
+            header[association][name] = filename
+    _write_header(path, header)
+    return Artifact(path)
+
+
+def load_artifact(path: StrPath) -> pv.PolyData | pv.UnstructuredGrid:
+    return Artifact(path).to_pyvista()
+
+
+def _quote(name: str) -> str:
+    return urllib.parse.quote(name, safe="")
+
+
+def _save_array(path: Path, value: Any) -> None:
+    value = np.asarray(value)
+    if value.dtype.hasobject:
+        msg: str = f"cannot store object array: '{path}'"
+        raise TypeError(msg)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # never write through a hard link shared with another artifact
+    path.unlink(missing_ok=True)
+    np.save(path, value, allow_pickle=False)
+
+
+def _write_header(path: Path, header: Mapping[str, Any]) -> None:
+    tmp: Path = path / f"{HEADER}.tmp"
+    tmp.write_text(json.dumps(header, indent=2))
+    tmp.replace(path / HEADER)
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    if Path(src).name == HEADER:
+        shutil.copy2(src, dst)
+        return
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
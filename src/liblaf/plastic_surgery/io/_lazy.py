@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import functools
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+import pyvista as pv
+
+from ._artifact import Artifact
+
+if TYPE_CHECKING:
+    from _typeshed import StrPath
+
+type LazyAssociation = Literal["point_data", "cell_data"]
+
+
+class LazyArrays(Mapping[str, np.ndarray]):
+    """Point or cell arrays of a `LazyMesh`, decoded on first access."""
+
+    mesh: LazyMesh
+    association: LazyAssociation
+
+    def __init__(self, mesh: LazyMesh, association: LazyAssociation) -> None:
+        self.mesh = mesh
+        self.association = association
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        if name not in self.names:
+            raise KeyError(name)
+        return self.mesh.load(**{self.association: [name]})[self.association][name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def names(self) -> list[str]:
+        if self.association == "point_data":
+            return self.mesh.point_array_names
+        return self.mesh.cell_array_names
+
+
+class LazyMesh:
+    """A VTK XML mesh (`.vtu`, `.vtp`) or artifact that is read piece by piece.
+
+    The geometry and connectivity are read once, without any data arrays. Named
+    point and cell arrays are decoded only when they are first accessed, then
+    cached. Request several arrays together with `load()` to decode them in a
+    single pass over the file.
+
+    Examples:
+        >>> mesh = LazyMesh("20-prediction.vtu")  # doctest: +SKIP
+        >>> surface = mesh.to_pyvista(point_data=["Displacement"])  # doctest: +SKIP
+    """
+
+    path: Path
+    _point_data: dict[str, np.ndarray]
+    _cell_data: dict[str, np.ndarray]
+
+    def __init__(self, path: StrPath) -> None:
+        self.path = Path(path)
+        self._point_data = {}
+        self._cell_data = {}
+
+    @functools.cached_property
+    def artifact(self) -> Artifact | None:
+        if self.path.is_dir():
+            return Artifact(self.path)
+        return None
+
+    @functools.cached_property
+    def reader(self) -> pv.BaseVTKReader:
+        return pv.get_reader(self.path)  # pyright: ignore[reportReturnType]
+
+    @functools.cached_property
+    def point_array_names(self) -> list[str]:
+        if self.artifact is not None:
+            return list(self.artifact.point_data)
+        return list(self.reader.point_array_names)  # pyright: ignore[reportAttributeAccessIssue]
+
+    @functools.cached_property
+    def cell_array_names(self) -> list[str]:
+        if self.artifact is not None:
+            return list(self.artifact.cell_data)
+        return list(self.reader.cell_array_names)  # pyright: ignore[reportAttributeAccessIssue]
+
+    @functools.cached_property
+    def geometry(self) -> pv.DataSet:
+        if self.artifact is not None:
+            return self.artifact.to_pyvista(point_data=(), cell_data=(), field_data=())
+        return self._read(point_data=(), cell_data=())
+
+    @property
+    def n_points(self) -> int:
+        return self.geometry.n_points
+
+    @property
+    def n_cells(self) -> int:
+        return self.geometry.n_cells
+
+    @property
+    def points(self) -> np.ndarray:
+        return self.geometry.points
+
+    @property
+    def point_data(self) -> LazyArrays:
+        return LazyArrays(self, "point_data")
+
+    @property
+    def cell_data(self) -> LazyArrays:
+        return LazyArrays(self, "cell_data")
+
+    def load(
+        self, point_data: Iterable[str] = (), cell_data: Iterable[str] = ()
+    ) -> dict[LazyAssociation, dict[str, np.ndarray]]:
+        point_data = [name for name in point_data if name not in self._point_data]
+        cell_data = [name for name in cell_data if name not in self._cell_data]
+        if point_data or cell_data:
+            if self.artifact is not None:
+                for name in point_data:
+                    self._point_data[name] = self.artifact.point_data[name]
+                for name in cell_data:
+                    self._cell_data[name] = self.artifact.cell_data[name]
+            else:
+                mesh: pv.DataSet = self._read(
+                    point_data=point_data, cell_data=cell_data
+                )
+                # take the arrays before `clear_data()` below: the shallow copy
+                # shares PyVista's record of which arrays are boolean
+                for name in point_data:
+                    self._point_data[name] = mesh.point_data[name]
+                for name in cell_data:
+                    self._cell_data[name] = mesh.cell_data[name]
+                if "geometry" not in self.__dict__:
+                    # reuse this pass instead of reading the connectivity twice
+                    geometry: pv.DataSet = mesh.copy(deep=False)
+                    geometry.clear_data()
+                    self.geometry = geometry
+        return {"point_data": self._point_data, "cell_data": self._cell_data}
+
+    def to_pyvista(
+        self, point_data: Iterable[str] = (), cell_data: Iterable[str] = ()
+    ) -> pv.DataSet:
+        """Return a mesh with only the requested arrays attached."""
+        point_data = list(point_data)
+        cell_data = list(cell_data)
+        arrays: dict[LazyAssociation, dict[str, np.ndarray]] = self.load(
+            point_data=point_data, cell_data=cell_data
+        )
+        # share the connectivity, but never the points, which callers may warp
+        mesh: pv.DataSet = self.geometry.copy(deep=False)
+        mesh.points = self.geometry.points.copy()
+        for name in point_data:
+            mesh.point_data[name] = np.asarray(arrays["point_data"][name])
+        for name in cell_data:
+            mesh.cell_data[name] = np.asarray(arrays["cell_data"][name])
+        return mesh
+
+    def _read(self, point_data: Iterable[str], cell_data: Iterable[str]) -> pv.DataSet:
+        reader = self.reader
+        reader.disable_all_point_arrays()  # pyright: ignore[reportAttributeAccessIssue]
+        reader.disable_all_cell_arrays()  # pyright: ignore[reportAttributeAccessIssue]
+        for name in point_data:
+            reader.enable_point_array(name)  # pyright: ignore[reportAttributeAccessIssue]
+        for name in cell_data:
+            reader.enable_cell_array(name)  # pyright: ignore[reportAttributeAccessIssue]
+        return reader.read()  # pyright: ignore[reportReturnType]
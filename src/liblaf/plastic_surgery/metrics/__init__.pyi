@@ -0,0 +1,21 @@
+from ._cohort import (
+    evaluate_case,
+    evaluate_cohort,
+    load_prediction,
+    load_prediction_surface,
+    prediction_regions,
+    save_table,
+)
+from ._surface import SurfaceEvaluation, summarize, surface_distance
+
+__all__ = [
+    "SurfaceEvaluation",
+    "evaluate_case",
+    "evaluate_cohort",
+    "load_prediction",
+    "load_prediction_surface",
+    "prediction_regions",
+    "save_table",
+    "summarize",
+    "surface_distance",
+]
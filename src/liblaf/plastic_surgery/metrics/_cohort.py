@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+from collections.abc import Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+import polars as pl
+import pyvista as pv
+from jaxtyping import Bool
+
+from liblaf import melon
+
+from ..io import LazyMesh  # noqa: TID252
+from ._surface import DEFAULT_PERCENTILES, SurfaceEvaluation
+
+if TYPE_CHECKING:
+    from _typeshed import StrPath
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def load_prediction_surface(path: StrPath) -> pv.PolyData:
+    """Load the deformed boundary surface of a `20-prediction.vtu` tet mesh."""
+    mesh = LazyMesh(path)
+    tetmesh: pv.UnstructuredGrid = mesh.to_pyvista(  # pyright: ignore[reportAssignmentType]
+        point_data=[
+            name
+            for name in ("Displacement", "IsSkin", "SkinToOsteotomy")
+            if name in mesh.point_array_names
+        ]
+    )
+    surface: pv.PolyData = tetmesh.extract_surface()  # pyright: ignore[reportAssignmentType]
+    surface.warp_by_vector("Displacement", inplace=True)
+    return surface
+
+
+def load_prediction(path: StrPath) -> pv.PolyData:
+    """Load the deformed skin surface of a `20-prediction.vtu` tet mesh."""
+    surface: pv.PolyData = load_prediction_surface(path)
+    skin: pv.PolyData = melon.tri.extract_points(surface, surface.point_data["IsSkin"])
+    return skin
+
+
+def prediction_regions(skin: pv.PolyData) -> dict[str, Bool[np.ndarray, " N"]]:
+    if "SkinToOsteotomy" not in skin.point_data:
+        return {}
+    osteotomy: Bool[np.ndarray, " N"] = np.isfinite(skin.point_data["SkinToOsteotomy"])
+    return {"osteotomy": osteotomy, "rest": ~osteotomy}
+
+
+def evaluate_case(
+    prediction: StrPath,
+    truth: StrPath,
+    *,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+) -> dict[str, float]:
+    skin: pv.PolyData = load_prediction(prediction)
+    evaluation = SurfaceEvaluation(
+        skin,
+        melon.load_polydata(truth),
+        regions=prediction_regions(skin),
+        percentiles=percentiles,
+    )
+    return evaluation.summary()
+
+
+def evaluate_cohort(
+    cases: Mapping[str, tuple[StrPath, StrPath]],
+    *,
+    max_workers: int | None = None,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+) -> pl.DataFrame:
+    """Evaluate `(prediction, truth)` pairs in parallel, one table row per case.
+
+    A case that fails is logged and kept as a row with its `error` set and the
+    metrics left null, so one bad case does not discard the whole cohort.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures: dict[str, Future[dict[str, float]]] = {
+            case: executor.submit(
+                evaluate_case, prediction, truth, percentiles=percentiles
+            )
+            for case, (prediction, truth) in cases.items()
+        }
+        concurrent.futures.wait(futures.values())
+    rows: list[dict[str, str | float | None]] = []
+    for case, future in futures.items():
+        try:
+            summary: dict[str, float] = future.result()
+        except Exception as err:
+            logger.exception("%s: evaluation failed", case)
+            rows.append({"case": case, "error": repr(err)})
+        else:
+            rows.append({"case": case, "error": None, **summary})
+    return pl.DataFrame(rows, infer_schema_length=None)
+
+
+def save_table(path: StrPath, table: pl.DataFrame) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".parquet":
+        table.write_parquet(path)
+    else:
+        table.write_csv(path)
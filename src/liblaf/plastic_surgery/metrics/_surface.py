@@ -0,0 +1,94 @@
+import functools
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import numpy as np
+import pyvista as pv
+from jaxtyping import Bool, Float
+
+from liblaf import melon
+
+DEFAULT_PERCENTILES: tuple[float, ...] = (50.0, 90.0, 95.0, 99.0)
+
+
+def surface_distance(source: Any, target: Any) -> Float[np.ndarray, " N"]:
+    """Distance from every point of `target` to the closest point on `source`."""
+    nearest: melon.NearestPointOnSurfaceResult = melon.nearest_point_on_surface(
+        source, target, distance_threshold=np.inf, normal_threshold=None
+    )
+    return nearest.distance
+
+
+def summarize(
+    distance: Float[np.ndarray, " N"],
+    prefix: str,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+) -> dict[str, float]:
+    if distance.size == 0:
+        distance = np.full((1,), np.nan)
+    summary: dict[str, float] = {
+        f"{prefix}_mean": float(np.mean(distance)),
+        f"{prefix}_rms": float(np.sqrt(np.mean(np.square(distance)))),
+        f"{prefix}_max": float(np.max(distance)),
+    }
+    for q, value in zip(percentiles, np.percentile(distance, percentiles), strict=True):
+        summary[f"{prefix}_p{q:g}"] = float(value)
+    return summary
+
+
+class SurfaceEvaluation:
+    prediction: pv.PolyData
+    truth: pv.PolyData
+    regions: Mapping[str, Bool[np.ndarray, " N"]]
+    percentiles: Sequence[float]
+
+    def __init__(
+        self,
+        prediction: pv.PolyData,
+        truth: pv.PolyData,
+        *,
+        regions: Mapping[str, Bool[np.ndarray, " N"]] | None = None,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    ) -> None:
+        self.prediction = prediction
+        self.truth = truth
+        self.regions = regions or {}
+        self.percentiles = percentiles
+
+    @functools.cached_property
+    def prediction_to_truth(self) -> Float[np.ndarray, " N"]:
+        return surface_distance(self.truth, self.prediction)
+
+    @functools.cached_property
+    def truth_to_prediction(self) -> Float[np.ndarray, " M"]:
+        return surface_distance(self.prediction, self.truth)
+
+    @property
+    def hausdorff(self) -> float:
+        return float(
+            max(np.max(self.prediction_to_truth), np.max(self.truth_to_prediction))
+        )
+
+    @property
+    def mean_symmetric(self) -> float:
+        return float(
+            (np.sum(self.prediction_to_truth) + np.sum(self.truth_to_prediction))
+            / (self.prediction_to_truth.size + self.truth_to_prediction.size)
+        )
+
+    def summary(self) -> dict[str, float]:
+        summary: dict[str, float] = {
+            "hausdorff": self.hausdorff,
+            "mean_symmetric": self.mean_symmetric,
+        }
+        summary.update(
+            summarize(self.prediction_to_truth, "prediction_to_truth", self.percentiles)
+        )
+        summary.update(
+            summarize(self.truth_to_prediction, "truth_to_prediction", self.percentiles)
+        )
+        for name, mask in self.regions.items():
+            summary.update(
+                summarize(self.prediction_to_truth[mask], name, self.percentiles)
+            )
+        return summary
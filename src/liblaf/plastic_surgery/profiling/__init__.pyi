@@ -0,0 +1,15 @@
+from ._profiler import Recorder, StepRecord, load_records, recorder, shutdown, step
+from ._report import Report, StepSummary, profiled, run
+
+__all__ = [
+    "Recorder",
+    "Report",
+    "StepRecord",
+    "StepSummary",
+    "load_records",
+    "profiled",
+    "recorder",
+    "run",
+    "shutdown",
+    "step",
+]
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import json
+import os
+import threading
+import time
+from collections.abc import Generator
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+import psutil
+
+if TYPE_CHECKING:
+    from _typeshed import StrPath
+
+# directory of the JSON reports; profiling is off unless it is set
+ENV: str = "LIBLAF_PLASTIC_SURGERY_PROFILE"
+# records directory of the active `run()`, inherited by workers
+RECORDS_ENV: str = "LIBLAF_PLASTIC_SURGERY_PROFILE_RECORDS"
+RECORDS: str = "records"
+
+
+@dataclasses.dataclass(kw_only=True)
+class StepRecord:
+    name: str
+    pid: int
+    start: float
+    duration: float
+    rss_start: int
+    rss_peak: int
+
+
+@dataclasses.dataclass(kw_only=True)
+class _Frame:
+    name: str
+    start: float
+    counter: float
+    rss_start: int
+    rss_peak: int
+
+
+class Recorder:
+    """Per-process sink for step records.
+
+    Records are appended to one JSON Lines file per process below `directory`,
+    so workers of a process pool never contend for the same file. A daemon
+    thread samples the resident set size every `interval` seconds and updates
+    the peak of every active step.
+    """
+
+    directory: Path
+    pid: int
+    interval: float
+    _file: IO[str]
+    _frames: list[_Frame]
+    _local: threading.local
+    _lock: threading.Lock
+    _process: psutil.Process
+    _stopped: threading.Event
+
+    def __init__(self, directory: StrPath, interval: float = 0.05) -> None:
+        self.directory = Path(directory)
+        self.pid = os.getpid()
+        self.interval = interval
+        self._frames = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._process = psutil.Process(self.pid)
+        self._stopped = threading.Event()
+        path: Path = self.directory / RECORDS / f"{self.pid}.jsonl"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = path.open("a")
+        threading.Thread(target=self._sample, daemon=True).start()
+
+    def close(self) -> None:
+        self._stopped.set()
+        with self._lock:
+            self._file.close()
+
+    def rss(self) -> int:
+        return self._process.memory_info().rss
+
+    @contextlib.contextmanager
+    def step(self, name: str) -> Generator[None]:
+        stack: list[_Frame] = self._local.__dict__.setdefault("stack", [])
+        if stack:
+            name = f"{stack[-1].name}/{name}"
+        rss: int = self.rss()
+        frame = _Frame(
+            name=name,
+            start=time.time(),
+            counter=time.perf_counter(),
+            rss_start=rss,
+            rss_peak=rss,
+        )
+        stack.append(frame)
+        with self._lock:
+            self._frames.append(frame)
+        try:
+            yield
+        finally:
+            duration: float = time.perf_counter() - frame.counter
+            rss = self.rss()
+            stack.pop()
+            with self._lock:
+                self._frames.remove(frame)
+                record = StepRecord(
+                    name=frame.name,
+                    pid=self.pid,
+                    start=frame.start,
+                    duration=duration,
+                    rss_start=frame.rss_start,
+                    rss_peak=max(frame.rss_peak, rss),
+                )
+                self._file.write(json.dumps(dataclasses.asdict(record)) + "\n")
+                self._file.flush()
+
+    def _sample(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                rss: int = self.rss()
+            except psutil.Error:
+                return
+            with self._lock:
+                for frame in self._frames:
+                    frame.rss_peak = max(frame.rss_peak, rss)
+
+
+_recorder: Recorder | None = None
+
+
+def recorder() -> Recorder | None:
+    """Return the recorder of this process, or `None` if profiling is off.
+
+    Profiling is switched on by `run()` through an environment variable, which
+    process-pool workers inherit.
+    """
+    global _recorder  # noqa: PLW0603
+    directory: str | None = os.environ.get(RECORDS_ENV)
+    if not directory:
+        return None
+    if (
+        _recorder is None
+        or _recorder.pid != os.getpid()
+        or _recorder.directory != Path(directory)
+    ):
+        shutdown()
+        _recorder = Recorder(directory)
+    return _recorder
+
+
+def shutdown() -> None:
+    """Close the recorder of this process, if any."""
+    global _recorder  # noqa: PLW0603
+    if _recorder is not None and _recorder.pid == os.getpid():
+        _recorder.close()
+    _recorder = None
+
+
+@contextlib.contextmanager
+def step(name: str) -> Generator[None]:
+    """Time a named step and track its peak RSS.
+
+    Steps nest, the recorded name is the `/`-separated path of active steps.
+    This is a no-op unless it runs inside `run()`, or in a worker started from
+    within `run()`.
+
+    Examples:
+        >>> with step("load"):
+        ...     pass
+    """
+    rec: Recorder | None = recorder()
+    if rec is None:
+        yield
+        return
+    with rec.step(name):
+        yield
+
+
+def load_records(directory: StrPath) -> list[StepRecord]:
+    records: list[StepRecord] = []
+    for path in sorted((Path(directory) / RECORDS).glob("*.jsonl")):
+        with path.open() as fp:
+            for line in fp:
+                data: dict[str, Any] = json.loads(line)
+                records.append(StepRecord(**data))
+    return records
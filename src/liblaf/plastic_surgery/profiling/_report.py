@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import collections
+import contextlib
+import dataclasses
+import functools
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Generator, Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ._profiler import ENV, RECORDS_ENV, StepRecord, load_records, shutdown
+
+if TYPE_CHECKING:
+    from _typeshed import StrPath
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(kw_only=True)
+class StepSummary:
+    name: str
+    count: int
+    total: float
+    mean: float
+    max: float
+    rss_peak: int
+    processes: int
+
+
+@dataclasses.dataclass(kw_only=True)
+class Report:
+    wall_time: float
+    processes: int
+    steps: list[StepSummary]
+
+    @classmethod
+    def from_records(cls, records: Iterable[StepRecord], wall_time: float) -> Report:
+        groups: collections.defaultdict[str, list[StepRecord]] = (
+            collections.defaultdict(list)
+        )
+        for record in records:
+            groups[record.name].append(record)
+        steps: list[StepSummary] = [
+            StepSummary(
+                name=name,
+                count=len(group),
+                total=sum(record.duration for record in group),
+                mean=sum(record.duration for record in group) / len(group),
+                max=max(record.duration for record in group),
+                rss_peak=max(record.rss_peak for record in group),
+                processes=len({record.pid for record in group}),
+            )
+            for name, group in groups.items()
+        ]
+        steps.sort(key=lambda summary: summary.total, reverse=True)
+        return cls(
+            wall_time=wall_time,
+            processes=len(
+                {record.pid for group in groups.values() for record in group}
+            ),
+            steps=steps,
+        )
+
+    def table(self) -> str:
+        """Render the report as a plain-text table, slowest steps first."""
+        header: tuple[str, ...] = (
+            "step", "count", "total [s]", "mean [s]", "max [s]", "peak RSS [MiB]", "procs"
+        )  # fmt: skip
+        rows: list[tuple[str, ...]] = [
+            (
+                step.name,
+                str(step.count),
+                f"{step.total:.3f}",
+                f"{step.mean:.3f}",
+                f"{step.max:.3f}",
+                f"{step.rss_peak / 2**20:.1f}",
+                str(step.processes),
+            )
+            for step in self.steps
+        ]
+        widths: list[int] = [
+            max(len(row[i]) for row in [header, *rows]) for i in range(len(header))
+        ]
+        lines: list[str] = [
+            "  ".join(
+                cell.ljust(width) if i == 0 else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(row, widths, strict=True))
+            )
+            for row in [header, *rows]
+        ]
+        lines.append(f"wall time: {self.wall_time:.3f} s, processes: {self.processes}")
+        return "\n".join(lines)
+
+    def save(self, path: StrPath) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(dataclasses.asdict(self), indent=2))
+
+    @classmethod
+    def load(cls, path: StrPath) -> Report:
+        data: dict[str, Any] = json.loads(Path(path).read_text())
+        data["steps"] = [StepSummary(**step) for step in data["steps"]]
+        return cls(**data)
+
+
+@contextlib.contextmanager
+def run(path: StrPath | None = None) -> Generator[None]:
+    """Profile every `step()` of this run, including process-pool workers.
+
+    On exit, the records of all processes are aggregated into a `Report`, which
+    is logged and, if `path` is given, saved as JSON. Workers must be started
+    inside this context, so that they inherit the profiling switch.
+
+    Examples:
+        >>> from liblaf.plastic_surgery import profiling
+        >>> with profiling.run():
+        ...     with profiling.step("load"):
+        ...         pass
+    """
+    previous: str | None = os.environ.get(RECORDS_ENV)
+    with tempfile.TemporaryDirectory(prefix="profile-") as directory:
+        os.environ[RECORDS_ENV] = directory
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall_time: float = time.perf_counter() - start
+            shutdown()
+            if previous is None:
+                del os.environ[RECORDS_ENV]
+            else:
+                os.environ[RECORDS_ENV] = previous
+            report: Report = Report.from_records(load_records(directory), wall_time)
+            logger.info("profile:\n%s", report.table())
+            if path is not None:
+                report.save(path)
+
+
+def profiled[**P, T](func: Callable[P, T]) -> Callable[P, T]:
+    """Run `func` inside `run()` if `LIBLAF_PLASTIC_SURGERY_PROFILE` is set.
+
+    The variable names a directory, the report is saved there as
+    `<script>.json`, named after the running script. Unset or empty, `func` is
+    called as is and `step()` stays a no-op.
+
+    Examples:
+        >>> from liblaf import cherries
+        >>> @profiled
+        ... def main(cfg: cherries.BaseConfig) -> None: ...
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        directory: str | None = os.environ.get(ENV)
+        if not directory:
+            return func(*args, **kwargs)
+        with run(Path(directory) / f"{Path(sys.argv[0]).stem}.json"):
+            return func(*args, **kwargs)
+
+    return wrapper
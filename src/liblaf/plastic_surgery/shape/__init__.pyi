@@ -0,0 +1,4 @@
+from ._pca import ShapeModes, shape_pca
+from ._stack import ShapeStack
+
+__all__ = ["ShapeModes", "ShapeStack", "shape_pca"]
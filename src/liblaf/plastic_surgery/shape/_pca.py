@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from collections.abc import Generator
+from typing import NamedTuple
+
+import numpy as np
+import scipy.linalg
+from jaxtyping import Float
+
+from ._stack import ShapeStack
+
+
+class ShapeModes(NamedTuple):
+    mean: Float[np.ndarray, "vertices 3"]
+    components: Float[np.ndarray, "modes vertices 3"]
+    explained_variance: Float[np.ndarray, " modes"]
+    scores: Float[np.ndarray, "shapes modes"]
+
+    def reconstruct(
+        self, scores: Float[np.ndarray, "*batch modes"]
+    ) -> Float[np.ndarray, "*batch vertices 3"]:
+        return self.mean + np.tensordot(scores, self.components, axes=1)
+
+
+def shape_pca(
+    stack: ShapeStack,
+    n_modes: int,
+    *,
+    n_oversamples: int = 10,
+    n_power_iter: int = 4,
+    chunk_size: int = 32,
+    seed: int = 0,
+) -> ShapeModes:
+    """PCA of a shape stack via randomized SVD.
+
+    The centered data matrix is only accessed through products with thin
+    matrices, reading `chunk_size` shapes at a time, so memory scales with the
+    number of vertices times `n_modes + n_oversamples`.
+
+    References:
+        1. Halko, N., Martinsson, P. G., & Tropp, J. A. (2011). Finding structure with randomness: Probabilistic algorithms for constructing approximate matrix decompositions. SIAM Review, 53(2), 217-288.
+    """
+    n_shapes: int = stack.n_shapes
+    mean: Float[np.ndarray, " dim"] = stack.mean.ravel()
+    n_components: int = min(n_modes + n_oversamples, n_shapes, mean.size)
+    rng: np.random.Generator = np.random.default_rng(seed)
+    omega: Float[np.ndarray, "dim k"] = rng.standard_normal((mean.size, n_components))
+    y: Float[np.ndarray, "shapes k"] = _matmul(stack, mean, omega, chunk_size)
+    for _ in range(n_power_iter):
+        q: Float[np.ndarray, "shapes k"] = scipy.linalg.qr(y, mode="economic")[0]
+        z: Float[np.ndarray, "dim k"] = _rmatmul(stack, mean, q, chunk_size)
+        z = scipy.linalg.qr(z, mode="economic")[0]
+        y = _matmul(stack, mean, z, chunk_size)
+    q = scipy.linalg.qr(y, mode="economic")[0]
+    b: Float[np.ndarray, "k dim"] = _rmatmul(stack, mean, q, chunk_size).T
+    u: Float[np.ndarray, "k k"]
+    s: Float[np.ndarray, " k"]
+    vt: Float[np.ndarray, "k dim"]
+    u, s, vt = scipy.linalg.svd(b, full_matrices=False)
+    n_modes = min(n_modes, s.size)
+    return ShapeModes(
+        mean=mean.reshape(stack.n_vertices, 3),
+        components=vt[:n_modes].reshape(n_modes, stack.n_vertices, 3),
+        explained_variance=s[:n_modes] ** 2 / max(n_shapes - 1, 1),
+        scores=(q @ u[:, :n_modes]) * s[:n_modes],
+    )
+
+
+def _chunks(
+    stack: ShapeStack, mean: Float[np.ndarray, " dim"], chunk_size: int
+) -> Generator[tuple[slice, Float[np.ndarray, "chunk dim"]]]:
+    points: Float[np.ndarray, "shapes vertices 3"] = stack.points
+    for start in range(0, stack.n_shapes, chunk_size):
+        rows = slice(start, start + chunk_size)
+        yield rows, points[rows].reshape(-1, mean.size) - mean
+
+
+def _matmul(
+    stack: ShapeStack,
+    mean: Float[np.ndarray, " dim"],
+    other: Float[np.ndarray, "dim k"],
+    chunk_size: int,
+) -> Float[np.ndarray, "shapes k"]:
+    result: Float[np.ndarray, "shapes k"] = np.empty((stack.n_shapes, other.shape[1]))
+    for rows, centered in _chunks(stack, mean, chunk_size):
+        result[rows] = centered @ other
+    return result
+
+
+def _rmatmul(
+    stack: ShapeStack,
+    mean: Float[np.ndarray, " dim"],
+    other: Float[np.ndarray, "shapes k"],
+    chunk_size: int,
+) -> Float[np.ndarray, "dim k"]:
+    result: Float[np.ndarray, "dim k"] = np.zeros((mean.size, other.shape[1]))
+    for rows, centered in _chunks(stack, mean, chunk_size):
+        result += centered.T @ other[rows]
+    return result
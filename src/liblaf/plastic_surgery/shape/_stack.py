@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import functools
+import json
+from collections.abc import Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from jaxtyping import Float
+
+if TYPE_CHECKING:
+    from _typeshed import StrPath
+
+HEADER: str = "header.json"
+VERSION: int = 1
+POINTS: str = "points.bin"
+STATS: str = "stats.npz"
+CHUNK_SIZE: int = 32
+
+
+class ShapeStack:
+    """Registered meshes with shared topology, stacked on disk.
+
+    ```
+    21-skin.stack/
+    ├── header.json  # ids, number of vertices, dtype, input fingerprint
+    ├── points.bin   # raw (shapes, vertices, 3) array
+    └── stats.npz    # number of shapes, running mean and sum of squared deviations
+    ```
+
+    Shapes are appended one at a time and `points` is memory-mapped, so the
+    stack is never fully loaded into RAM. The per-vertex mean and variance are
+    updated with Welford's algorithm on every `add()`.
+
+    `header.json` is the commit point of `add()`: the points and the statistics
+    are written first, the header last, each file replaced atomically. The
+    statistics record the number of shapes they cover; if that does not match
+    the header after an interrupted `add()`, they are recomputed from the
+    committed points.
+    """
+
+    path: Path
+
+    def __init__(self, path: StrPath) -> None:
+        self.path = Path(path)
+
+    @classmethod
+    def create(
+        cls,
+        path: StrPath,
+        n_vertices: int,
+        dtype: np.dtype | type = np.float32,
+        *,
+        fingerprint: str | None = None,
+    ) -> ShapeStack:
+        """Create an empty stack at `path`, replacing any existing one.
+
+        `fingerprint` identifies the inputs the stack is built from, so a caller
+        resuming from an existing stack can tell whether it is still valid.
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        (path / POINTS).write_bytes(b"")
+        _save_stats(path, 0, np.zeros((n_vertices, 3)), np.zeros((n_vertices, 3)))
+        _write_header(
+            path,
+            {
+                "version": VERSION,
+                "n_vertices": n_vertices,
+                "dtype": np.dtype(dtype).str,
+                "fingerprint": fingerprint,
+                "ids": [],
+            },
+        )
+        return cls(path)
+
+    @functools.cached_property
+    def header(self) -> dict[str, Any]:
+        return json.loads((self.path / HEADER).read_text())
+
+    @property
+    def ids(self) -> list[str]:
+        return self.header["ids"]
+
+    @property
+    def fingerprint(self) -> str | None:
+        return self.header.get("fingerprint")
+
+    @property
+    def n_shapes(self) -> int:
+        return len(self.ids)
+
+    @property
+    def n_vertices(self) -> int:
+        return self.header["n_vertices"]
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(self.header["dtype"])
+
+    def __len__(self) -> int:
+        return self.n_shapes
+
+    @property
+    def points(self) -> Float[np.ndarray, "shapes vertices 3"]:
+        if self.n_shapes == 0:
+            return np.empty((0, self.n_vertices, 3), self.dtype)
+        return np.memmap(
+            self.path / POINTS,
+            dtype=self.dtype,
+            mode="r",
+            shape=(self.n_shapes, self.n_vertices, 3),
+        )
+
+    @property
+    def mean(self) -> Float[np.ndarray, "vertices 3"]:
+        return self._stats()[0]
+
+    @property
+    def variance(self) -> Float[np.ndarray, "vertices 3"]:
+        """Per-coordinate sample variance."""
+        return self._stats()[1] / max(self.n_shapes - 1, 1)
+
+    @property
+    def vertex_variance(self) -> Float[np.ndarray, " vertices"]:
+        """Expected squared distance of each vertex from its mean position."""
+        return np.sum(self.variance, axis=-1)
+
+    def add(self, id_: str, points: Float[np.ndarray, "vertices 3"]) -> None:
+        points = np.asarray(points)
+        if points.shape != (self.n_vertices, 3):
+            msg: str = f"shape '{id_}' has shape {points.shape}, expected ({self.n_vertices}, 3)"
+            raise ValueError(msg)
+        if id_ in self.ids:
+            msg = f"shape '{id_}' already exists"
+            raise ValueError(msg)
+        values: np.ndarray = points.astype(self.dtype)
+        with (self.path / POINTS).open("r+b") as fp:
+            # drop leftovers of an interrupted `add()`
+            fp.seek(self.n_shapes * values.nbytes)
+            fp.truncate()
+            fp.write(values.tobytes())
+        n: int = self.n_shapes + 1
+        mean: Float[np.ndarray, "vertices 3"]
+        m2: Float[np.ndarray, "vertices 3"]
+        mean, m2 = self._stats()
+        delta: Float[np.ndarray, "vertices 3"] = values - mean
+        mean += delta / n
+        m2 += delta * (values - mean)
+        _save_stats(self.path, n, mean, m2)
+        header: dict[str, Any] = self.header
+        header["ids"].append(id_)
+        _write_header(self.path, header)
+
+    def _stats(
+        self,
+    ) -> tuple[Float[np.ndarray, "vertices 3"], Float[np.ndarray, "vertices 3"]]:
+        """Running mean and sum of squared deviations of the committed shapes."""
+        if (self.path / STATS).exists():
+            with np.load(self.path / STATS) as data:
+                if int(data["n_shapes"]) == self.n_shapes:
+                    return data["mean"], data["m2"]
+        # interrupted `add()`: the statistics are ahead of the header
+        points: Float[np.ndarray, "shapes vertices 3"] = self.points
+        mean: Float[np.ndarray, "vertices 3"] = np.zeros((self.n_vertices, 3))
+        for start in range(0, self.n_shapes, CHUNK_SIZE):
+            mean += np.sum(points[start : start + CHUNK_SIZE], axis=0, dtype=np.float64)
+        mean /= max(self.n_shapes, 1)
+        m2: Float[np.ndarray, "vertices 3"] = np.zeros((self.n_vertices, 3))
+        for start in range(0, self.n_shapes, CHUNK_SIZE):
+            m2 += np.sum((points[start : start + CHUNK_SIZE] - mean) ** 2, axis=0)
+        return mean, m2
+
+
+def _save_stats(
+    path: Path,
+    n_shapes: int,
+    mean: Float[np.ndarray, "vertices 3"],
+    m2: Float[np.ndarray, "vertices 3"],
+) -> None:
+    tmp: Path = path / f"{STATS}.tmp"
+    with tmp.open("wb") as fp:
+        np.savez(fp, n_shapes=n_shapes, mean=mean, m2=m2)
+    tmp.replace(path / STATS)
+
+
+def _write_header(path: Path, header: Mapping[str, Any]) -> None:
+    tmp: Path = path / f"{HEADER}.tmp"
+    tmp.write_text(json.dumps(header, indent=2))
+    tmp.replace(path / HEADER)
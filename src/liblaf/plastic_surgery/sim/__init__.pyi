@@ -0,0 +1,23 @@
+from ._cubature import Cubature, cubature_weights, fit_cubature
+from ._elements import EdgeSprings, ElementEnergy, TetArap
+from ._multires import barycentric_coordinates, prolongate, restrict
+from ._props import OsteotomyProps, osteotomy_props
+from ._reduced import ReducedModel, linear_modes, orthonormalize, snapshot_modes
+
+__all__ = [
+    "Cubature",
+    "EdgeSprings",
+    "ElementEnergy",
+    "OsteotomyProps",
+    "ReducedModel",
+    "TetArap",
+    "barycentric_coordinates",
+    "cubature_weights",
+    "fit_cubature",
+    "linear_modes",
+    "orthonormalize",
+    "osteotomy_props",
+    "prolongate",
+    "restrict",
+    "snapshot_modes",
+]
@@ -0,0 +1,127 @@
+import logging
+import time
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+import scipy.optimize
+from jaxtyping import Bool, Float, Integer
+
+from ._elements import ElementEnergy
+
+if TYPE_CHECKING:
+    from ._reduced import ReducedModel
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+CHUNK_SIZE: int = 8192
+
+
+class Cubature(NamedTuple):
+    """Weighted subset of the elements of `energy`."""
+
+    energy: ElementEnergy
+    elements: Integer[np.ndarray, " S"]
+    weights: Float[np.ndarray, " S"]
+
+
+def fit_cubature(
+    reduced: "ReducedModel",
+    energies: Sequence[ElementEnergy],
+    samples: Iterable[Float[np.ndarray, " modes"]],
+    *,
+    rtol: float = 1e-3,
+    max_elements: int = 1000,
+    check_rtol: float = 1e-4,
+) -> list[Cubature]:
+    """Select elements and non-negative weights that reproduce the reduced forces.
+
+    For every sample of reduced coordinates, the reduced force of each element
+    is one column of a matrix whose row sums are the exact reduced forces.
+    Elements are picked greedily and weighted by non-negative least squares
+    until the relative residual drops below `rtol`. `energies` must add up to
+    the energy of `reduced.model`; this is checked at every sample.
+
+    References:
+        1. An, S. S., Kim, T., & James, D. L. (2008). Optimizing cubature for efficient integration of subspace deformations. ACM Transactions on Graphics, 27(5), 165.
+        2. Farhat, C., Avery, P., Chapman, T., & Cortial, J. (2014). Dimensional reduction of nonlinear finite element dynamic models with finite rotations and energy-based mesh sampling and weighting for computational efficiency. International Journal for Numerical Methods in Engineering, 98(9), 625-662.
+    """
+    start: float = time.perf_counter()
+    offset: Float[np.ndarray, "points 3"] = reduced.offset
+    basis: Float[np.ndarray, "points 3 modes"] = reduced.full_basis
+    blocks: list[list[Float[np.ndarray, "modes E"]]] = [[] for _ in energies]
+    for q in samples:
+        u: Float[np.ndarray, "points 3"] = offset + basis @ q
+        total: float = 0.0
+        for block, energy in zip(blocks, energies, strict=True):
+            forces: Float[np.ndarray, "modes E"] = np.empty(
+                (reduced.n_modes, energy.cells.shape[0]), np.float32
+            )
+            for first in range(0, energy.cells.shape[0], CHUNK_SIZE):
+                elements: Integer[np.ndarray, " C"] = np.arange(
+                    first, min(first + CHUNK_SIZE, energy.cells.shape[0])
+                )
+                cells: Integer[np.ndarray, "C a"] = energy.cells[elements]
+                total += float(np.sum(energy.fun(u[cells], elements)))
+                forces[:, elements] = np.einsum(
+                    "cai,caim->mc", energy.grad(u[cells], elements), basis[cells]
+                )
+            block.append(forces)
+        expected: float = reduced.full_fun(q)
+        if not np.isclose(total, expected, rtol=check_rtol, atol=0.0):
+            msg: str = f"element energies add up to {total}, but the model energy is {expected}"
+            raise ValueError(msg)
+    columns: Float[np.ndarray, "rows E"] = np.concatenate(
+        [np.concatenate(block, axis=0) for block in blocks], axis=1
+    )
+    elements, weights = cubature_weights(columns, rtol=rtol, max_elements=max_elements)
+    cubature: list[Cubature] = []
+    first = 0
+    for energy in energies:
+        n: int = energy.cells.shape[0]
+        mask: np.ndarray = (elements >= first) & (elements < first + n)
+        cubature.append(Cubature(energy, elements[mask] - first, weights[mask]))
+        first += n
+    logger.info(
+        "cubature: %d of %d elements, %g s",
+        elements.size,
+        columns.shape[1],
+        time.perf_counter() - start,
+    )
+    return cubature
+
+
+def cubature_weights(
+    columns: Float[np.ndarray, "rows E"],
+    *,
+    rtol: float = 1e-3,
+    max_elements: int = 1000,
+) -> tuple[Integer[np.ndarray, " S"], Float[np.ndarray, " S"]]:
+    """Sparse non-negative `weights` with `columns[:, elements] @ weights ≈ columns.sum(1)`."""
+    target: Float[np.ndarray, " rows"] = np.sum(columns, axis=1, dtype=float)
+    norm: Float[np.ndarray, " E"] = np.linalg.norm(columns, axis=0)
+    norm[norm == 0.0] = np.inf
+    tolerance: float = rtol * float(np.linalg.norm(target))
+    residual: Float[np.ndarray, " rows"] = target
+    elements: Integer[np.ndarray, " S"] = np.empty((0,), int)
+    weights: Float[np.ndarray, " S"] = np.empty((0,))
+    # elements that were selected once, whether NNLS kept them or not
+    tried: Bool[np.ndarray, " E"] = np.zeros((columns.shape[1],), bool)
+    while np.linalg.norm(residual) > tolerance and elements.size < max_elements:
+        # in the precision of `columns`, so they are never copied
+        score: Float[np.ndarray, " E"] = (
+            columns.T @ residual.astype(columns.dtype)
+        ) / norm
+        score[tried] = -np.inf
+        candidate: int = int(np.argmax(score))
+        if score[candidate] <= 0.0:
+            break
+        tried[candidate] = True
+        selected: Integer[np.ndarray, " S"] = np.append(elements, candidate)
+        weights, _ = scipy.optimize.nnls(
+            columns[:, selected].astype(float), target, maxiter=50 * selected.size
+        )
+        elements = selected[weights > 0.0]
+        weights = weights[weights > 0.0]
+        residual = target - columns[:, elements].astype(float) @ weights
+    return elements, weights
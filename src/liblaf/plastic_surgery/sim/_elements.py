@@ -0,0 +1,161 @@
+from typing import Protocol, Self
+
+import numpy as np
+import pyvista as pv
+from jaxtyping import Float, Integer
+from liblaf.apple.constants import LENGTH, MU, POINT_ID, PRESTRAIN, STIFFNESS
+
+
+class ElementEnergy(Protocol):
+    """Energy that is a sum over elements and can be evaluated on any subset.
+
+    `cells` holds the point ids of every element. `fun()` and `grad()` take the
+    displacements of the points of the selected `elements`, so their cost only
+    depends on the number of selected elements.
+    """
+
+    @property
+    def cells(self) -> Integer[np.ndarray, "E a"]: ...
+
+    def fun(
+        self, u: Float[np.ndarray, "S a 3"], elements: Integer[np.ndarray, " S"]
+    ) -> Float[np.ndarray, " S"]: ...
+
+    def grad(
+        self, u: Float[np.ndarray, "S a 3"], elements: Integer[np.ndarray, " S"]
+    ) -> Float[np.ndarray, "S a 3"]: ...
+
+
+class TetArap:
+    """Per-element `liblaf.apple.ARAP`, with the same quadrature."""
+
+    cells: Integer[np.ndarray, "E 4"]
+    dh_dx: Float[np.ndarray, "E q 4 3"]
+    dv: Float[np.ndarray, "E q"]
+    mu: Float[np.ndarray, " E"]
+
+    def __init__(
+        self,
+        cells: Integer[np.ndarray, "E 4"],
+        dh_dx: Float[np.ndarray, "E q 4 3"],
+        dv: Float[np.ndarray, "E q"],
+        mu: Float[np.ndarray, " E"],
+    ) -> None:
+        self.cells = np.asarray(cells)
+        self.dh_dx = np.asarray(dh_dx, dtype=float)
+        self.dv = np.asarray(dv, dtype=float)
+        self.mu = np.asarray(mu, dtype=float)
+
+    @classmethod
+    def from_pyvista(cls, tetmesh: pv.UnstructuredGrid) -> Self:
+        from liblaf.apple.jax.fem import Region
+
+        region: Region = Region.from_pyvista(tetmesh, grad=True)
+        cells: Integer[np.ndarray, "E 4"] = np.asarray(region.cells)
+        if POINT_ID in tetmesh.point_data:
+            cells = tetmesh.point_data[POINT_ID][cells]
+        return cls(
+            cells=cells,
+            dh_dx=np.asarray(region.dhdX),
+            dv=np.asarray(region.dV),
+            mu=tetmesh.cell_data[MU],
+        )
+
+    def fun(
+        self, u: Float[np.ndarray, "S 4 3"], elements: Integer[np.ndarray, " S"]
+    ) -> Float[np.ndarray, " S"]:
+        deviation: Float[np.ndarray, "S q 3 3"] = self._deviation(u, elements)
+        density: Float[np.ndarray, "S q"] = (
+            0.5 * self.mu[elements, np.newaxis] * np.sum(deviation**2, axis=(-2, -1))
+        )
+        return np.sum(self.dv[elements] * density, axis=-1)
+
+    def grad(
+        self, u: Float[np.ndarray, "S 4 3"], elements: Integer[np.ndarray, " S"]
+    ) -> Float[np.ndarray, "S 4 3"]:
+        # first Piola-Kirchhoff stress, mu (F - R)
+        stress: Float[np.ndarray, "S q 3 3"] = self.mu[
+            elements, np.newaxis, np.newaxis, np.newaxis
+        ] * self._deviation(u, elements)
+        return np.einsum(
+            "sq,sqaj,sqij->sai", self.dv[elements], self.dh_dx[elements], stress
+        )
+
+    def _deviation(
+        self, u: Float[np.ndarray, "S 4 3"], elements: Integer[np.ndarray, " S"]
+    ) -> Float[np.ndarray, "S q 3 3"]:
+        """`F - R`, with `R` the rotation of the polar decomposition of `F`."""
+        deform: Float[np.ndarray, "S q 3 3"] = np.eye(3) + np.einsum(
+            "sai,sqaj->sqij", u, self.dh_dx[elements]
+        )
+        left: Float[np.ndarray, "S q 3 3"]
+        right: Float[np.ndarray, "S q 3 3"]
+        left, _, right = np.linalg.svd(deform)
+        # keep `R` a rotation for inverted elements
+        left[..., :, -1] *= np.sign(np.linalg.det(left @ right))[..., np.newaxis]
+        return deform - left @ right
+
+
+class EdgeSprings:
+    """Per-element `liblaf.apple.MassSpringPrestrain`."""
+
+    cells: Integer[np.ndarray, "E 2"]
+    points: Float[np.ndarray, "E 2 3"]
+    length: Float[np.ndarray, " E"]
+    stiffness: Float[np.ndarray, " E"]
+
+    def __init__(
+        self,
+        cells: Integer[np.ndarray, "E 2"],
+        points: Float[np.ndarray, "E 2 3"],
+        length: Float[np.ndarray, " E"],
+        stiffness: Float[np.ndarray, " E"],
+    ) -> None:
+        self.cells = np.asarray(cells)
+        self.points = np.asarray(points, dtype=float)
+        self.length = np.asarray(length, dtype=float)
+        self.stiffness = np.asarray(stiffness, dtype=float)
+
+    @classmethod
+    def from_pyvista(cls, edges: pv.PolyData) -> Self:
+        if LENGTH not in edges.cell_data:
+            edges = edges.compute_cell_sizes(length=True, area=False, volume=False)  # pyright: ignore[reportAssignmentType]
+        lines: Integer[np.ndarray, "E 2"] = edges.lines.reshape((-1, 3))[:, 1:]
+        length: Float[np.ndarray, " E"] = edges.cell_data[LENGTH]
+        if PRESTRAIN in edges.cell_data:
+            length = length * (1.0 + edges.cell_data[PRESTRAIN])
+        cells: Integer[np.ndarray, "E 2"] = lines
+        if POINT_ID in edges.point_data:
+            cells = edges.point_data[POINT_ID][lines]
+        return cls(
+            cells=cells,
+            points=edges.points[lines],
+            length=length,
+            stiffness=edges.cell_data[STIFFNESS],
+        )
+
+    def fun(
+        self, u: Float[np.ndarray, "S 2 3"], elements: Integer[np.ndarray, " S"]
+    ) -> Float[np.ndarray, " S"]:
+        _, length = self._delta(u, elements)
+        return 0.5 * self.stiffness[elements] * (length - self.length[elements]) ** 2
+
+    def grad(
+        self, u: Float[np.ndarray, "S 2 3"], elements: Integer[np.ndarray, " S"]
+    ) -> Float[np.ndarray, "S 2 3"]:
+        delta: Float[np.ndarray, "S 3"]
+        length: Float[np.ndarray, " S"]
+        delta, length = self._delta(u, elements)
+        force: Float[np.ndarray, "S 3"] = (
+            self.stiffness[elements]
+            * (length - self.length[elements])
+            / np.where(length > 0.0, length, 1.0)
+        )[:, np.newaxis] * delta
+        return np.stack([-force, force], axis=1)
+
+    def _delta(
+        self, u: Float[np.ndarray, "S 2 3"], elements: Integer[np.ndarray, " S"]
+    ) -> tuple[Float[np.ndarray, "S 3"], Float[np.ndarray, " S"]]:
+        x: Float[np.ndarray, "S 2 3"] = self.points[elements] + u
+        delta: Float[np.ndarray, "S 3"] = x[:, 1] - x[:, 0]
+        return delta, np.linalg.norm(delta, axis=-1)
@@ -0,0 +1,105 @@
+import collections
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+import numpy as np
+import pyvista as pv
+import scipy.spatial
+from jaxtyping import Bool, Float, Integer
+
+
+def barycentric_coordinates(
+    tetmesh: pv.UnstructuredGrid, points: Float[np.ndarray, "N 3"]
+) -> tuple[Integer[np.ndarray, " N"], Float[np.ndarray, "N 4"]]:
+    """Locate `points` in `tetmesh` and compute their barycentric coordinates.
+
+    Points outside of `tetmesh` are snapped to the closest tetrahedron, and their
+    coordinates are clipped to the tetrahedron so that interpolation never
+    extrapolates.
+    """
+    if not np.all(tetmesh.celltypes == pv.CellType.TETRA):
+        msg: str = "barycentric coordinates require a pure tetrahedral mesh"
+        raise ValueError(msg)
+    points = np.asarray(points, dtype=float)
+    cell_id: Integer[np.ndarray, " N"] = np.asarray(
+        tetmesh.find_containing_cell(points)
+    ).reshape(-1)
+    outside: Bool[np.ndarray, " N"] = cell_id < 0
+    if np.any(outside):
+        cell_id[outside] = np.asarray(
+            tetmesh.find_closest_cell(points[outside])
+        ).reshape(-1)
+    tets: Integer[np.ndarray, "N 4"] = tetmesh.cells_dict[pv.CellType.TETRA][cell_id]
+    vertices: Float[np.ndarray, "N 4 3"] = tetmesh.points[tets]
+    edges: Float[np.ndarray, "N 3 3"] = vertices[:, 1:] - vertices[:, :1]
+    coords: Float[np.ndarray, "N 3"] = np.linalg.solve(
+        edges.transpose(0, 2, 1), (points - vertices[:, 0])[..., np.newaxis]
+    )[..., 0]
+    barycentric: Float[np.ndarray, "N 4"] = np.concatenate(
+        [1.0 - coords.sum(axis=-1, keepdims=True), coords], axis=-1
+    )
+    barycentric[outside] = np.clip(barycentric[outside], 0.0, None)
+    barycentric[outside] /= barycentric[outside].sum(axis=-1, keepdims=True)
+    return cell_id, barycentric
+
+
+def prolongate(
+    source: pv.UnstructuredGrid,
+    target: pv.UnstructuredGrid,
+    *,
+    data: str | Iterable[str],
+) -> pv.UnstructuredGrid:
+    """Interpolate point data from a coarse `source` onto a fine `target`."""
+    target = target.copy()
+    cell_id: Integer[np.ndarray, " T"]
+    barycentric: Float[np.ndarray, "T 4"]
+    cell_id, barycentric = barycentric_coordinates(source, target.points)
+    tets: Integer[np.ndarray, "T 4"] = source.cells_dict[pv.CellType.TETRA][cell_id]
+    for name in _as_names(data):
+        source_data: np.ndarray = source.point_data[name]
+        target.point_data[name] = np.einsum(
+            "tb,tb...->t...", barycentric, source_data[tets]
+        )
+    return target
+
+
+def restrict(
+    source: pv.UnstructuredGrid,
+    target: pv.UnstructuredGrid,
+    *,
+    data: str | Iterable[str],
+    fill: Any | Mapping[str, Any] = None,
+) -> pv.UnstructuredGrid:
+    """Transfer surface point data from a fine `source` onto a coarse `target`.
+
+    Every surface point of `target` takes the value of the closest surface point
+    of `source`. Interior points of `target` are set to `fill`.
+    """
+    target = target.copy()
+    fill: Mapping[str, Any] = _as_fill_mapping(fill)
+    source_surface: Integer[np.ndarray, " S"] = source.surface_indices()
+    target_surface: Integer[np.ndarray, " T"] = target.surface_indices()
+    tree = scipy.spatial.KDTree(source.points[source_surface])
+    vertex_id: Integer[np.ndarray, " T"]
+    _, vertex_id = tree.query(target.points[target_surface], workers=-1)  # pyright: ignore[reportAssignmentType]
+    nearest: Integer[np.ndarray, " T"] = source_surface[vertex_id]
+    for name in _as_names(data):
+        source_data: np.ndarray = source.point_data[name]
+        target_data: np.ndarray = np.full(
+            (target.n_points, *source_data.shape[1:]), fill[name], source_data.dtype
+        )
+        target_data[target_surface] = source_data[nearest]
+        target.point_data[name] = target_data
+    return target
+
+
+def _as_names(data: str | Iterable[str]) -> list[str]:
+    if isinstance(data, str):
+        return [data]
+    return list(data)
+
+
+def _as_fill_mapping(fill: Any | Mapping[str, Any]) -> Mapping[str, Any]:
+    if isinstance(fill, Mapping):
+        return fill
+    return collections.defaultdict(lambda: fill)
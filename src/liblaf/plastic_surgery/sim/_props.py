@@ -0,0 +1,98 @@
+from typing import NamedTuple
+
+import numpy as np
+import pyvista as pv
+from jaxtyping import Float
+from liblaf.apple.constants import DIRICHLET_MASK, DIRICHLET_VALUE, PRESTRAIN
+
+from liblaf import melon
+from liblaf.plastic_surgery import profiling
+
+
+class OsteotomyProps(NamedTuple):
+    tetmesh: pv.UnstructuredGrid
+    osteotomy: pv.PolyData
+    skin: pv.PolyData
+
+
+def osteotomy_props(
+    tetmesh: pv.UnstructuredGrid,
+    post_mandible: pv.PolyData,
+    *,
+    osteotomy_to_post_threshold: float = 20.0,
+    skin_to_osteotomy_threshold: float = 20.0,
+    a0: float = 1e2,
+    a1: float = 1e-1,
+    a2: float = 1e-3,
+) -> OsteotomyProps:
+    """Boundary conditions and skin prestrain of an osteotomy.
+
+    Bones are fixed except for the `Osteotomy` region. The prestrain of a skin
+    vertex is `-a0 * exp(-a1 * SkinToOsteotomy) * (1 - exp(-a2 * PreToPostMandible))`,
+    i.e. it decays with the distance to the osteotomy and grows with how far the
+    nearest osteotomy point is from the post-operative mandible. Thresholds are
+    in the units of the meshes.
+    """
+    tetmesh = tetmesh.copy()
+    tetmesh.point_data["_PointId"] = np.arange(tetmesh.n_points)
+    surface: pv.PolyData = tetmesh.extract_surface()  # pyright: ignore[reportAssignmentType]
+    skin: pv.PolyData = melon.tri.extract_points(surface, surface.point_data["IsSkin"])
+    osteotomy: pv.PolyData = melon.tri.extract_points(
+        surface, surface.point_data["Osteotomy"]
+    )
+
+    surface.point_data[DIRICHLET_MASK] = (
+        surface.point_data["IsCranium"] | surface.point_data["IsMandible"]
+    ) & ~surface.point_data["Osteotomy"]
+    surface.point_data[DIRICHLET_VALUE] = np.zeros((surface.n_points, 3))
+
+    with profiling.step("transfer"):
+        tetmesh = melon.transfer_tri_point_to_tet(
+            surface,
+            tetmesh,
+            data=[DIRICHLET_MASK, DIRICHLET_VALUE],
+            fill={DIRICHLET_MASK: False, DIRICHLET_VALUE: 0.0},
+            point_id="_PointId",
+        )
+
+    with profiling.step("nearest"):
+        osteotomy_to_post: melon.NearestPointOnSurfaceResult = (
+            melon.nearest_point_on_surface(
+                post_mandible,
+                osteotomy,
+                distance_threshold=osteotomy_to_post_threshold / post_mandible.length,
+                normal_threshold=None,
+            )
+        )
+        osteotomy.point_data["PreToPostMandible"] = osteotomy_to_post.distance
+        osteotomy = osteotomy.point_data_to_cell_data(pass_point_data=True)  # pyright: ignore[reportAssignmentType]
+        skin_to_osteotomy: melon.NearestPointOnSurfaceResult = (
+            melon.nearest_point_on_surface(
+                osteotomy,
+                skin,
+                distance_threshold=skin_to_osteotomy_threshold / osteotomy.length,
+                normal_threshold=None,
+            )
+        )
+    skin.point_data["SkinToOsteotomy"] = skin_to_osteotomy.distance
+    skin.point_data["PreToPostMandible"] = np.where(
+        skin_to_osteotomy.missing,
+        0.0,
+        osteotomy.cell_data["PreToPostMandible"][skin_to_osteotomy.triangle_id],
+    )
+    prestrain: Float[np.ndarray, " S"] = (
+        -a0
+        * np.exp(-a1 * skin.point_data["SkinToOsteotomy"])
+        * (1.0 - np.exp(-a2 * skin.point_data["PreToPostMandible"]))
+    )
+    skin.point_data[PRESTRAIN] = prestrain
+
+    with profiling.step("transfer"):
+        tetmesh = melon.transfer_tri_point_to_tet(
+            skin,
+            tetmesh,
+            data=["PreToPostMandible", "SkinToOsteotomy", PRESTRAIN],
+            fill={"PreToPostMandible": 0.0, "SkinToOsteotomy": np.inf, PRESTRAIN: 0.0},
+            point_id="_PointId",
+        )
+    return OsteotomyProps(tetmesh=tetmesh, osteotomy=osteotomy, skin=skin)
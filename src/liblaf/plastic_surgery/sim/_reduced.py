@@ -0,0 +1,315 @@
+import functools
+import logging
+import time
+from collections.abc import Callable, Iterable, Sequence
+from typing import NamedTuple
+
+import jax.numpy as jnp
+import numpy as np
+import scipy.linalg
+import scipy.sparse.linalg
+from jaxtyping import Array, Float, Integer
+from liblaf.apple import Model
+
+from ._cubature import Cubature
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def linear_modes(
+    model: Model,
+    n_modes: int,
+    *,
+    max_iter: int = 200,
+    seed: int = 0,
+    tol: float | None = None,
+) -> Float[np.ndarray, "free modes"]:
+    """Compute the lowest-frequency modes of the Hessian at the current state.
+
+    Only Hessian-vector products are needed, so the stiffness matrix is never
+    assembled. The Hessian diagonal is used as a Jacobi preconditioner.
+    """
+    u: Float[Array, " free"] = model.to_free(model.u_full)
+    n_free: int = model.n_free
+    dtype: np.dtype = np.dtype(u.dtype)
+
+    def matvec(p: Float[np.ndarray, " free"]) -> Float[np.ndarray, " free"]:
+        p = np.asarray(p, dtype=dtype).reshape((n_free,))
+        return np.asarray(model.hess_prod(u, jnp.asarray(p)), dtype=float)
+
+    def matmat(p: Float[np.ndarray, "free k"]) -> Float[np.ndarray, "free k"]:
+        return np.stack([matvec(column) for column in p.T], axis=-1)
+
+    hess_diag: Float[np.ndarray, " free"] = np.asarray(model.hess_diag(u), dtype=float)
+    hess = scipy.sparse.linalg.LinearOperator(
+        (n_free, n_free), matvec=matvec, matmat=matmat, dtype=float
+    )
+    precond = scipy.sparse.linalg.LinearOperator(
+        (n_free, n_free),
+        matvec=lambda p: np.ravel(p) / hess_diag,
+        matmat=lambda p: p / hess_diag[:, np.newaxis],
+        dtype=float,
+    )
+    rng: np.random.Generator = np.random.default_rng(seed)
+    guess: Float[np.ndarray, "free modes"] = rng.standard_normal((n_free, n_modes))
+    eigenvalues: Float[np.ndarray, " modes"]
+    eigenvectors: Float[np.ndarray, "free modes"]
+    eigenvalues, eigenvectors = scipy.sparse.linalg.lobpcg(  # pyright: ignore[reportAssignmentType]
+        hess, guess, M=precond, tol=tol, maxiter=max_iter, largest=False
+    )
+    logger.debug("linear mode eigenvalues: %s", eigenvalues)
+    return eigenvectors
+
+
+def snapshot_modes(
+    model: Model,
+    snapshots: Iterable[Float[np.ndarray, "points 3"]],
+    n_modes: int | None = None,
+    *,
+    rtol: float = 1e-6,
+) -> Float[np.ndarray, "free modes"]:
+    """Build a POD basis from full displacement snapshots of previous solves."""
+    columns: list[Float[np.ndarray, " free"]] = [
+        np.asarray(model.to_free(jnp.asarray(snapshot, model.u_full.dtype)))
+        for snapshot in snapshots
+    ]
+    u: Float[np.ndarray, " free"]
+    s: Float[np.ndarray, " snapshots"]
+    u, s, _ = scipy.linalg.svd(np.stack(columns, axis=-1), full_matrices=False)
+    rank: int = int(np.count_nonzero(s > rtol * s[0]))
+    if n_modes is not None:
+        rank = min(rank, n_modes)
+    return u[:, :rank]
+
+
+def orthonormalize(
+    *bases: Float[np.ndarray, "free _"], rtol: float = 1e-8
+) -> Float[np.ndarray, "free modes"]:
+    """Merge several bases into one orthonormal basis, dropping redundant modes."""
+    q: Float[np.ndarray, "free modes"]
+    r: Float[np.ndarray, "modes modes"]
+    q, r, _ = scipy.linalg.qr(
+        np.concatenate(bases, axis=-1), mode="economic", pivoting=True
+    )
+    diag: Float[np.ndarray, " modes"] = np.abs(np.diag(r))
+    rank: int = int(np.count_nonzero(diag > rtol * diag[0]))
+    return q[:, :rank]
+
+
+class ReducedModel:
+    """Solve a `Model` restricted to the span of a displacement basis.
+
+    The basis lives in the free DOFs of `model`, so Dirichlet values are applied
+    exactly. After `solve()`, `model.u_full` holds the reduced solution, which
+    can be passed on to `Forward` for a full-resolution solve.
+
+    Without `cubature`, every energy and gradient is a full-mesh evaluation and
+    the reduced Hessian costs one full-mesh Hessian-vector product per mode. It
+    is assembled once, at the first step, and afterwards kept up to date with
+    BFGS updates from the reduced gradients.
+
+    With `cubature` (see `fit_cubature()`), the energy and its derivatives are
+    weighted sums over the sampled elements only, so a solve no longer touches
+    the full mesh and the Hessian is a finite difference of the reduced gradient.
+    """
+
+    model: Model
+    basis: Float[np.ndarray, "free modes"]
+    cubature: Sequence[Cubature] | None
+    q: Float[np.ndarray, " modes"]
+    hessian: Float[np.ndarray, "modes modes"] | None
+
+    def __init__(
+        self,
+        model: Model,
+        basis: Float[np.ndarray, "free modes"],
+        *,
+        cubature: Sequence[Cubature] | None = None,
+    ) -> None:
+        if basis.shape[0] != model.n_free:
+            msg: str = f"basis has {basis.shape[0]} rows, but model has {model.n_free} free DOFs"
+            raise ValueError(msg)
+        self.model = model
+        self.basis = basis
+        self.cubature = cubature
+        self.q = np.zeros((basis.shape[1],))
+        self.hessian = None
+
+    @property
+    def n_modes(self) -> int:
+        return self.basis.shape[1]
+
+    @functools.cached_property
+    def offset(self) -> Float[np.ndarray, "points 3"]:
+        """Full displacement at `q = 0`, i.e. the Dirichlet values."""
+        return np.asarray(self.model.to_full(self.to_free(np.zeros((self.n_modes,)))))
+
+    @functools.cached_property
+    def full_basis(self) -> Float[np.ndarray, "points 3 modes"]:
+        """The basis scattered to all points, zero at Dirichlet DOFs."""
+        columns: list[Float[np.ndarray, "points 3"]] = [
+            np.asarray(self.model.to_full(self.to_free(e))) - self.offset
+            for e in np.eye(self.n_modes)
+        ]
+        return np.stack(columns, axis=-1)
+
+    def to_free(self, q: Float[np.ndarray, " modes"]) -> Float[Array, " free"]:
+        return jnp.asarray(self.basis @ q, self.model.u_full.dtype)
+
+    def fun(self, q: Float[np.ndarray, " modes"]) -> float:
+        if self.cubature is None:
+            return self.full_fun(q)
+        value: float = 0.0
+        for term, nodes, weights in self._cubature_terms:
+            u: Float[np.ndarray, "S a 3"] = nodes.offset + nodes.basis @ q
+            value += float(weights @ term.energy.fun(u, term.elements))
+        return value
+
+    def full_fun(self, q: Float[np.ndarray, " modes"]) -> float:
+        """Energy of the full model, regardless of `cubature`."""
+        return float(self.model.fun(self.to_free(q)))
+
+    def grad(self, q: Float[np.ndarray, " modes"]) -> Float[np.ndarray, " modes"]:
+        if self.cubature is None:
+            return self.basis.T @ np.asarray(self.model.grad(self.to_free(q)))
+        grad: Float[np.ndarray, " modes"] = np.zeros((self.n_modes,))
+        for term, nodes, weights in self._cubature_terms:
+            u: Float[np.ndarray, "S a 3"] = nodes.offset + nodes.basis @ q
+            grad += np.einsum(
+                "s,sai,saim->m",
+                weights,
+                term.energy.grad(u, term.elements),
+                nodes.basis,
+            )
+        return grad
+
+    def hess(self, q: Float[np.ndarray, " modes"]) -> Float[np.ndarray, "modes modes"]:
+        """Reduced Hessian.
+
+        Exact, from one Hessian-vector product per mode, without `cubature`;
+        central differences of `grad()` with it.
+        """
+        hess: Float[np.ndarray, "modes modes"]
+        if self.cubature is None:
+            u: Float[Array, " free"] = self.to_free(q)
+            columns: list[Float[np.ndarray, " free"]] = [
+                np.asarray(
+                    self.model.hess_prod(
+                        u, jnp.asarray(column, self.model.u_full.dtype)
+                    )
+                )
+                for column in self.basis.T
+            ]
+            hess = self.basis.T @ np.stack(columns, axis=-1)
+        else:
+            h: float = float(np.sqrt(np.finfo(float).eps)) * max(
+                1.0, float(np.linalg.norm(q))
+            )
+            hess = np.stack(
+                [
+                    (self.grad(q + h * e) - self.grad(q - h * e)) / (2.0 * h)
+                    for e in np.eye(self.n_modes)
+                ],
+                axis=-1,
+            )
+        return 0.5 * (hess + hess.T)
+
+    def solve(
+        self,
+        *,
+        max_steps: int = 20,
+        rtol: float = 1e-6,
+        callback: Callable[[Float[np.ndarray, " modes"]], None] | None = None,
+    ) -> Float[np.ndarray, " modes"]:
+        """Minimize the energy over the subspace with a damped quasi-Newton method.
+
+        `callback` is called with the initial guess and after every step.
+        """
+        start: float = time.perf_counter()
+        q: Float[np.ndarray, " modes"] = self.q
+        if callback is not None:
+            callback(q)
+        grad: Float[np.ndarray, " modes"] = self.grad(q)
+        grad_norm_init: float = float(np.linalg.norm(grad))
+        if self.hessian is None:
+            self.hessian = self.hess(q)
+        n_steps: int = 0
+        n_fun: int = 0
+        for _ in range(max_steps):
+            if np.linalg.norm(grad) <= rtol * grad_norm_init:
+                break
+            try:
+                direction: Float[np.ndarray, " modes"] = -scipy.linalg.solve(
+                    self.hessian, grad, assume_a="pos"
+                )
+            except np.linalg.LinAlgError:
+                self.hessian = self.hess(q)
+                direction = -grad
+            value: float = self.fun(q)
+            slope: float = float(grad @ direction)
+            alpha: float = 1.0
+            n_fun += 2
+            while alpha > 1e-4 and self.fun(q + alpha * direction) > (
+                value + 1e-4 * alpha * slope
+            ):
+                alpha *= 0.5
+                n_fun += 1
+            step: Float[np.ndarray, " modes"] = alpha * direction
+            q = q + step
+            grad_next: Float[np.ndarray, " modes"] = self.grad(q)
+            self._update_hessian(step, grad_next - grad)
+            grad = grad_next
+            n_steps += 1
+            if callback is not None:
+                callback(q)
+            logger.debug(
+                "reduced step %d: alpha = %g, |grad| = %g",
+                n_steps,
+                alpha,
+                np.linalg.norm(grad),
+            )
+        self.q = q
+        self.model.update(self.to_free(q))
+        logger.info(
+            "reduced solve: %d modes, %s, %d steps, %d energy evaluations, %g s",
+            self.n_modes,
+            "full mesh"
+            if self.cubature is None
+            else f"{sum(term.elements.size for term in self.cubature)} elements",
+            n_steps,
+            n_fun,
+            time.perf_counter() - start,
+        )
+        return q
+
+    def _update_hessian(
+        self, step: Float[np.ndarray, " modes"], change: Float[np.ndarray, " modes"]
+    ) -> None:
+        """BFGS update, skipped unless the curvature condition holds."""
+        assert self.hessian is not None
+        curvature: float = float(change @ step)
+        hs: Float[np.ndarray, " modes"] = self.hessian @ step
+        shs: float = float(step @ hs)
+        if curvature <= 1e-12 * shs or shs <= 0.0:
+            return
+        self.hessian = (
+            self.hessian + np.outer(change, change) / curvature - np.outer(hs, hs) / shs
+        )
+
+    @functools.cached_property
+    def _cubature_terms(
+        self,
+    ) -> list[tuple[Cubature, "_Nodes", Float[np.ndarray, " S"]]]:
+        """Offsets and basis gathered at the points of the sampled elements."""
+        assert self.cubature is not None
+        terms: list[tuple[Cubature, _Nodes, Float[np.ndarray, " S"]]] = []
+        for term in self.cubature:
+            cells: Integer[np.ndarray, "S a"] = term.energy.cells[term.elements]
+            nodes = _Nodes(offset=self.offset[cells], basis=self.full_basis[cells])
+            terms.append((term, nodes, np.asarray(term.weights, dtype=float)))
+        return terms
+
+
+class _Nodes(NamedTuple):
+    offset: Float[np.ndarray, "S a 3"]
+    basis: Float[np.ndarray, "S a 3 modes"]
@@ -0,0 +1,42 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+import pyvista as pv
+from jaxtyping import Bool, Float
+
+from liblaf import melon
+
+
+def box_tetmesh(n: int = 4) -> pv.UnstructuredGrid:
+    """Unit-spaced tet box with a boolean `IsSkin` mask on its top face."""
+    grid = pv.ImageData(dimensions=(n, n, n))
+    tetmesh: pv.UnstructuredGrid = grid.to_tetrahedra()  # pyright: ignore[reportAssignmentType]
+    tetmesh.clear_data()
+    top: Bool[np.ndarray, " P"] = np.isclose(tetmesh.points[:, 2], n - 1)
+    tetmesh.point_data["IsSkin"] = top
+    tetmesh.point_data["IsBone"] = np.isclose(tetmesh.points[:, 2], 0.0)
+    return tetmesh
+
+
+@pytest.fixture
+def prediction(tmp_path: Path) -> Path:
+    """A `20-prediction.vtu` whose top face is lifted by 0.5."""
+    tetmesh: pv.UnstructuredGrid = box_tetmesh()
+    displacement: Float[np.ndarray, "P 3"] = np.zeros((tetmesh.n_points, 3))
+    displacement[tetmesh.point_data["IsSkin"], 2] = 0.5
+    tetmesh.point_data["Displacement"] = displacement
+    path: Path = tmp_path / "20-prediction.vtu"
+    melon.save(path, tetmesh)
+    return path
+
+
+@pytest.fixture
+def truth(tmp_path: Path) -> Path:
+    """The lifted top face of `prediction`, as a triangle surface."""
+    surface: pv.PolyData = pv.Plane(
+        center=(1.5, 1.5, 3.5), i_size=3.0, j_size=3.0, i_resolution=3, j_resolution=3
+    ).triangulate()  # pyright: ignore[reportAssignmentType]
+    path: Path = tmp_path / "00-post-skin.vtp"
+    melon.save(path, surface)
+    return path
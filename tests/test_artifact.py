@@ -0,0 +1,83 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+import pyvista as pv
+
+from liblaf.plastic_surgery import io
+
+
+def test_save_artifact_rejects_unknown_kind(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="unknown artifact kind: ImageData"):
+        io.save_artifact(
+            tmp_path / "image.artifact", pv.ImageData(dimensions=(2, 2, 2))
+        )
+
+
+def mesh_with_data(
+    mesh: pv.PolyData | pv.UnstructuredGrid,
+) -> pv.PolyData | pv.UnstructuredGrid:
+    mesh.point_data["Distance"] = np.linspace(0.0, 1.0, mesh.n_points)
+    mesh.point_data["Normals"] = np.tile([0.0, 0.0, 1.0], (mesh.n_points, 1))
+    mesh.cell_data["IsSkin"] = np.arange(mesh.n_cells) % 2 == 0
+    mesh.field_data["Name"] = ["head", "neck"]
+    mesh.point_data.active_scalars_name = "Distance"
+    mesh.point_data.active_normals_name = "Normals"
+    return mesh
+
+
+@pytest.fixture(
+    params=[
+        pytest.param(lambda: pv.Sphere().clean(), id="PolyData"),
+        pytest.param(
+            lambda: pv.ImageData(dimensions=(3, 3, 3)).to_tetrahedra(),
+            id="UnstructuredGrid",
+        ),
+    ]
+)
+def mesh(request: pytest.FixtureRequest) -> pv.PolyData | pv.UnstructuredGrid:
+    return mesh_with_data(request.param())
+
+
+def test_round_trip(tmp_path: Path, mesh: pv.PolyData | pv.UnstructuredGrid) -> None:
+    io.save_artifact(tmp_path / "mesh.artifact", mesh)
+    loaded: pv.PolyData | pv.UnstructuredGrid = io.load_artifact(
+        tmp_path / "mesh.artifact"
+    )
+    assert type(loaded) is type(mesh)
+    np.testing.assert_array_equal(loaded.points, mesh.points)
+    if isinstance(mesh, pv.PolyData):
+        np.testing.assert_array_equal(loaded.faces, mesh.faces)  # pyright: ignore[reportAttributeAccessIssue]
+    else:
+        np.testing.assert_array_equal(loaded.cells, mesh.cells)  # pyright: ignore[reportAttributeAccessIssue]
+        np.testing.assert_array_equal(loaded.celltypes, mesh.celltypes)  # pyright: ignore[reportAttributeAccessIssue]
+    np.testing.assert_array_equal(
+        loaded.point_data["Distance"], mesh.point_data["Distance"]
+    )
+    assert loaded.cell_data["IsSkin"].dtype == np.bool_
+    np.testing.assert_array_equal(loaded.cell_data["IsSkin"], mesh.cell_data["IsSkin"])
+    assert loaded.field_data["Name"].tolist() == ["head", "neck"]
+    assert loaded.point_data.active_scalars_name == "Distance"
+    assert loaded.point_data.active_normals_name == "Normals"
+
+
+def test_link_does_not_write_through(
+    tmp_path: Path, mesh: pv.PolyData | pv.UnstructuredGrid
+) -> None:
+    source: io.Artifact = io.save_artifact(tmp_path / "source.artifact", mesh)
+    header: str = (source.path / "header.json").read_text()
+    link: io.Artifact = source.link(tmp_path / "link.artifact")
+    # replace a shared (hard-linked) array and append a new one
+    link.add("point_data", "Distance", np.zeros((mesh.n_points,)))
+    link.add("cell_data", "IsBone", np.ones((mesh.n_cells,), bool))
+    np.testing.assert_array_equal(link.point_data["Distance"], 0.0)
+    assert "IsBone" in link.cell_data
+
+    source = io.Artifact(source.path)
+    assert (source.path / "header.json").read_text() == header
+    assert "IsBone" not in source.cell_data
+    assert not (source.path / "cell_data" / "IsBone.npy").exists()
+    np.testing.assert_array_equal(
+        source.point_data["Distance"], mesh.point_data["Distance"]
+    )
+    np.testing.assert_array_equal(source.points, mesh.points)
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+import pyvista as pv
+import scipy.spatial.transform
+from jaxtyping import Float, Integer
+from liblaf.apple.constants import MU, PRESTRAIN, STIFFNESS
+
+from liblaf.plastic_surgery import sim
+
+
+def box_tetmesh() -> pv.UnstructuredGrid:
+    return pv.ImageData(dimensions=(3, 3, 3)).to_tetrahedra()  # pyright: ignore[reportReturnType]
+
+
+@pytest.fixture
+def tet_arap() -> sim.TetArap:
+    tetmesh: pv.UnstructuredGrid = box_tetmesh()
+    tetmesh.cell_data[MU] = np.linspace(1.0, 2.0, tetmesh.n_cells)
+    return sim.TetArap.from_pyvista(tetmesh)
+
+
+@pytest.fixture
+def edge_springs() -> sim.EdgeSprings:
+    edges: pv.PolyData = box_tetmesh().extract_all_edges()  # pyright: ignore[reportAssignmentType]
+    edges.cell_data[STIFFNESS] = np.full((edges.n_cells,), 2.0)
+    edges.cell_data[PRESTRAIN] = np.full((edges.n_cells,), -0.1)
+    return sim.EdgeSprings.from_pyvista(edges)
+
+
+@pytest.mark.parametrize("name", ["tet_arap", "edge_springs"])
+def test_grad(name: str, request: pytest.FixtureRequest) -> None:
+    energy: sim.ElementEnergy = request.getfixturevalue(name)
+    elements: Integer[np.ndarray, " S"] = np.arange(energy.cells.shape[0])
+    rng: np.random.Generator = np.random.default_rng(0)
+    u: Float[np.ndarray, "S a 3"] = 0.1 * rng.normal(size=(*energy.cells.shape, 3))
+    p: Float[np.ndarray, "S a 3"] = rng.normal(size=u.shape)
+    h: float = 1e-6
+    expected: Float[np.ndarray, " S"] = (
+        energy.fun(u + h * p, elements) - energy.fun(u - h * p, elements)
+    ) / (2.0 * h)
+    actual: Float[np.ndarray, " S"] = np.sum(
+        energy.grad(u, elements) * p, axis=(-2, -1)
+    )
+    np.testing.assert_allclose(actual, expected, rtol=1e-5, atol=1e-8)
+
+
+def test_arap_rigid(tet_arap: sim.TetArap) -> None:
+    elements: Integer[np.ndarray, " S"] = np.arange(tet_arap.cells.shape[0])
+    points: Float[np.ndarray, "S 4 3"] = box_tetmesh().points[tet_arap.cells]
+    rotation = scipy.spatial.transform.Rotation.from_rotvec([0.3, -0.2, 0.5])
+    u: Float[np.ndarray, "S 4 3"] = (
+        rotation.apply(points.reshape(-1, 3)).reshape(points.shape) - points
+    )
+    np.testing.assert_allclose(tet_arap.fun(u, elements), 0.0, atol=1e-12)
+    np.testing.assert_allclose(tet_arap.grad(u, elements), 0.0, atol=1e-12)
+
+
+def test_springs_prestrain(edge_springs: sim.EdgeSprings) -> None:
+    elements: Integer[np.ndarray, " S"] = np.arange(edge_springs.cells.shape[0])
+    u: Float[np.ndarray, "S 2 3"] = np.zeros((*edge_springs.cells.shape, 3))
+    # the rest lengths are 10% shorter than the edges
+    np.testing.assert_allclose(
+        edge_springs.fun(u, elements),
+        0.5 * 2.0 * (edge_springs.length / 0.9 - edge_springs.length) ** 2,
+    )
+
+
+def test_cubature_weights() -> None:
+    rng: np.random.Generator = np.random.default_rng(0)
+    # 1000 elements, but the forces only span 20 directions
+    columns: Float[np.ndarray, "rows E"] = np.abs(
+        rng.normal(size=(60, 20)) @ rng.normal(size=(20, 1000))
+    ).astype(np.float32)
+    elements: Integer[np.ndarray, " S"]
+    weights: Float[np.ndarray, " S"]
+    elements, weights = sim.cubature_weights(columns, rtol=1e-3)
+    target: Float[np.ndarray, " rows"] = np.sum(columns, axis=1, dtype=float)
+    assert elements.size < 100
+    assert np.all(weights > 0.0)
+    assert np.linalg.norm(columns[:, elements] @ weights - target) <= 1e-3 * (
+        np.linalg.norm(target)
+    )
@@ -0,0 +1,21 @@
+from pathlib import Path
+
+import numpy as np
+import pyvista as pv
+
+from liblaf import melon
+from liblaf.plastic_surgery import io
+
+
+def test_lazy_mesh_matches_full_read(prediction: Path) -> None:
+    expected: pv.UnstructuredGrid = melon.load_unstructured_grid(prediction)
+    mesh = io.LazyMesh(prediction)
+    for name in ("IsSkin", "Displacement"):
+        actual: np.ndarray = mesh.point_data[name]
+        assert actual.dtype == expected.point_data[name].dtype
+        np.testing.assert_array_equal(actual, expected.point_data[name])
+    result: pv.DataSet = mesh.to_pyvista(point_data=["IsBone", "IsSkin"])
+    assert result.point_data["IsBone"].dtype == np.bool_
+    np.testing.assert_array_equal(
+        result.point_data["IsBone"], expected.point_data["IsBone"]
+    )
@@ -0,0 +1,81 @@
+import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from liblaf.plastic_surgery import (
+    MetaAcquisition,
+    MetaDataset,
+    MetaPatient,
+    MetaTable,
+)
+
+UTC8 = datetime.timezone(datetime.timedelta(hours=8))
+
+
+@pytest.fixture
+def dataset() -> MetaDataset:
+    return MetaDataset(
+        patients={
+            "0002": MetaPatient(
+                id="0002",
+                name="Bob",
+                acquisitions=[
+                    MetaAcquisition(
+                        datetime=datetime.datetime(2021, 6, 1, tzinfo=UTC8)
+                    ),
+                    MetaAcquisition(
+                        datetime=datetime.datetime(2020, 1, 1, tzinfo=UTC8)
+                    ),
+                ],
+            ),
+            "0001": MetaPatient(
+                id="0001",
+                name="Alice",
+                acquisitions=[
+                    # naive datetimes must survive the round trip as well
+                    MetaAcquisition(datetime=datetime.datetime(2020, 3, 1))  # noqa: DTZ001
+                ],
+            ),
+            "0003": MetaPatient(id="0003", name="Carol"),
+        }
+    )
+
+
+def test_round_trip(dataset: MetaDataset, tmp_path: Path) -> None:
+    MetaTable.from_dataset(dataset).save(tmp_path / "dataset.npz")
+    table: MetaTable = MetaTable.load(tmp_path / "dataset.npz")
+    assert table.to_dataset() == dataset
+
+
+def test_queries(dataset: MetaDataset) -> None:
+    table: MetaTable = MetaTable.from_dataset(dataset)
+    assert len(table) == 3
+    assert table.patient_id[table.patient("0001")] == "0001"
+    np.testing.assert_array_equal(table.acquisitions("0002"), [1, 0])
+    assert table.first("0002") == 1
+    assert table.last("0002") == 0
+    assert table.first("0001") == table.last("0001") == 2
+    np.testing.assert_array_equal(
+        table.path, ["0002/2021-06-01", "0002/2020-01-01", "0001/2020-03-01"]
+    )
+    np.testing.assert_array_equal(table.between(), [1, 2, 0])
+    np.testing.assert_array_equal(
+        table.between(datetime.date(2020, 2, 1), datetime.date(2021, 1, 1)), [2]
+    )
+
+
+@pytest.mark.parametrize("query", ["patient", "acquisitions", "first", "last"])
+def test_unknown_patient(dataset: MetaDataset, query: str) -> None:
+    table: MetaTable = MetaTable.from_dataset(dataset)
+    with pytest.raises(KeyError, match="unknown patient '0004'"):
+        getattr(table, query)("0004")
+
+
+@pytest.mark.parametrize("query", ["first", "last"])
+def test_no_acquisitions(dataset: MetaDataset, query: str) -> None:
+    table: MetaTable = MetaTable.from_dataset(dataset)
+    assert table.acquisitions("0003").size == 0
+    with pytest.raises(KeyError, match="patient '0003' has no acquisitions"):
+        getattr(table, query)("0003")
@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import pyvista as pv
+
+from liblaf import melon
+from liblaf.plastic_surgery import metrics
+
+
+def expected_skin(prediction: Path) -> pv.PolyData:
+    tetmesh: pv.UnstructuredGrid = melon.load_unstructured_grid(prediction)
+    surface: pv.PolyData = tetmesh.extract_surface()  # pyright: ignore[reportAssignmentType]
+    surface.warp_by_vector("Displacement", inplace=True)
+    return melon.tri.extract_points(surface, surface.point_data["IsSkin"])
+
+
+def test_load_prediction(prediction: Path) -> None:
+    expected: pv.PolyData = expected_skin(prediction)
+    skin: pv.PolyData = metrics.load_prediction(prediction)
+    assert skin.n_points == expected.n_points
+    np.testing.assert_allclose(skin.points, expected.points)
+
+
+def test_evaluate_case(prediction: Path, tmp_path: Path) -> None:
+    truth: Path = tmp_path / "truth.vtp"
+    melon.save(truth, expected_skin(prediction))
+    summary: dict[str, float] = metrics.evaluate_case(prediction, truth)
+    np.testing.assert_allclose(summary["hausdorff"], 0.0, atol=1e-5)
+
+
+def test_evaluate_cohort_keeps_failed_cases(
+    prediction: Path, truth: Path, tmp_path: Path
+) -> None:
+    table: pl.DataFrame = metrics.evaluate_cohort(
+        {"good": (prediction, truth), "bad": (prediction, tmp_path / "missing.vtp")},
+        max_workers=2,
+    )
+    assert table["case"].to_list() == ["good", "bad"]
+    good, bad = table.iter_rows(named=True)
+    assert good["error"] is None
+    assert good["hausdorff"] is not None
+    assert bad["error"] is not None
+    assert bad["hausdorff"] is None
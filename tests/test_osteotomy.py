@@ -0,0 +1,84 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+import pyvista as pv
+import trimesh as tm
+from jaxtyping import Bool
+
+from liblaf.plastic_surgery import OsteotomyDetector
+
+
+@pytest.fixture
+def pre() -> pv.PolyData:
+    mandible: pv.PolyData = pv.Sphere(radius=10.0)
+    # stored as integers, as it comes back from some readers
+    mandible.cell_data["Floating"] = (
+        mandible.cell_centers().points[:, 2] < -8.0
+    ).astype(np.int8)
+    return mandible
+
+
+@pytest.fixture
+def post(pre: pv.PolyData) -> pv.PolyData:
+    post: pv.PolyData = pre.copy()
+    moved: Bool[np.ndarray, " P"] = post.points[:, 0] > 5.0
+    post.points[moved] += [2.0, 0.0, 0.0]
+    post.translate([1.0, -2.0, 0.5], inplace=True)
+    return post
+
+
+@pytest.fixture
+def cache(tmp_path: Path, pre: pv.PolyData, post: pv.PolyData) -> Path:
+    path: Path = tmp_path / "osteotomy.npz"
+    OsteotomyDetector(pre, post, n_samples=500).save(path)
+    return path
+
+
+def test_mask(pre: pv.PolyData, post: pv.PolyData) -> None:
+    mask: Bool[np.ndarray, " C"] = OsteotomyDetector(pre, post, n_samples=500).mask(0.5)
+    assert mask.dtype == np.bool_
+    assert mask.any()
+    assert not np.any(mask & pre.cell_data["Floating"].astype(bool))
+
+
+def test_load_missing(tmp_path: Path, pre: pv.PolyData, post: pv.PolyData) -> None:
+    detector = OsteotomyDetector(pre, post, n_samples=500)
+    assert not detector.load(tmp_path / "missing.npz")
+
+
+@pytest.mark.parametrize(
+    "change", ["pre_mandible", "post_mandible", "n_samples", "seed"]
+)
+def test_load_mismatch(
+    cache: Path, pre: pv.PolyData, post: pv.PolyData, change: str
+) -> None:
+    detector: OsteotomyDetector
+    match change:
+        case "pre_mandible":
+            detector = OsteotomyDetector(pre.scale(1.1), post, n_samples=500)
+        case "post_mandible":
+            detector = OsteotomyDetector(pre, post.scale(1.1), n_samples=500)
+        case "n_samples":
+            detector = OsteotomyDetector(pre, post, n_samples=400)
+        case _:
+            detector = OsteotomyDetector(pre, post, n_samples=500, seed=1)
+    assert not detector.load(cache)
+
+
+def test_load_hit(
+    cache: Path, pre: pv.PolyData, post: pv.PolyData, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    expected: Bool[np.ndarray, " C"] = OsteotomyDetector(pre, post, n_samples=500).mask(
+        0.5
+    )
+
+    def icp(*_args: object, **_kwargs: object) -> None:
+        pytest.fail("ICP ran although the cache matched")
+
+    monkeypatch.setattr(tm.registration, "icp", icp)
+    detector = OsteotomyDetector(pre, post, n_samples=500)
+    assert detector.load(cache)
+    with np.load(cache) as data:
+        np.testing.assert_array_equal(detector.distance, data["distance"])
+    np.testing.assert_array_equal(detector.mask(0.5), expected)
@@ -0,0 +1,114 @@
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from liblaf.plastic_surgery import profiling
+from liblaf.plastic_surgery.profiling._profiler import ENV, RECORDS_ENV
+
+
+def work(duration: float) -> int:
+    with profiling.step("work"):
+        time.sleep(duration)
+    return os.getpid()
+
+
+def test_recorder_nesting(tmp_path: Path) -> None:
+    recorder = profiling.Recorder(tmp_path)
+    try:
+        with recorder.step("outer"):
+            with recorder.step("inner"):
+                pass
+            with recorder.step("inner"):
+                pass
+    finally:
+        recorder.close()
+    records: list[profiling.StepRecord] = profiling.load_records(tmp_path)
+    assert [record.name for record in records] == [
+        "outer/inner",
+        "outer/inner",
+        "outer",
+    ]
+    assert all(record.pid == os.getpid() for record in records)
+    assert records[2].duration >= records[0].duration + records[1].duration
+    assert all(record.rss_peak >= record.rss_start > 0 for record in records)
+
+
+def test_report_from_records() -> None:
+    def record(name: str, pid: int, duration: float, rss: int) -> profiling.StepRecord:
+        return profiling.StepRecord(
+            name=name, pid=pid, start=0.0, duration=duration, rss_start=0, rss_peak=rss
+        )
+
+    report: profiling.Report = profiling.Report.from_records(
+        [
+            record("load", 1, 1.0, 10),
+            record("load", 2, 3.0, 30),
+            record("save", 1, 0.5, 20),
+        ],
+        wall_time=4.0,
+    )
+    assert report.processes == 2
+    assert [step.name for step in report.steps] == ["load", "save"]
+    load: profiling.StepSummary = report.steps[0]
+    assert (load.count, load.total, load.mean, load.max) == (2, 4.0, 2.0, 3.0)
+    assert (load.rss_peak, load.processes) == (30, 2)
+    assert "wall time: 4.000 s, processes: 2" in report.table()
+
+
+def test_run_aggregates_workers(tmp_path: Path) -> None:
+    path: Path = tmp_path / "profile.json"
+    with profiling.run(path):
+        with profiling.step("main"):
+            pass
+        # spawned workers inherit the records directory through the environment
+        with ProcessPoolExecutor(
+            max_workers=2, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            pids: list[int] = list(executor.map(work, [0.05] * 4))
+    assert RECORDS_ENV not in os.environ
+    report: profiling.Report = profiling.Report.load(path)
+    steps: dict[str, profiling.StepSummary] = {step.name: step for step in report.steps}
+    assert steps["main"].count == 1
+    assert steps["work"].count == 4
+    assert steps["work"].processes == len(set(pids))
+    assert report.processes == len({os.getpid(), *pids})
+
+
+def test_disabled(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(ENV, raising=False)
+    monkeypatch.delenv(RECORDS_ENV, raising=False)
+    monkeypatch.chdir(tmp_path)
+    assert profiling.recorder() is None
+
+    @profiling.profiled
+    def main() -> int:
+        with profiling.step("noop"):
+            assert profiling.recorder() is None
+        return 42
+
+    assert main() == 42
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_profiled(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(ENV, str(tmp_path))
+    monkeypatch.delenv(RECORDS_ENV, raising=False)
+    monkeypatch.setattr(sys, "argv", ["exp/src/20-simulate.py"])
+
+    @profiling.profiled
+    def main() -> int:
+        with profiling.step("solve"):
+            assert profiling.recorder() is not None
+        return 42
+
+    # the report switch alone does not record steps outside of `profiled`
+    assert profiling.recorder() is None
+    assert main.__name__ == "main"
+    assert main() == 42
+    report: profiling.Report = profiling.Report.load(tmp_path / "20-simulate.json")
+    assert [step.name for step in report.steps] == ["solve"]
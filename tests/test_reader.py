@@ -0,0 +1,27 @@
+from pathlib import Path
+
+import pydicom
+import pytest
+from pydicom.dataset import Dataset, FileMetaDataset
+from pydicom.sequence import Sequence
+from pydicom.uid import ExplicitVRLittleEndian, MediaStorageDirectoryStorage
+
+from liblaf.plastic_surgery import DicomReader
+
+
+def test_pixel_fingerprint_empty_series(tmp_path: Path) -> None:
+    # a DIRFILE with a patient record only, no image records
+    patient = Dataset()
+    patient.DirectoryRecordType = "PATIENT"
+    patient.PatientID = "0001"
+    dirfile = Dataset()
+    dirfile.DirectoryRecordSequence = Sequence([patient])
+    dirfile.file_meta = FileMetaDataset()
+    dirfile.file_meta.MediaStorageSOPClassUID = MediaStorageDirectoryStorage
+    dirfile.file_meta.MediaStorageSOPInstanceUID = pydicom.uid.generate_uid()
+    dirfile.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    dirfile.save_as(tmp_path / "DIRFILE", enforce_file_format=True)
+    reader = DicomReader(tmp_path)
+    assert reader.records == []
+    with pytest.raises(ValueError, match="series has no image records"):
+        _ = reader.pixel_fingerprint
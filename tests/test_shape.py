@@ -0,0 +1,110 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from jaxtyping import Float
+
+from liblaf.plastic_surgery import shape
+
+
+@pytest.fixture
+def points() -> Float[np.ndarray, "shapes vertices 3"]:
+    # a low-rank point cloud: 3 modes plus a little noise
+    rng: np.random.Generator = np.random.default_rng(0)
+    mean: Float[np.ndarray, "vertices 3"] = rng.normal(size=(50, 3))
+    modes: Float[np.ndarray, "3 vertices 3"] = rng.normal(size=(3, 50, 3))
+    scores: Float[np.ndarray, "shapes 3"] = rng.normal(size=(40, 3)) * [10, 5, 2]
+    noise: Float[np.ndarray, "shapes vertices 3"] = 1e-3 * rng.normal(size=(40, 50, 3))
+    return mean + np.tensordot(scores, modes, axes=1) + noise
+
+
+@pytest.fixture
+def stack(
+    tmp_path: Path, points: Float[np.ndarray, "shapes vertices 3"]
+) -> shape.ShapeStack:
+    stack: shape.ShapeStack = shape.ShapeStack.create(
+        tmp_path / "skin.stack", points.shape[1], np.float64
+    )
+    for i, p in enumerate(points):
+        stack.add(f"{i:04d}", p)
+    return stack
+
+
+def test_stack_statistics(
+    stack: shape.ShapeStack, points: Float[np.ndarray, "shapes vertices 3"]
+) -> None:
+    stack = shape.ShapeStack(stack.path)
+    assert stack.ids == [f"{i:04d}" for i in range(len(points))]
+    np.testing.assert_array_equal(stack.points, points)
+    np.testing.assert_allclose(stack.mean, np.mean(points, axis=0))
+    np.testing.assert_allclose(stack.variance, np.var(points, axis=0, ddof=1))
+
+
+def test_stack_rejects_duplicates(
+    stack: shape.ShapeStack, points: Float[np.ndarray, "shapes vertices 3"]
+) -> None:
+    with pytest.raises(ValueError, match="already exists"):
+        stack.add("0000", points[0])
+    with pytest.raises(ValueError, match="expected"):
+        stack.add("extra", points[0, :10])
+
+
+def test_stack_interrupted_add(
+    stack: shape.ShapeStack,
+    points: Float[np.ndarray, "shapes vertices 3"],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def crash(*_args, **_kwargs) -> None:
+        raise KeyboardInterrupt
+
+    # points and statistics are written, the header is not
+    with monkeypatch.context() as m:
+        m.setattr(shape._stack, "_write_header", crash)  # noqa: SLF001
+        with pytest.raises(KeyboardInterrupt):
+            stack.add("extra", points[0] + 1.0)
+    stack = shape.ShapeStack(stack.path)
+    assert len(stack) == len(points)
+    np.testing.assert_allclose(stack.mean, np.mean(points, axis=0))
+    np.testing.assert_allclose(stack.variance, np.var(points, axis=0, ddof=1))
+    stack.add("extra", points[0] + 1.0)
+    expected: Float[np.ndarray, "shapes vertices 3"] = np.concatenate(
+        [points, points[:1] + 1.0]
+    )
+    np.testing.assert_array_equal(stack.points, expected)
+    np.testing.assert_allclose(stack.mean, np.mean(expected, axis=0))
+    np.testing.assert_allclose(stack.variance, np.var(expected, axis=0, ddof=1))
+
+
+def test_stack_fingerprint(
+    stack: shape.ShapeStack, points: Float[np.ndarray, "shapes vertices 3"]
+) -> None:
+    assert shape.ShapeStack(stack.path).fingerprint is None
+    # recreating replaces the old stack
+    stack = shape.ShapeStack.create(
+        stack.path, points.shape[1], np.float64, fingerprint="abc"
+    )
+    stack.add("0000", points[0])
+    stack = shape.ShapeStack(stack.path)
+    assert stack.fingerprint == "abc"
+    assert stack.ids == ["0000"]
+    np.testing.assert_array_equal(stack.points, points[:1])
+    np.testing.assert_allclose(stack.mean, points[0])
+
+
+def test_shape_pca(
+    stack: shape.ShapeStack, points: Float[np.ndarray, "shapes vertices 3"]
+) -> None:
+    modes: shape.ShapeModes = shape.shape_pca(stack, 3, chunk_size=7)
+    centered: Float[np.ndarray, "shapes dim"] = (points - points.mean(axis=0)).reshape(
+        len(points), -1
+    )
+    s: Float[np.ndarray, " k"]
+    vt: Float[np.ndarray, "k dim"]
+    _, s, vt = np.linalg.svd(centered, full_matrices=False)
+    np.testing.assert_allclose(
+        modes.explained_variance, s[:3] ** 2 / (len(points) - 1), rtol=1e-6
+    )
+    # components are unique up to sign
+    components: Float[np.ndarray, "3 dim"] = modes.components.reshape(3, -1)
+    np.testing.assert_allclose(np.abs(np.sum(components * vt[:3], axis=1)), 1.0)
+    np.testing.assert_allclose(modes.reconstruct(modes.scores), points, atol=1e-2)